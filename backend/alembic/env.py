@@ -15,6 +15,21 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# PostgreSQL-only search objects that are not mapped on the models (see migration 002)
+UNMAPPED_OBJECTS = {
+    ("column", "search_vector"),
+    ("index", "ix_job_search_vector"),
+    ("index", "ix_job_location_trgm"),
+    ("index", "ix_job_company_trgm"),
+}
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Keep autogenerate from dropping objects that only exist in the database."""
+    if reflected and compare_to is None:
+        return (type_, name) not in UNMAPPED_OBJECTS
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -24,13 +39,18 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
     with context.begin_transaction():
         context.run_migrations()
 
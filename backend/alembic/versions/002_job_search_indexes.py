@@ -0,0 +1,45 @@
+"""Full-text search column and trigram indexes for jobs.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Weighted tsvector maintained by PostgreSQL: title > company > description
+    op.execute(
+        "ALTER TABLE jobs ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+        ") STORED"
+    )
+    op.execute("CREATE INDEX ix_job_search_vector ON jobs USING gin (search_vector)")
+
+    # Superseded by the generated column
+    op.drop_index("ix_job_description_fts", table_name="jobs")
+
+    # Trigram indexes back the ILIKE '%...%' location/company filters
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX ix_job_location_trgm ON jobs USING gin (location gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_job_company_trgm ON jobs USING gin (company gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_company_trgm", table_name="jobs")
+    op.drop_index("ix_job_location_trgm", table_name="jobs")
+    op.execute(
+        "CREATE INDEX ix_job_description_fts ON jobs "
+        "USING gin (to_tsvector('english', description))"
+    )
+    op.drop_index("ix_job_search_vector", table_name="jobs")
+    op.drop_column("jobs", "search_vector")
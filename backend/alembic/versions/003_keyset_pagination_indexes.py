@@ -0,0 +1,25 @@
+"""Composite indexes for keyset pagination of jobs and matches.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serve ORDER BY ... DESC and (k, id) < (:k, :id) seeks with backward index scans
+    op.create_index("ix_job_created_id", "jobs", ["created_at", "id"])
+    op.create_index("ix_match_score_id", "match_results", ["overall_score", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_match_score_id", table_name="match_results")
+    op.drop_index("ix_job_created_id", table_name="jobs")
@@ -0,0 +1,41 @@
+"""Per-user match ranking indexes.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Extend with id so per-user keyset pages are served entirely from the index
+    op.drop_index("ix_match_user_score", table_name="match_results")
+    op.create_index("ix_match_user_score", "match_results", ["user_id", "overall_score", "id"])
+
+    # Expressions must match the sort keys in app/routers/matches.py
+    op.create_index(
+        "ix_match_user_integrated",
+        "match_results",
+        ["user_id", sa.text("coalesce(integrated_score, overall_score)"), "id"],
+    )
+    op.create_index(
+        "ix_match_user_ats",
+        "match_results",
+        ["user_id", sa.text("coalesce(ats_score, -1)"), "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_match_user_ats", table_name="match_results")
+    op.drop_index("ix_match_user_integrated", table_name="match_results")
+    op.drop_index("ix_match_user_score", table_name="match_results")
+    op.create_index("ix_match_user_score", "match_results", ["user_id", "overall_score"])
@@ -0,0 +1,310 @@
+"""Bulk persistence helpers built on INSERT ... ON CONFLICT.
+
+Works on PostgreSQL (production) and SQLite (tests); both dialects support
+ON CONFLICT with RETURNING. Rows are written in chunks, so persisting thousands
+of postings takes a handful of statements instead of one query per row.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import Table, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job
+from app.models.match import MatchResult
+from app.schemas.matching import JobPosting, ScoredMatch
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement (15 columns each keeps well under bind-parameter limits)
+DEFAULT_CHUNK_SIZE = 1000
+
+# Columns refreshed when an existing (external_id, source) row is upserted
+_JOB_UPDATE_COLUMNS = (
+    "title",
+    "company",
+    "location",
+    "workplace_type",
+    "description",
+    "requirements",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "employment_type",
+    "experience_level",
+    "apply_url",
+    "raw_data",
+)
+
+# JSON has no equality operator in PostgreSQL, so JSON columns never mark a row as changed
+_JOB_CHANGE_COLUMNS = tuple(c for c in _JOB_UPDATE_COLUMNS if c != "raw_data")
+
+_MATCH_UPDATE_COLUMNS = (
+    "overall_score",
+    "score_breakdown",
+    "reasoning",
+    "strengths",
+    "missing_skills",
+    "interview_talking_points",
+    "ats_score",
+    "ats_details",
+    "requirement_matches",
+    "requirements_met_ratio",
+    "integrated_score",
+)
+_MATCH_CHANGE_COLUMNS = (
+    "overall_score",
+    "reasoning",
+    "ats_score",
+    "requirements_met_ratio",
+    "integrated_score",
+)
+
+
+@dataclass
+class UpsertResult:
+    """Outcome counts of a bulk upsert."""
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.skipped
+
+    def to_dict(self) -> dict[str, int]:
+        return {"inserted": self.inserted, "updated": self.updated, "skipped": self.skipped}
+
+
+def dialect_insert(session: AsyncSession):
+    """Return the dialect-specific ``insert`` construct that supports ON CONFLICT."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        msg = f"Bulk upsert is not supported for dialect: {dialect}"
+        raise ValueError(msg)
+    return insert
+
+
+def _job_row(posting: JobPosting) -> dict:
+    return {
+        "external_id": posting.external_id,
+        "source": posting.source,
+        "title": posting.title,
+        "company": posting.company,
+        "location": posting.location,
+        "workplace_type": posting.workplace_type,
+        "description": posting.description,
+        "requirements": posting.requirements,
+        "salary_min": posting.salary_min,
+        "salary_max": posting.salary_max,
+        "salary_currency": posting.salary_currency,
+        "employment_type": posting.employment_type,
+        "experience_level": posting.experience_level,
+        "apply_url": posting.apply_url,
+        "raw_data": posting.raw_data,
+    }
+
+
+async def _upsert_rows(
+    session: AsyncSession,
+    table: Table,
+    rows: list[dict],
+    key_columns: tuple[str, ...],
+    update_columns: tuple[str, ...],
+    change_columns: tuple[str, ...],
+    update_existing: bool,
+    chunk_size: int,
+) -> UpsertResult:
+    """Chunked INSERT ... ON CONFLICT (key_columns) DO NOTHING / DO UPDATE.
+
+    ``rows`` must already be unique on ``key_columns``. In update mode, only rows
+    whose ``change_columns`` differ are rewritten; one extra SELECT per chunk tells
+    inserted rows apart from updated ones.
+    """
+    result = UpsertResult()
+    insert = dialect_insert(session)
+    key_cols = [table.c[k] for k in key_columns]
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        stmt = insert(table).values(chunk)
+
+        if not update_existing:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(key_columns)).returning(
+                *key_cols
+            )
+            inserted = len((await session.execute(stmt)).all())
+            result.inserted += inserted
+            result.skipped += len(chunk) - inserted
+            continue
+
+        keys = [tuple(r[k] for k in key_columns) for r in chunk]
+        existing = await session.execute(select(*key_cols).where(tuple_(*key_cols).in_(keys)))
+        existing_keys = {tuple(row) for row in existing.all()}
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                **{col: stmt.excluded[col] for col in update_columns},
+                "updated_at": func.now(),
+            },
+            # Only touch rows whose content actually changed
+            where=or_(*(table.c[c].is_distinct_from(stmt.excluded[c]) for c in change_columns)),
+        ).returning(*key_cols)
+        written = {tuple(row) for row in (await session.execute(stmt)).all()}
+
+        updated = len(written & existing_keys)
+        result.updated += updated
+        result.inserted += len(written) - updated
+        result.skipped += len(chunk) - len(written)
+
+    return result
+
+
+async def upsert_jobs(
+    session: AsyncSession,
+    postings: list[JobPosting],
+    update_existing: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> UpsertResult:
+    """Insert scraped postings in bulk, keyed on the (external_id, source) unique index.
+
+    Args:
+        session: Open async session; the caller commits.
+        postings: Postings to persist. Repeated keys within the input are collapsed
+            (the last occurrence wins) and counted as skipped.
+        update_existing: Refresh existing rows whose content changed
+            (ON CONFLICT DO UPDATE) instead of leaving them untouched (DO NOTHING).
+        chunk_size: Rows per INSERT statement.
+
+    Returns:
+        UpsertResult with inserted/updated/skipped counts.
+    """
+    if not postings:
+        return UpsertResult()
+
+    rows_by_key: dict[tuple[str, str], dict] = {}
+    for posting in postings:
+        rows_by_key[(posting.external_id, posting.source)] = _job_row(posting)
+
+    result = await _upsert_rows(
+        session,
+        Job.__table__,
+        list(rows_by_key.values()),
+        key_columns=("external_id", "source"),
+        update_columns=_JOB_UPDATE_COLUMNS,
+        change_columns=_JOB_CHANGE_COLUMNS,
+        update_existing=update_existing,
+        chunk_size=chunk_size,
+    )
+    result.skipped += len(postings) - len(rows_by_key)
+
+    logger.info(
+        f"Upserted {len(postings)} jobs: {result.inserted} inserted, "
+        f"{result.updated} updated, {result.skipped} skipped"
+    )
+    return result
+
+
+async def resolve_job_ids(
+    session: AsyncSession,
+    keys: list[tuple[str, str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[tuple[str, str], int]:
+    """Map (external_id, source) pairs to jobs.id with one IN query per chunk."""
+    unique_keys = list(dict.fromkeys(keys))
+    ids: dict[tuple[str, str], int] = {}
+    for start in range(0, len(unique_keys), chunk_size):
+        chunk = unique_keys[start : start + chunk_size]
+        rows = await session.execute(
+            select(Job.external_id, Job.source, Job.id).where(
+                tuple_(Job.external_id, Job.source).in_(chunk)
+            )
+        )
+        for external_id, source, job_id in rows.all():
+            ids[(external_id, source)] = job_id
+    return ids
+
+
+def _match_row(user_id: int, job_id: int, match: ScoredMatch) -> dict:
+    score = match.score
+    return {
+        "user_id": user_id,
+        "job_id": job_id,
+        "overall_score": score.overall_score,
+        "score_breakdown": score.breakdown.model_dump(),
+        "reasoning": score.reasoning,
+        "strengths": score.strengths,
+        "missing_skills": score.missing_skills,
+        "interview_talking_points": score.interview_talking_points,
+        "ats_score": match.ats_score.score if match.ats_score else None,
+        "ats_details": match.ats_score.model_dump() if match.ats_score else None,
+        "requirement_matches": (
+            [rm.model_dump() for rm in score.requirement_matches]
+            if score.requirement_matches
+            else None
+        ),
+        "requirements_met_ratio": score.requirements_met_ratio,
+        "integrated_score": match.integrated_score,
+    }
+
+
+async def upsert_match_results(
+    session: AsyncSession,
+    user_id: int,
+    matches: list[ScoredMatch],
+    update_existing: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> UpsertResult:
+    """Persist scored matches in bulk, keyed on the uq_match_user_job constraint.
+
+    Job ids come from ``match.job.db_id`` when the posting was loaded from the
+    database; any others are resolved with a single batched lookup. Matches whose
+    job is not stored are counted as skipped.
+
+    Args:
+        session: Open async session; the caller commits.
+        user_id: Owner of the matches.
+        matches: Scored matches from the pipeline.
+        update_existing: Overwrite an existing (user, job) result whose scores
+            changed instead of keeping the first one.
+        chunk_size: Rows per INSERT statement.
+
+    Returns:
+        UpsertResult with inserted/updated/skipped counts.
+    """
+    if not matches:
+        return UpsertResult()
+
+    missing = [(m.job.external_id, m.job.source) for m in matches if m.job.db_id is None]
+    resolved = await resolve_job_ids(session, missing, chunk_size) if missing else {}
+
+    rows_by_job: dict[int, dict] = {}
+    for m in matches:
+        job_id = m.job.db_id or resolved.get((m.job.external_id, m.job.source))
+        if job_id is not None:
+            rows_by_job[job_id] = _match_row(user_id, job_id, m)
+
+    result = await _upsert_rows(
+        session,
+        MatchResult.__table__,
+        list(rows_by_job.values()),
+        key_columns=("user_id", "job_id"),
+        update_columns=_MATCH_UPDATE_COLUMNS,
+        change_columns=_MATCH_CHANGE_COLUMNS,
+        update_existing=update_existing,
+        chunk_size=chunk_size,
+    )
+    result.skipped += len(matches) - len(rows_by_job)
+
+    logger.info(
+        f"Upserted {len(matches)} matches for user {user_id}: {result.inserted} inserted, "
+        f"{result.updated} updated, {result.skipped} skipped"
+    )
+    return result
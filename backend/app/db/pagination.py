@@ -0,0 +1,137 @@
+"""Keyset (cursor) pagination and row-count helpers for list endpoints.
+
+A cursor encodes the sort-key values of the last row on a page. The next page
+is fetched with a row-value comparison, ``(k1, id) < (:k1, :id)``, which a
+composite index on the same columns serves directly, so every page costs the
+same however deep the client scrolls.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Literal
+
+from sqlalchemy import ColumnElement, DateTime, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+CountMode = Literal["exact", "estimated"]
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Encode sort-key values as an opaque URL-safe cursor."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[ColumnElement]) -> list:
+    """Decode a cursor produced by encode_cursor() for the given sort columns.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match ``columns``.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from e
+    if not isinstance(values, list) or len(values) != len(columns):
+        msg = "Invalid cursor"
+        raise ValueError(msg)
+
+    decoded = []
+    for column, value in zip(columns, values, strict=True):
+        if isinstance(column.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as e:
+                msg = "Invalid cursor"
+                raise ValueError(msg) from e
+        decoded.append(value)
+    return decoded
+
+
+def _comparable(expr: ColumnElement, column: ColumnElement, dialect: str) -> ColumnElement:
+    # SQLite stores server-default timestamps without fractional seconds but binds
+    # Python datetimes with them, so compare on julianday() to keep ties consistent.
+    if dialect == "sqlite" and isinstance(column.type, DateTime):
+        return func.julianday(expr)
+    return expr
+
+
+def keyset_paginate(
+    query: Select,
+    columns: Sequence[ColumnElement],
+    cursor: str | None,
+    limit: int,
+    dialect: str,
+) -> Select:
+    """Order ``query`` descending on ``columns`` and seek past ``cursor``.
+
+    The last column must be unique (the primary key) so the order is total.
+    One extra row is fetched so callers can tell whether another page exists
+    (see next_page()).
+
+    Raises:
+        ValueError: If ``cursor`` cannot be decoded.
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        lhs = tuple_(*(_comparable(c, c, dialect) for c in columns))
+        rhs = tuple_(*(_comparable(v, c, dialect) for v, c in zip(values, columns, strict=True)))
+        query = query.where(lhs < rhs)
+    return query.order_by(*(c.desc() for c in columns)).limit(limit + 1)
+
+
+def next_page[T](
+    rows: Sequence[T], limit: int, key: Callable[[T], Sequence]
+) -> tuple[list[T], str | None]:
+    """Trim the look-ahead row and build the cursor for the following page.
+
+    Args:
+        rows: Rows returned by a keyset_paginate() query.
+        limit: Requested page size.
+        key: Returns the sort-key values of a row, in column order.
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    return page, encode_cursor(key(page[-1]))
+
+
+async def _estimate_count(db: AsyncSession, query: Select) -> int | None:
+    """Planner row estimate for ``query`` (PostgreSQL only)."""
+    conn = await db.connection()
+    if conn.dialect.name != "postgresql":
+        return None
+    compiled = query.compile(dialect=conn.dialect)
+    params = compiled.params
+    if compiled.positiontup is not None:
+        params = tuple(params[name] for name in compiled.positiontup)
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    db: AsyncSession, query: Select, mode: CountMode = "exact"
+) -> tuple[int, bool]:
+    """Count the rows ``query`` would return.
+
+    In "estimated" mode the PostgreSQL planner's estimate is used, which costs
+    no table scan; other dialects fall back to an exact count.
+
+    Returns:
+        (count, is_estimate)
+    """
+    if mode == "estimated":
+        estimate = await _estimate_count(db, query)
+        if estimate is not None:
+            return estimate, True
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar() or 0, False
@@ -0,0 +1,49 @@
+"""Full-text search over stored job postings.
+
+On PostgreSQL, searches use the ``jobs.search_vector`` generated tsvector column
+(migration 002) and its GIN index, ranked with ts_rank_cd. Substring filters on
+location/company are served by pg_trgm GIN indexes. Other dialects (SQLite in
+tests) fall back to plain ILIKE matching.
+"""
+
+from sqlalchemy import ColumnElement, Select, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.models.job import Job
+
+# Text search configuration used by the generated column and queries alike
+SEARCH_CONFIG = "english"
+
+# Generated column maintained by PostgreSQL; intentionally not mapped on Job so
+# the model stays portable (SQLite has no tsvector type).
+search_vector = literal_column("jobs.search_vector", type_=TSVECTOR)
+
+
+def job_search_query(q: str) -> ColumnElement:
+    """websearch_to_tsquery for user input (supports quotes, OR and -negation)."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def apply_job_search(query: Select, q: str, dialect: str) -> Select:
+    """Restrict ``query`` to jobs matching ``q``.
+
+    Args:
+        query: A select over Job.
+        q: Raw user search string.
+        dialect: Name of the session's SQL dialect.
+
+    Returns:
+        The filtered select (unordered; see order_by_relevance()).
+    """
+    if dialect == "postgresql":
+        return query.where(search_vector.op("@@")(job_search_query(q)))
+    pattern = f"%{q}%"
+    return query.where(or_(Job.title.ilike(pattern), Job.description.ilike(pattern)))
+
+
+def order_by_relevance(query: Select, q: str, dialect: str) -> Select:
+    """Order search results by rank (PostgreSQL), newest first as the tiebreak."""
+    if dialect == "postgresql":
+        rank = func.ts_rank_cd(search_vector, job_search_query(q))
+        return query.order_by(rank.desc(), Job.created_at.desc())
+    return query.order_by(Job.created_at.desc())
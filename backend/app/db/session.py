@@ -1,23 +1,163 @@
-"""Database session management with async SQLAlchemy."""
+"""Database session management with async SQLAlchemy.
 
+One engine (and connection pool) is shared per process. It is created by
+init_engine() from the FastAPI lifespan / ARQ startup hook, or lazily on first
+use, and closed by dispose_engine() on shutdown. Engines for explicit database
+URLs are likewise created once per URL and disposed by dispose_engine().
+"""
+
+import logging
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+# Engines and session factories for explicit URLs passed to get_session_factory()
+_url_engines: dict[str, tuple[AsyncEngine, async_sessionmaker[AsyncSession]]] = {}
+
+
+@dataclass
+class PoolMetrics:
+    """Connection pool counters collected from SQLAlchemy pool events."""
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    checked_out: int = 0
+    max_checked_out: int = 0
+    total_hold_seconds: float = 0.0
+    max_hold_seconds: float = 0.0
+
+    @property
+    def avg_hold_seconds(self) -> float:
+        return self.total_hold_seconds / self.checkins if self.checkins else 0.0
+
+    def to_dict(self) -> dict[str, float | int]:
+        data = asdict(self)
+        data["avg_hold_seconds"] = round(self.avg_hold_seconds, 4)
+        return data
+
+
+_pool_metrics = PoolMetrics()
+
+
+def _instrument_pool(engine: AsyncEngine, metrics: PoolMetrics) -> None:
+    """Attach pool event listeners that update ``metrics``."""
+    pool = engine.sync_engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_conn, record):
+        metrics.connects += 1
 
-def get_engine(database_url: str | None = None):
-    """Create async database engine."""
-    url = database_url or get_settings().database_url
-    return create_async_engine(url, echo=False, future=True)
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_conn, record, proxy):
+        metrics.checkouts += 1
+        metrics.checked_out += 1
+        metrics.max_checked_out = max(metrics.max_checked_out, metrics.checked_out)
+        record.info["checkout_at"] = time.perf_counter()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_conn, record):
+        started = record.info.pop("checkout_at", None)
+        if started is None:
+            return
+        held = time.perf_counter() - started
+        metrics.checkins += 1
+        metrics.checked_out -= 1
+        metrics.total_hold_seconds += held
+        metrics.max_hold_seconds = max(metrics.max_hold_seconds, held)
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_conn, record, exception):
+        metrics.invalidations += 1
+
+
+def get_engine(database_url: str | None = None) -> AsyncEngine:
+    """Create a new async database engine with the configured pool settings.
+
+    Most code should use the shared engine via get_session_factory(); this
+    builds a standalone engine the caller is responsible for disposing.
+    """
+    settings = get_settings()
+    url = database_url or settings.database_url
+    kwargs: dict = {"echo": False, "future": True}
+    if not url.startswith("sqlite"):
+        kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+    return create_async_engine(url, **kwargs)
+
+
+def init_engine(database_url: str | None = None) -> AsyncEngine:
+    """Create the process-wide engine and session factory (idempotent)."""
+    global _engine, _session_factory
+    if _engine is None:
+        _engine = get_engine(database_url)
+        _instrument_pool(_engine, _pool_metrics)
+        _session_factory = async_sessionmaker(
+            _engine, class_=AsyncSession, expire_on_commit=False
+        )
+        logger.info(f"Database engine initialized ({_engine.pool.status()})")
+    return _engine
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections and drop the process-wide and per-URL engines."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+        logger.info(f"Database engine disposed (pool metrics: {_pool_metrics.to_dict()})")
+    _engine = None
+    _session_factory = None
+    while _url_engines:
+        _, (engine, _factory) = _url_engines.popitem()
+        await engine.dispose()
 
 
 def get_session_factory(database_url: str | None = None) -> async_sessionmaker[AsyncSession]:
-    """Create session factory."""
-    engine = get_engine(database_url)
-    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    """Return the shared session factory, or the one cached for an explicit URL."""
+    if database_url is not None:
+        cached = _url_engines.get(database_url)
+        if cached is None:
+            engine = get_engine(database_url)
+            factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            cached = _url_engines[database_url] = (engine, factory)
+        return cached[1]
+    if _session_factory is None:
+        init_engine()
+    return _session_factory
+
+
+def pool_stats() -> dict[str, float | int | str]:
+    """Checkout/checkin counters and current pool status of the shared engine."""
+    stats: dict[str, float | int | str] = dict(_pool_metrics.to_dict())
+    if _engine is not None:
+        pool = _engine.pool
+        stats["status"] = pool.status()
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                stats[f"pool_{name}"] = method()
+    return stats
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession]:
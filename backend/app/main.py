@@ -5,13 +5,14 @@ import os
 import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from app.config import get_settings
 from app.core.rate_limit import limiter
+from app.db.session import dispose_engine, init_engine, pool_stats
 from app.routers import agent, config, jobs, matches, reports
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,9 @@ async def lifespan(app: FastAPI):
     """Application startup/shutdown lifecycle."""
     settings = get_settings()
 
+    # --- Database engine (one connection pool per process) ---
+    init_engine()
+
     # --- ARQ Redis pool ---
     try:
         from arq import create_pool
@@ -59,6 +63,7 @@ async def lifespan(app: FastAPI):
     if getattr(app.state, "arq_pool", None) is not None:
         await app.state.arq_pool.aclose()
         logger.info("ARQ Redis pool closed")
+    await dispose_engine()
 
 
 app = FastAPI(
@@ -122,3 +127,11 @@ app.include_router(config.router)
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/internal/db-pool", include_in_schema=False)
+async def db_pool_metrics():
+    """DB connection pool metrics; 404 unless internal_metrics_enabled is set."""
+    if not get_settings().internal_metrics_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return pool_stats()
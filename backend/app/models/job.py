@@ -38,4 +38,5 @@ class Job(Base, TimestampMixin):
 
     __table_args__ = (
         Index("ix_job_external_source", "external_id", "source", unique=True),
+        Index("ix_job_created_id", "created_at", "id"),
     )
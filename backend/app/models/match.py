@@ -1,6 +1,6 @@
 """Match result database model."""
 
-from sqlalchemy import JSON, Float, ForeignKey, Index, Text, UniqueConstraint
+from sqlalchemy import JSON, Float, ForeignKey, Index, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -34,5 +34,14 @@ class MatchResult(Base, TimestampMixin):
 
     __table_args__ = (
         UniqueConstraint("user_id", "job_id", name="uq_match_user_job"),
-        Index("ix_match_user_score", "user_id", "overall_score"),
+        Index("ix_match_user_score", "user_id", "overall_score", "id"),
+        Index("ix_match_score_id", "overall_score", "id"),
+        # Expression indexes must match the sort keys in app/routers/matches.py
+        Index(
+            "ix_match_user_integrated",
+            "user_id",
+            text("coalesce(integrated_score, overall_score)"),
+            "id",
+        ),
+        Index("ix_match_user_ats", "user_id", text("coalesce(ats_score, -1)"), "id"),
     )
@@ -1,10 +1,12 @@
 """Job posting API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.rate_limit import limiter
+from app.db.pagination import CountMode, count_rows, keyset_paginate, next_page
+from app.db.search import apply_job_search, order_by_relevance
 from app.db.session import get_db_session
 from app.models.job import Job
 from app.schemas.api import (
@@ -21,40 +23,65 @@ router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 async def list_jobs(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
+    count: CountMode = "exact",
     q: str | None = None,
     location: str | None = None,
+    company: str | None = None,
     workplace_type: str | None = None,
     source: str | None = None,
     db: AsyncSession = Depends(get_db_session),
 ):
-    """List jobs with optional filters and full-text search."""
+    """List jobs with optional filters and full-text search.
+
+    Pages are keyset-paginated on (created_at, id): pass the returned
+    ``next_cursor`` as ``cursor`` to fetch the next page in constant time.
+    With ``q``, results are ranked by relevance and paged by offset only; passing
+    ``cursor`` together with ``q`` is rejected with 422.
+    ``count=estimated`` reports the planner's row estimate instead of counting.
+    """
+    if q and cursor:
+        raise HTTPException(
+            status_code=422, detail="cursor cannot be combined with q; page by offset instead"
+        )
+
+    dialect = db.get_bind().dialect.name
     query = select(Job)
 
     if q:
-        query = query.where(
-            Job.title.ilike(f"%{q}%") | Job.description.ilike(f"%{q}%")
-        )
+        query = apply_job_search(query, q, dialect)
     if location:
         query = query.where(Job.location.ilike(f"%{location}%"))
+    if company:
+        query = query.where(Job.company.ilike(f"%{company}%"))
     if workplace_type:
         query = query.where(Job.workplace_type == workplace_type)
     if source:
         query = query.where(Job.source == source)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+    total, total_estimated = await count_rows(db, query, count)
 
-    # Apply pagination
-    query = query.order_by(Job.created_at.desc()).offset(offset).limit(limit)
-    result = await db.execute(query)
-    jobs = result.scalars().all()
+    next_cursor = None
+    if q:
+        query = order_by_relevance(query, q, dialect).offset(offset).limit(limit)
+        jobs = (await db.execute(query)).scalars().all()
+    else:
+        try:
+            query = keyset_paginate(query, (Job.created_at, Job.id), cursor, limit, dialect)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        if not cursor:
+            query = query.offset(offset)
+        rows = (await db.execute(query)).scalars().all()
+        jobs, next_cursor = next_page(rows, limit, lambda j: (j.created_at, j.id))
 
     return PaginatedResponse(
         items=[JobResponse.model_validate(j) for j in jobs],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -1,10 +1,13 @@
 """Match result API endpoints."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, select
+from sqlalchemy import func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.db.pagination import CountMode, count_rows, keyset_paginate, next_page
 from app.db.session import get_db_session
 from app.models.match import MatchResult
 from app.schemas.api import (
@@ -16,37 +19,78 @@ from app.schemas.api import (
 
 router = APIRouter(prefix="/api/matches", tags=["matches"])
 
+MatchSort = Literal["overall", "integrated", "ats"]
+
+# Sort keys, each backed by a (user_id, key, id) index on match_results.
+# "integrated" is the pipeline's ranking: integrated score, else the LLM score.
+# Matches without an ATS score sort last under "ats".
+MATCH_SORT_KEYS = {
+    "overall": MatchResult.overall_score,
+    "integrated": func.coalesce(MatchResult.integrated_score, MatchResult.overall_score),
+    "ats": func.coalesce(MatchResult.ats_score, literal_column("-1")),
+}
+
+
+def _sort_value(match: MatchResult, sort: MatchSort) -> float:
+    if sort == "integrated":
+        return match.integrated_score if match.integrated_score is not None else match.overall_score
+    if sort == "ats":
+        return match.ats_score if match.ats_score is not None else -1
+    return match.overall_score
+
 
 @router.get("", response_model=PaginatedResponse[MatchResponse])
 async def list_matches(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
+    count: CountMode = "exact",
     min_score: float | None = None,
+    user_id: int | None = None,
+    sort: MatchSort = "overall",
     db: AsyncSession = Depends(get_db_session),
 ):
-    """List match results sorted by score descending."""
-    query = select(MatchResult).options(joinedload(MatchResult.job))
+    """List match results sorted by score descending.
 
+    ``sort`` selects the ranking: the LLM ``overall`` score, the pipeline's
+    ``integrated`` score, or the ``ats`` keyword score. Keyset-paginated on
+    (sort key, id): pass the returned ``next_cursor`` as ``cursor`` for the next
+    page. ``min_score`` applies to the same sort key, so it can use that index.
+    ``count=estimated`` skips the exact count.
+    """
+    sort_key = MATCH_SORT_KEYS[sort]
+    query = select(MatchResult)
+    if user_id is not None:
+        query = query.where(MatchResult.user_id == user_id)
     if min_score is not None:
-        query = query.where(MatchResult.overall_score >= min_score)
+        query = query.where(sort_key >= min_score)
 
-    # Total count
-    count_base = select(MatchResult)
-    if min_score is not None:
-        count_base = count_base.where(MatchResult.overall_score >= min_score)
-    count_query = select(func.count()).select_from(count_base.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
+    total, total_estimated = await count_rows(db, query, count)
 
-    # Sorted + paginated
-    query = query.order_by(MatchResult.overall_score.desc()).offset(offset).limit(limit)
-    result = await db.execute(query)
-    matches = result.unique().scalars().all()
+    try:
+        query = keyset_paginate(
+            query,
+            (sort_key, MatchResult.id),
+            cursor,
+            limit,
+            db.get_bind().dialect.name,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if not cursor:
+        query = query.offset(offset)
+    result = await db.execute(query.options(joinedload(MatchResult.job)))
+    matches, next_cursor = next_page(
+        result.unique().scalars().all(), limit, lambda m: (_sort_value(m, sort), m.id)
+    )
 
     return PaginatedResponse(
         items=[MatchResponse.model_validate(m) for m in matches],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
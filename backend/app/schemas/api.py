@@ -22,6 +22,8 @@ class PaginatedResponse[T](BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_estimated: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -21,6 +21,7 @@ class JobPosting(BaseModel):
     experience_level: str | None = None
     apply_url: str | None = None
     raw_data: dict | None = None
+    db_id: int | None = None  # jobs.id when loaded from the database
 
 
 class ScoreBreakdown(BaseModel):
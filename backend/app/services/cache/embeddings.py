@@ -0,0 +1,122 @@
+"""Content-addressed persistent cache for embedding vectors.
+
+Wraps any LangChain `Embeddings` so that identical texts are only embedded once.
+Entries are keyed by (model name, task_type, SHA-256 of the text) and stored in a
+local SQLite database, so re-indexing after a Chroma wipe or repeated matching
+runs with the same resume cost zero embedding API calls.
+
+Usage:
+    from app.services.llm_factory import get_embeddings
+
+    embeddings = get_embeddings("retrieval_document", cached=True)
+"""
+
+import hashlib
+from array import array
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+from app.services.cache.store import RowCodec, SqliteLruStore
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def make_cache_key(model: str, task_type: str, text: str) -> str:
+    """Build the content-addressed cache key for a text."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model}|{task_type}|{digest}"
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper backed by a persistent SQLite vector cache with LRU eviction.
+
+    Only cache misses are forwarded to the underlying model, in a single batched
+    `embed_documents` call. Hit/miss counters are exposed via `stats()`.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model: str,
+        task_type: str,
+        db_path: Path | str = ":memory:",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._embeddings = embeddings
+        self._model = model
+        self._task_type = task_type
+        self._store: SqliteLruStore[list[float]] = SqliteLruStore(
+            "embeddings",
+            RowCodec(
+                columns={
+                    "model": "TEXT NOT NULL",
+                    "task_type": "TEXT NOT NULL",
+                    "vector": "BLOB NOT NULL",
+                },
+                encode=lambda _key, vector: (model, task_type, _pack(vector)),
+                decode=lambda row: _unpack(row[2]),
+            ),
+            db_path=db_path,
+            max_entries=max_entries,
+        )
+
+    @property
+    def wrapped(self) -> Embeddings:
+        """Access the underlying (uncached) embeddings model."""
+        return self._embeddings
+
+    @property
+    def hits(self) -> int:
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        return self._store.misses
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current hit rate."""
+        return self._store.stats()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents, serving repeated texts from the cache."""
+        return self._embed(texts, self._embeddings.embed_documents)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, serving repeated queries from the cache."""
+        return self._embed([text], lambda t: [self._embeddings.embed_query(t[0])])[0]
+
+    def _embed(self, texts: list[str], compute) -> list[list[float]]:
+        keys = [make_cache_key(self._model, self._task_type, t) for t in texts]
+        cached = self._store.get_many(keys)
+
+        # Unique missing texts, preserving first-seen order
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            vectors = compute(list(missing.values()))
+            fresh = dict(zip(missing.keys(), vectors, strict=True))
+            self._store.set_many(fresh)
+            cached.update(fresh)
+
+        return [cached[k] for k in keys]
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._store.close()
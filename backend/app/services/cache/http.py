@@ -0,0 +1,289 @@
+"""Persistent conditional-request cache for the scraper HTTP client.
+
+Board and feed endpoints (Greenhouse, Lever, RemoteOK, WeWorkRemotely) mostly
+return the same document from one scheduled scrape to the next. Responses
+carrying an ETag or Last-Modified validator are stored in SQLite with their
+raw body; later requests for the same URL are sent with If-None-Match /
+If-Modified-Since, and a 304 is answered from the stored body.
+
+Every response served through the cache is tagged with the version of its body
+(``response.extensions["http_cache_version"]``). Scrapers use it to reuse the
+previous parse of an unchanged feed (see ParsedResponseCache), so unchanged
+feeds skip parsing and normalization as well as the download.
+
+For development, a replay TTL serves stored responses without touching the
+network at all while they are younger than the TTL.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from app.config import get_settings
+from app.services.cache.store import RowCodec, SqliteLruStore
+
+DEFAULT_MAX_ENTRIES = 2_000
+DEFAULT_PARSED_ENTRIES = 64
+
+# Response extension keys set by CachingTransport
+CACHE_STATUS_EXTENSION = "http_cache"
+CACHE_VERSION_EXTENSION = "http_cache_version"
+
+# Hop-by-hop / framing headers that must not be replayed with a stored body
+_UNSTORED_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-length"}
+
+
+def make_request_key(request: httpx.Request) -> str:
+    """Cache key for a GET request: hash of the full URL (API keys are never stored)."""
+    return hashlib.sha256(str(request.url).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    version: str
+    stored_at: float
+
+
+_CODEC: RowCodec[CachedResponse] = RowCodec(
+    columns={
+        "status": "INTEGER NOT NULL",
+        "headers": "TEXT NOT NULL",
+        "body": "BLOB NOT NULL",
+        "etag": "TEXT",
+        "last_modified": "TEXT",
+        "version": "TEXT NOT NULL",
+        "stored_at": "REAL NOT NULL",
+    },
+    encode=lambda _key, entry: (
+        entry.status,
+        json.dumps(entry.headers),
+        entry.body,
+        entry.etag,
+        entry.last_modified,
+        entry.version,
+        entry.stored_at,
+    ),
+    decode=lambda row: CachedResponse(
+        status=row[0],
+        headers=[tuple(h) for h in json.loads(row[1])],
+        body=row[2],
+        etag=row[3],
+        last_modified=row[4],
+        version=row[5],
+        stored_at=row[6],
+    ),
+)
+
+
+class HttpCache:
+    """SQLite-backed response store with size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._store: SqliteLruStore[CachedResponse] = SqliteLruStore(
+            "responses", _CODEC, db_path=db_path, max_entries=max_entries
+        )
+        self.stored = 0
+        self.revalidated = 0
+        self.replayed = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return store/revalidation/replay/miss counters."""
+        return {
+            "stored": self.stored,
+            "revalidated": self.revalidated,
+            "replayed": self.replayed,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored response for a key, or None."""
+        return self._store.get(key)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store (or replace) the response for a key."""
+        self._store.set(key, entry)
+
+    def touch(self, key: str) -> None:
+        """Mark a stored response as just revalidated (restarts its replay TTL)."""
+        self._store.update(key, stored_at=time.time())
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        self._store.clear()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._store.close()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper answering GET requests from an HttpCache.
+
+    Args:
+        transport: The transport that performs network requests.
+        cache: Response store.
+        replay_ttl: If > 0, stored responses younger than this many seconds are
+            served without a network request, and 200 responses are stored
+            even without validators (offline development mode).
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        cache: HttpCache,
+        replay_ttl: float = 0.0,
+    ) -> None:
+        self._transport = transport
+        self._cache = cache
+        self._replay_ttl = replay_ttl
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = make_request_key(request)
+        entry = await asyncio.to_thread(self._cache.get, key)
+
+        if entry is not None and time.time() - entry.stored_at < self._replay_ttl:
+            self._cache.replayed += 1
+            return self._from_entry(entry, request, "replayed")
+
+        if entry is not None:
+            if entry.etag and "if-none-match" not in request.headers:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified and "if-modified-since" not in request.headers:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            await asyncio.to_thread(self._cache.touch, key)
+            self._cache.revalidated += 1
+            return self._from_entry(entry, request, "revalidated")
+
+        if response.status_code != 200 or not self._storable(response):
+            self._cache.misses += 1
+            return response
+
+        # Read the transport-level stream: raw bytes, Content-Encoding untouched
+        try:
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        stored_at = time.time()
+        entry = CachedResponse(
+            status=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _UNSTORED_HEADERS
+            ],
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            version=etag or last_modified or f"stored:{stored_at}",
+            stored_at=stored_at,
+        )
+        await asyncio.to_thread(self._cache.set, key, entry)
+        self._cache.stored += 1
+        return self._from_entry(entry, request, "stored", extensions=response.extensions)
+
+    def _storable(self, response: httpx.Response) -> bool:
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return False
+        has_validator = "etag" in response.headers or "last-modified" in response.headers
+        return has_validator or self._replay_ttl > 0
+
+    @staticmethod
+    def _from_entry(
+        entry: CachedResponse,
+        request: httpx.Request,
+        status: str,
+        extensions: dict | None = None,
+    ) -> httpx.Response:
+        # The body is stored raw, so the client still decodes Content-Encoding
+        return httpx.Response(
+            entry.status,
+            headers=entry.headers,
+            content=entry.body,
+            request=request,
+            extensions={
+                **(extensions or {}),
+                CACHE_STATUS_EXTENSION: status,
+                CACHE_VERSION_EXTENSION: entry.version,
+            },
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ParsedResponseCache:
+    """Small in-process LRU of parse results keyed by URL and body version.
+
+    Lets a scraper skip parsing and normalizing a feed whose body the HTTP
+    cache reports as unchanged since the last parse.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PARSED_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self.hits = 0
+
+    def get(self, key: str, version: str) -> Any | None:
+        """Return the parse result stored for ``key`` at ``version``, or None."""
+        cached = self._entries.get(key)
+        if cached is None or cached[0] != version:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return cached[1]
+
+    def set(self, key: str, version: str, parsed: Any) -> None:
+        self._entries[key] = (version, parsed)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Shared by all scrapers in the process (see BaseScraper._fetch_parsed)
+parsed_responses = ParsedResponseCache()
+
+
+def get_http_cache() -> HttpCache | None:
+    """Build the default on-disk scraper HTTP cache from settings, or None if disabled."""
+    settings = get_settings()
+    if not settings.scraper_http_cache_enabled:
+        return None
+    return HttpCache(
+        db_path=settings.data_dir / ".http_cache.db",
+        max_entries=settings.scraper_http_cache_max_entries,
+    )
@@ -0,0 +1,122 @@
+"""Persistent cache for LLM-as-Judge scoring results.
+
+Keys are content hashes of everything that determines a score: the prompt
+template (so editing SCORING_PROMPT/QUICK_SCORE_PROMPT invalidates old entries),
+the model name, the resume text, the job fields, the candidate preferences and
+the scoring weights. Values are JSON payloads (a serialized JobMatchScore, or a
+quick-score relevance/reason pair) stored in SQLite with a TTL and LRU eviction.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.config import get_settings
+from app.services.cache.store import RowCodec, SqliteLruStore
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 20_000
+
+_CODEC: RowCodec[Any] = RowCodec(
+    columns={"kind": "TEXT NOT NULL", "payload": "TEXT NOT NULL"},
+    encode=lambda key, payload: (key.split("|", 1)[0], json.dumps(payload)),
+    decode=lambda row: json.loads(row[1]),
+)
+
+
+def prompt_version(prompt: ChatPromptTemplate) -> str:
+    """Short content hash of a prompt template, used as its cache version."""
+    parts = [
+        getattr(getattr(m, "prompt", None), "template", None) or str(m)
+        for m in prompt.messages
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:12]
+
+
+def make_score_key(kind: str, version: str, model: str, variables: dict[str, Any]) -> str:
+    """Build a cache key from the scoring kind, prompt version, model and prompt inputs."""
+    payload = json.dumps(variables, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{kind}|{version}|{model}|{digest}"
+
+
+class ScoreCache:
+    """SQLite-backed score cache with TTL expiry and size-bounded LRU eviction.
+
+    Methods block on SQLite; async callers run them via ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._store: SqliteLruStore[Any] = SqliteLruStore(
+            "scores",
+            _CODEC,
+            db_path=db_path,
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current hit rate."""
+        return self._store.stats()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached payload for a key, or None if missing/expired."""
+        return self._store.get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Return the cached payloads found for ``keys``."""
+        return self._store.get_many(keys)
+
+    def set(self, key: str, payload: Any) -> None:
+        """Store a JSON-serializable payload under a key."""
+        self._store.set(key, payload)
+
+    def set_many(self, payloads: dict[str, Any]) -> None:
+        """Store several JSON-serializable payloads."""
+        self._store.set_many(payloads)
+
+    def clear(self) -> None:
+        """Remove all cached scores."""
+        self._store.clear()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._store.close()
+
+
+# One connection per cache file for the whole process, shared by every pipeline
+_score_caches: dict[Path, ScoreCache] = {}
+
+
+def get_score_cache() -> ScoreCache | None:
+    """Return the process-wide on-disk score cache from settings, or None if disabled."""
+    settings = get_settings()
+    if not settings.score_cache_enabled:
+        return None
+    db_path = settings.data_dir / ".score_cache.db"
+    cache = _score_caches.get(db_path)
+    if cache is None:
+        cache = _score_caches[db_path] = ScoreCache(
+            db_path=db_path,
+            ttl_seconds=settings.score_cache_ttl_hours * 3600,
+            max_entries=settings.score_cache_max_entries,
+        )
+    return cache
+
+
+def close_score_cache() -> None:
+    """Close the shared score cache(s); the next get_score_cache() reopens."""
+    while _score_caches:
+        _, cache = _score_caches.popitem()
+        cache.close()
@@ -0,0 +1,213 @@
+"""SQLite key-value store with size-bounded LRU eviction and optional TTL.
+
+Shared scaffolding for the persistent caches in this package. Each cache
+describes its value columns and how to map a value to and from a row with a
+RowCodec; the store owns the connection, locking, LRU bookkeeping (a
+``last_used`` column) and eviction.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Stay under SQLite's bound-parameter limit in IN (...) lookups
+_LOOKUP_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class RowCodec[V]:
+    """Maps cache values to and from a table's value columns.
+
+    Attributes:
+        columns: Value column names and their SQL declarations, in row order.
+        encode: ``(key, value)`` -> column values, in ``columns`` order.
+        decode: Column values, in ``columns`` order -> value.
+    """
+
+    columns: dict[str, str]
+    encode: Callable[[str, V], tuple[Any, ...]]
+    decode: Callable[[tuple[Any, ...]], V]
+
+
+class SqliteLruStore[V]:
+    """Thread-safe SQLite table keyed by string, evicting least-recently-used rows.
+
+    Args:
+        table: Table name (also used for the LRU index name).
+        codec: Value columns and row mapping.
+        db_path: Database file, or ``":memory:"``.
+        max_entries: Rows kept after each write.
+        ttl_seconds: If set, rows expire this many seconds after being written.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        codec: RowCodec[V],
+        db_path: Path | str = ":memory:",
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self._table = table
+        self._codec = codec
+        self._columns = list(codec.columns)
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        columns = ["key TEXT PRIMARY KEY"]
+        columns += [f"{name} {decl}" for name, decl in codec.columns.items()]
+        if ttl_seconds is not None:
+            columns.append("expires_at REAL NOT NULL")
+        columns.append("last_used REAL NOT NULL")
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Callers may run in worker threads (asyncio.to_thread)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)})")
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_last_used ON {table} (last_used)"
+            )
+            self._conn.commit()
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current hit rate."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT count(*) FROM {self._table}").fetchone()
+        return int(row[0])
+
+    def keys(self) -> list[str]:
+        """Return all stored keys."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute(f"SELECT key FROM {self._table}")]
+
+    def get(self, key: str) -> V | None:
+        """Return the value for a key, or None if missing or expired."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, V]:
+        """Return the live values for ``keys`` and mark them as recently used.
+
+        Hit/miss counters are updated once per requested key, duplicates included.
+        """
+        requested = list(keys)
+        unique = list(dict.fromkeys(requested))
+        found: dict[str, V] = {}
+        if unique:
+            now = time.time()
+            select = ", ".join(self._columns)
+            if self._ttl is not None:
+                select += ", expires_at"
+            expired: list[str] = []
+            with self._lock:
+                for start in range(0, len(unique), _LOOKUP_CHUNK):
+                    chunk = unique[start : start + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, {select} FROM {self._table} "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                    for key, *values in rows:
+                        if self._ttl is not None and values.pop() < now:
+                            expired.append(key)
+                        else:
+                            found[key] = self._codec.decode(tuple(values))
+                if expired:
+                    self._conn.executemany(
+                        f"DELETE FROM {self._table} WHERE key = ?", [(k,) for k in expired]
+                    )
+                if found:
+                    self._conn.executemany(
+                        f"UPDATE {self._table} SET last_used = ? WHERE key = ?",
+                        [(now, k) for k in found],
+                    )
+                if expired or found:
+                    self._conn.commit()
+
+        hit_count = sum(1 for k in requested if k in found)
+        self.hits += hit_count
+        self.misses += len(requested) - hit_count
+        return found
+
+    def set(self, key: str, value: V) -> None:
+        """Store (or replace) the value for a key."""
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, V]) -> None:
+        """Store (or replace) several values, then evict down to max_entries."""
+        if not items:
+            return
+        now = time.time()
+        columns = ["key", *self._columns]
+        rows = [(key, *self._codec.encode(key, value)) for key, value in items.items()]
+        if self._ttl is not None:
+            columns.append("expires_at")
+            rows = [(*row, now + self._ttl) for row in rows]
+        columns.append("last_used")
+        rows = [(*row, now) for row in rows]
+        placeholders = ", ".join("?" * len(columns))
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self._table} ({', '.join(columns)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def update(self, key: str, **values: Any) -> None:
+        """Overwrite value columns of an existing row in place."""
+        assignments = ", ".join(f"{name} = ?" for name in values)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE {self._table} SET {assignments} WHERE key = ?",
+                (*values.values(), key),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self._table}")
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then least-recently-used ones. Caller holds the lock."""
+        if self._ttl is not None:
+            self._conn.execute(f"DELETE FROM {self._table} WHERE expires_at < ?", (now,))
+        count = self._conn.execute(f"SELECT count(*) FROM {self._table}").fetchone()[0]
+        overflow = count - self._max_entries
+        if overflow > 0:
+            self._conn.execute(
+                f"DELETE FROM {self._table} WHERE key IN "
+                f"(SELECT key FROM {self._table} ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+            logger.debug(f"Cache table {self._table} evicted {overflow} entries")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
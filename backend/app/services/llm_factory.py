@@ -6,15 +6,26 @@ Usage:
     llm = get_llm(LLMTask.PARSE)        # → Gemini 3 Flash
     llm = get_llm(LLMTask.SCORE)        # → Claude Sonnet 4.6
     embeddings = get_embeddings()         # → Gemini embedding-001
+    embeddings = get_embeddings(cached=True)  # → same, behind the persistent vector cache
+
+    if supports_prompt_caching(llm):
+        messages[0] = mark_cache_breakpoint(messages[0])  # cache everything up to here
 """
 
 from enum import StrEnum
+from pathlib import Path
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 
 from app.config import get_settings
+from app.services.cache.embeddings import CachedEmbeddings
+
+# Shared CachedEmbeddings per (cache file, model, task type), see get_embeddings()
+_cached_embeddings: dict[tuple[Path, str, str], CachedEmbeddings] = {}
 
 
 class LLMTask(StrEnum):
@@ -75,19 +86,71 @@ def get_llm(task: LLMTask, temperature: float = 0.0) -> BaseChatModel:
         raise ValueError(msg)
 
 
-def get_embeddings(task_type: str = "retrieval_document") -> GoogleGenerativeAIEmbeddings:
+def supports_prompt_caching(llm: BaseChatModel) -> bool:
+    """Whether the model honours Anthropic cache_control breakpoints.
+
+    Only the Claude path supports explicit prompt caching; it can be disabled
+    with CLAUDE_PROMPT_CACHING=false (e.g. for proxies that reject the field).
+    """
+    return isinstance(llm, ChatAnthropic) and get_settings().claude_prompt_caching
+
+
+def mark_cache_breakpoint(message: BaseMessage) -> BaseMessage:
+    """Return a copy of a message with an ephemeral cache breakpoint on its last text block.
+
+    Claude caches the whole prompt prefix up to and including the marked block,
+    so later requests sharing that prefix are billed at the cache-read rate.
+    """
+    cache_control = {"type": "ephemeral"}
+    if isinstance(message.content, str):
+        content: list = [{"type": "text", "text": message.content, "cache_control": cache_control}]
+    else:
+        content = [dict(b) if isinstance(b, dict) else b for b in message.content]
+        for block in reversed(content):
+            if isinstance(block, dict) and block.get("type") == "text":
+                block["cache_control"] = cache_control
+                break
+    return message.model_copy(update={"content": content})
+
+
+def get_embeddings(task_type: str = "retrieval_document", cached: bool = False) -> Embeddings:
     """Get Gemini embedding model.
 
     Args:
         task_type: Either "retrieval_document" for indexing or
                    "retrieval_query" for search queries.
+        cached: Wrap the model in the persistent content-addressed vector cache
+                (ignored when EMBEDDING_CACHE_ENABLED is false).
 
     Returns:
-        Configured GoogleGenerativeAIEmbeddings instance.
+        Configured GoogleGenerativeAIEmbeddings instance, or, when ``cached`` is
+        set, the process-wide CachedEmbeddings wrapper for this model and task
+        type (one SQLite connection shared by every caller).
     """
     settings = get_settings()
-    return GoogleGenerativeAIEmbeddings(
+    embeddings = GoogleGenerativeAIEmbeddings(
         model=settings.embedding_model,
         google_api_key=settings.google_api_key.get_secret_value(),
         task_type=task_type,
     )
+    if not (cached and settings.embedding_cache_enabled):
+        return embeddings
+    db_path = settings.data_dir / ".embedding_cache.db"
+    key = (db_path, settings.embedding_model, task_type)
+    cached_embeddings = _cached_embeddings.get(key)
+    if cached_embeddings is None:
+        cached_embeddings = _cached_embeddings[key] = CachedEmbeddings(
+            embeddings,
+            model=settings.embedding_model,
+            task_type=task_type,
+            db_path=db_path,
+            max_entries=settings.embedding_cache_max_entries,
+        )
+    return cached_embeddings
+
+
+def close_embedding_caches() -> None:
+    """Close the shared vector caches; the next get_embeddings(cached=True) reopens."""
+    while _cached_embeddings:
+        _, cached_embeddings = _cached_embeddings.popitem()
+        cached_embeddings.close()
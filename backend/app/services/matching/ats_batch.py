@@ -0,0 +1,101 @@
+"""Process-pool ATS scoring for large backfills.
+
+ATS scoring is pure CPU-bound Python. Rescoring every stored match (e.g. after
+a resume change) in the event loop would block the worker, so chunks of job
+texts are fanned out to a ProcessPoolExecutor instead. Each worker process
+builds the resume keyword profile once in its initializer; only job texts and
+score dicts cross the process boundary.
+
+This module stays import-light: spawned worker processes import it on start.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from app.services.matching.ats_scorer import (
+    ResumeKeywordProfile,
+    get_resume_profile,
+    score_against_profile,
+)
+
+logger = logging.getLogger(__name__)
+
+# (key, job description, job requirements)
+ATSRow = tuple[int, str, str | None]
+
+# Resume profile of the current worker process, set by _init_worker()
+_worker_profile: ResumeKeywordProfile | None = None
+
+
+def _init_worker(resume_text: str) -> None:
+    """Process initializer: build the resume keyword profile once per process."""
+    global _worker_profile
+    _worker_profile = get_resume_profile(resume_text)
+
+
+def score_rows(rows: list[ATSRow]) -> list[tuple[int, dict]]:
+    """Score a chunk of job texts against this process's resume profile.
+
+    Returns:
+        (key, ATSKeywordScore as dict) per row, in input order.
+    """
+    if _worker_profile is None:
+        msg = "ATS worker not initialized; create the executor with make_ats_executor()"
+        raise RuntimeError(msg)
+    return [
+        (key, score_against_profile(_worker_profile, description, requirements).model_dump())
+        for key, description, requirements in rows
+    ]
+
+
+def default_workers() -> int:
+    """Worker processes used when none are configured: one per CPU."""
+    return os.cpu_count() or 1
+
+
+def make_ats_executor(resume_text: str, max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Create a process pool whose workers are primed with ``resume_text``.
+
+    Workers are spawned rather than forked, since forking a process that runs
+    an event loop and open DB connections is unsafe.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or default_workers(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(resume_text,),
+    )
+
+
+async def score_in_pool(
+    executor: Executor,
+    chunks: AsyncIterable[list[ATSRow]],
+    max_in_flight: int,
+) -> AsyncIterator[list[tuple[int, dict]]]:
+    """Fan chunks out to ``executor`` and yield each chunk's scores as it completes.
+
+    At most ``max_in_flight`` chunks are submitted at once, so reading input
+    never runs far ahead of scoring. Results arrive in completion order.
+    """
+    loop = asyncio.get_running_loop()
+    pending: set[asyncio.Future] = set()
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            pending.add(loop.run_in_executor(executor, score_rows, chunk))
+            if len(pending) >= max_in_flight:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
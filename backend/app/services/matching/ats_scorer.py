@@ -2,11 +2,18 @@
 
 Pure programmatic scorer — zero LLM calls. Computes keyword overlap between
 a resume and a job description to estimate ATS pass-through likelihood.
+
+Keywords are compiled into a word trie, so every hit in a text is found in one
+pass over its words. The resume side is cached as a ResumeKeywordProfile and
+reused across jobs (see compute_ats_scores_batch()).
 """
 
 import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 
-from app.schemas.matching import ATSKeywordScore
+from app.schemas.matching import ATSKeywordScore, JobPosting
 
 # ---------------------------------------------------------------------------
 # Curated keyword sets
@@ -68,14 +75,27 @@ SOFT_SKILL_KEYWORDS: set[str] = {
 }
 
 
+# Longest keyword phrase matched, in words (the tokenizer's n-gram limit)
+MAX_KEYWORD_WORDS = 3
+
+_SEPARATORS_RE = re.compile(r"[/,;|•·\-–—]")
+# Keep alphanumeric, dots (for .net, node.js), hashes (c#), pluses (c++)
+_DISALLOWED_RE = re.compile(r"[^a-z0-9.#+\s]")
+
+# Trie key under which a node stores the keyword that ends there
+_KEYWORD = None
+
+
+def _split_words(text: str) -> list[str]:
+    """Lowercase, normalize separators and split ``text`` into raw words."""
+    # Replace common separators with spaces
+    text_clean = _SEPARATORS_RE.sub(" ", text.lower())
+    return _DISALLOWED_RE.sub(" ", text_clean).split()
+
+
 def _tokenize(text: str) -> set[str]:
     """Extract normalized unigrams, bigrams, and trigrams from text."""
-    text_lower = text.lower()
-    # Replace common separators with spaces
-    text_clean = re.sub(r"[/,;|•·\-–—]", " ", text_lower)
-    # Keep alphanumeric, dots (for .net, node.js), hashes (c#), pluses (c++)
-    text_clean = re.sub(r"[^a-z0-9.#+\s]", " ", text_clean)
-    words = text_clean.split()
+    words = _split_words(text)
 
     tokens: set[str] = set()
     for w in words:
@@ -101,46 +121,78 @@ def _tokenize(text: str) -> set[str]:
     return tokens
 
 
+def _build_keyword_trie(keywords: set[str]) -> dict:
+    """Word-level trie: each node maps a word to its child; _KEYWORD marks an end."""
+    root: dict = {}
+    for kw in keywords:
+        words = kw.split(" ")
+        if len(words) > MAX_KEYWORD_WORDS:
+            continue
+        node = root
+        for word in words:
+            node = node.setdefault(word, {})
+        node[_KEYWORD] = kw
+    return root
+
+
+_KEYWORD_TRIE = _build_keyword_trie(TECHNICAL_KEYWORDS | SOFT_SKILL_KEYWORDS)
+
+
+def _find_keywords(text: str) -> set[str]:
+    """All curated keywords in ``text``, found in a single pass over its words.
+
+    Matches exactly the keywords _tokenize() would produce as n-grams.
+    """
+    words = [w.strip(".") for w in _split_words(text)]
+    found: set[str] = set()
+    n = len(words)
+    for i in range(n):
+        node = _KEYWORD_TRIE
+        for j in range(i, min(i + MAX_KEYWORD_WORDS, n)):
+            word = words[j]
+            # An empty word (e.g. a lone ".") breaks the phrase
+            if not word or (node := node.get(word)) is None:
+                break
+            kw = node.get(_KEYWORD)
+            if kw is not None:
+                found.add(kw)
+    return found
+
+
 def _extract_keywords(text: str) -> tuple[set[str], set[str]]:
     """Extract technical and soft-skill keywords found in text.
 
     Returns:
         (technical_keywords_found, soft_skill_keywords_found)
     """
-    tokens = _tokenize(text)
+    found = _find_keywords(text)
+    return found & TECHNICAL_KEYWORDS, found & SOFT_SKILL_KEYWORDS
 
-    technical = set()
-    for kw in TECHNICAL_KEYWORDS:
-        if kw in tokens:
-            technical.add(kw)
 
-    soft = set()
-    for kw in SOFT_SKILL_KEYWORDS:
-        if kw in tokens:
-            soft.add(kw)
+@dataclass(frozen=True)
+class ResumeKeywordProfile:
+    """Keywords present in a resume, computed once and reused for every job."""
 
-    return technical, soft
+    technical: frozenset[str]
+    soft: frozenset[str]
 
 
-def compute_ats_score(
-    resume_text: str,
-    job_description: str,
-    job_requirements: str | None = None,
-) -> ATSKeywordScore:
-    """Compute ATS keyword overlap score between resume and job posting.
+@lru_cache(maxsize=32)
+def get_resume_profile(resume_text: str) -> ResumeKeywordProfile:
+    """Return the (cached) keyword profile of a resume."""
+    technical, soft = _extract_keywords(resume_text)
+    return ResumeKeywordProfile(technical=frozenset(technical), soft=frozenset(soft))
 
-    Algorithm:
-    - Extract keywords from job description + requirements
-    - Check which appear in resume
-    - Weighted score: 70% technical + 30% soft skills
 
-    Args:
-        resume_text: Full resume text.
-        job_description: Job description text.
-        job_requirements: Optional separate requirements text.
+def score_against_profile(
+    profile: ResumeKeywordProfile,
+    job_description: str,
+    job_requirements: str | None,
+) -> ATSKeywordScore:
+    """Score a job posting against a precomputed resume keyword profile.
 
-    Returns:
-        ATSKeywordScore with overlap metrics.
+    Same scoring as compute_ats_score(), for callers that reuse one profile
+    across many jobs (see get_resume_profile()).
     """
     # Combine job text
     job_text = job_description
@@ -161,12 +213,9 @@ def compute_ats_score(
             soft_skill_match_pct=0.0,
         )
 
-    # Extract keywords from resume
-    resume_technical, resume_soft = _extract_keywords(resume_text)
-
     # Compute overlap
-    matched_technical = job_technical & resume_technical
-    matched_soft = job_soft & resume_soft
+    matched_technical = job_technical & profile.technical
+    matched_soft = job_soft & profile.soft
     matched = matched_technical | matched_soft
     missing = all_job_keywords - matched
 
@@ -193,3 +242,49 @@ def compute_ats_score(
         technical_match_pct=round(tech_pct, 1),
         soft_skill_match_pct=round(soft_pct, 1),
     )
+
+
+# Former private name, kept for existing imports
+_score_against_profile = score_against_profile
+
+
+def compute_ats_score(
+    resume_text: str,
+    job_description: str,
+    job_requirements: str | None = None,
+) -> ATSKeywordScore:
+    """Compute ATS keyword overlap score between resume and job posting.
+
+    Algorithm:
+    - Extract keywords from job description + requirements
+    - Check which appear in resume
+    - Weighted score: 70% technical + 30% soft skills
+
+    Args:
+        resume_text: Full resume text.
+        job_description: Job description text.
+        job_requirements: Optional separate requirements text.
+
+    Returns:
+        ATSKeywordScore with overlap metrics.
+    """
+    return score_against_profile(
+        get_resume_profile(resume_text), job_description, job_requirements
+    )
+
+
+def compute_ats_scores_batch(
+    resume_text: str,
+    jobs: Sequence[JobPosting],
+) -> list[ATSKeywordScore]:
+    """Score many jobs against one resume, extracting resume keywords once.
+
+    Args:
+        resume_text: Full resume text.
+        jobs: Postings to score.
+
+    Returns:
+        One ATSKeywordScore per job, in input order.
+    """
+    profile = get_resume_profile(resume_text)
+    return [score_against_profile(profile, j.description, j.requirements) for j in jobs]
@@ -0,0 +1,281 @@
+"""AIMD adaptive concurrency limiter for LLM calls.
+
+Replaces fixed semaphores: the limit grows additively while calls succeed with
+healthy latency and error rate, is cut multiplicatively on 429/overload responses
+(or when most recent calls fail), and all callers pause until a server-provided
+retry-after has elapsed.
+
+Usage:
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=16)
+    score = await limiter.call(lambda: scorer.score(...), max_attempts=3)
+    limiter.metrics()  # {"limit": 6, "in_flight": 6, "queue_depth": 12, ...}
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses treated as "slow down" signals (Anthropic uses 529 for overloaded)
+OVERLOAD_STATUSES = {429, 503, 529}
+# Symbolic statuses (google-genai / gRPC) and SDK exception types meaning the same
+_OVERLOAD_STATUS_NAMES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE"}
+_OVERLOAD_ERROR_TYPES = {
+    "RateLimitError",
+    "ResourceExhausted",
+    "TooManyRequests",
+    "ServiceUnavailable",
+}
+
+# Cap on any single backoff/retry-after wait
+MAX_BACKOFF_SECONDS = 60.0
+
+# Smoothing factor for the latency and error-rate moving averages
+_LATENCY_ALPHA = 0.2
+_ERROR_ALPHA = 0.2
+
+
+def _is_overload_status(value: object) -> bool:
+    if isinstance(value, int):
+        return value in OVERLOAD_STATUSES
+    return isinstance(value, str) and value.upper() in _OVERLOAD_STATUS_NAMES
+
+
+def is_overloaded(exc: BaseException) -> bool:
+    """Detect 429 / overloaded errors from their status code or SDK exception type.
+
+    Wrapper exceptions (e.g. LangChain re-raising a provider error) are unwrapped
+    through ``__cause__`` / ``__context__``. Error messages are not inspected.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if type(current).__name__ in _OVERLOAD_ERROR_TYPES:
+            return True
+        for obj in (current, getattr(current, "response", None)):
+            for attr in ("status_code", "code", "status"):
+                if _is_overload_status(getattr(obj, attr, None)):
+                    return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Extract a Retry-After delay (seconds or HTTP date) from an error, if present."""
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if headers is not None:
+            try:
+                value = headers.get("retry-after")
+            except AttributeError:
+                value = None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """Async concurrency limiter with additive-increase / multiplicative-decrease.
+
+    Each successful call adds ``1 / limit`` to the limit (about +1 per window of
+    ``limit`` calls) unless the latency moving average exceeds ``latency_target``
+    or the failure-rate moving average exceeds ``error_rate_threshold``.
+    An overload error multiplies the limit by ``decrease_factor`` (at most once
+    per ``cooldown`` seconds, so a burst of 429s counts as one signal) and
+    blocks new acquisitions until any retry-after has elapsed. Other errors
+    (5xx, timeouts) apply the same decrease once the failure rate is above the
+    threshold.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        decrease_factor: float = 0.5,
+        latency_target: float | None = None,
+        error_rate_threshold: float = 0.5,
+        base_backoff: float = 1.0,
+        cooldown: float = 1.0,
+        name: str = "llm",
+    ) -> None:
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._decrease_factor = decrease_factor
+        self._latency_target = latency_target
+        self._error_rate_threshold = error_rate_threshold
+        self._base_backoff = base_backoff
+        self._cooldown = cooldown
+        self._name = name
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._latency_ewma: float | None = None
+        self._error_rate = 0.0
+        self._condition = asyncio.Condition()
+
+        self.successes = 0
+        self.overloads = 0
+        self.errors = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def latency_target(self) -> float | None:
+        """Average call latency (seconds) above which the limit stops growing."""
+        return self._latency_target
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers waiting for a slot."""
+        return self._waiting
+
+    def metrics(self) -> dict[str, float | int | None]:
+        """Snapshot of limiter state for logging/metrics export."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "errors": self.errors,
+            "latency_ewma": (
+                round(self._latency_ewma, 3) if self._latency_ewma is not None else None
+            ),
+            "error_rate": round(self._error_rate, 3),
+        }
+
+    async def acquire(self) -> None:
+        """Wait for a free slot (and for any retry-after pause to end)."""
+        async with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    pause = self._blocked_until - time.monotonic()
+                    if pause > 0:
+                        # Release the condition while paused; wake early on notify
+                        try:
+                            await asyncio.wait_for(self._condition.wait(), timeout=pause)
+                        except TimeoutError:
+                            pass
+                        continue
+                    if self._in_flight < self.limit:
+                        break
+                    await self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Feed a successful call's latency into the controller."""
+        self.successes += 1
+        self._error_rate -= _ERROR_ALPHA * self._error_rate
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma += _LATENCY_ALPHA * (latency - self._latency_ewma)
+        if self._latency_target is not None and self._latency_ewma > self._latency_target:
+            return
+        if self._error_rate > self._error_rate_threshold:
+            return
+        self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+
+    def record_error(self) -> None:
+        """Feed a non-overload failure (5xx, timeout, ...) into the controller."""
+        self.errors += 1
+        self._error_rate += _ERROR_ALPHA * (1.0 - self._error_rate)
+        if self._error_rate > self._error_rate_threshold:
+            self._decrease(time.monotonic(), f"error rate {self._error_rate:.2f}")
+
+    def record_overload(self, retry_after: float | None = None) -> None:
+        """Back off after a 429/overload response."""
+        self.overloads += 1
+        self._error_rate += _ERROR_ALPHA * (1.0 - self._error_rate)
+        now = time.monotonic()
+        self._decrease(now, "overloaded")
+        if retry_after:
+            self._blocked_until = max(
+                self._blocked_until, now + min(retry_after, MAX_BACKOFF_SECONDS)
+            )
+
+    def _decrease(self, now: float, reason: str) -> None:
+        """Cut the limit multiplicatively, at most once per cooldown."""
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._limit = max(float(self._min_limit), self._limit * self._decrease_factor)
+        self._last_decrease = now
+        logger.warning(f"{self._name} limiter: {reason}, concurrency limit -> {self.limit}")
+
+    def backoff_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Delay before retry ``attempt`` (0-based): retry-after if given, else jittered backoff."""
+        if retry_after is not None:
+            return min(retry_after, MAX_BACKOFF_SECONDS)
+        delay = min(self._base_backoff * (2**attempt), MAX_BACKOFF_SECONDS)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def call(self, fn: Callable[[], Awaitable[T]], max_attempts: int = 3) -> T:
+        """Run ``fn`` under the limiter, retrying failures with backoff.
+
+        Args:
+            fn: Zero-argument callable returning a fresh awaitable per attempt.
+            max_attempts: Total attempts before the last error is re-raised.
+
+        Returns:
+            The result of the first successful attempt.
+        """
+        for attempt in range(max_attempts):
+            await self.acquire()
+            start = time.monotonic()
+            try:
+                result = await fn()
+            except Exception as e:
+                retry_after = retry_after_seconds(e)
+                if is_overloaded(e):
+                    self.record_overload(retry_after)
+                else:
+                    self.record_error()
+                if attempt >= max_attempts - 1:
+                    raise
+                delay = self.backoff_delay(attempt, retry_after)
+                logger.warning(
+                    f"{self._name} attempt {attempt + 1} failed, retrying in {delay:.1f}s: {e}"
+                )
+            else:
+                self.record_success(time.monotonic() - start)
+                return result
+            finally:
+                await self.release()
+            await asyncio.sleep(delay)
+        msg = "max_attempts must be >= 1"
+        raise ValueError(msg)
@@ -1,8 +1,18 @@
 """ChromaDB vector store management with Gemini embeddings.
 
-Handles indexing job postings and performing similarity search.
+Handles indexing job postings and performing similarity search. Document
+embedding goes through EmbeddingBatcher, which keeps several size- and
+token-bounded batches in flight and backs off adaptively on rate limits.
 """
 
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
 import chromadb
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
@@ -10,6 +20,136 @@ from langchain_core.embeddings import Embeddings
 
 from app.config import get_settings
 from app.schemas.matching import JobPosting
+from app.services.matching.concurrency import is_overloaded
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio used to bound batch token counts
+_CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // _CHARS_PER_TOKEN)
+
+
+@dataclass
+class BatcherStats:
+    """Throughput stats from the most recent EmbeddingBatcher run."""
+
+    documents: int = 0
+    batches: int = 0
+    rate_limited: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+
+class EmbeddingBatcher(Embeddings):
+    """Embeddings wrapper that embeds documents in parallel, adaptively sized batches.
+
+    Documents are split into batches bounded by both ``max_batch_size`` and an
+    estimated ``max_batch_tokens``, and up to ``max_in_flight`` batches are sent
+    concurrently. On a rate-limit error the batch size is halved (AIMD) and the
+    batch is retried after jittered exponential backoff; each success grows the
+    batch size back towards the maximum. Output order always matches input order.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_batch_size: int = 100,
+        max_batch_tokens: int = 20_000,
+        max_in_flight: int = 4,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+    ) -> None:
+        self._embeddings = embeddings
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_batch_tokens = max(1, max_batch_tokens)
+        self._max_in_flight = max(1, max_in_flight)
+        self._max_retries = max_retries
+        self._base_backoff = base_backoff
+        self._batch_size = self._max_batch_size
+        self._lock = threading.Lock()
+        self.last_stats = BatcherStats()
+
+    @property
+    def batch_size(self) -> int:
+        """Current adaptive batch size."""
+        return self._batch_size
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embeddings.embed_query(text)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents with parallel in-flight batches, preserving order."""
+        stats = BatcherStats(documents=len(texts))
+        if not texts:
+            self.last_stats = stats
+            return []
+
+        results: list[list[float] | None] = [None] * len(texts)
+        pending: deque[int] = deque(range(len(texts)))
+        start = time.perf_counter()
+
+        def _next_batch() -> list[int]:
+            with self._lock:
+                batch: list[int] = []
+                tokens = 0
+                while pending and len(batch) < self._batch_size:
+                    cost = _estimate_tokens(texts[pending[0]])
+                    if batch and tokens + cost > self._max_batch_tokens:
+                        break
+                    batch.append(pending.popleft())
+                    tokens += cost
+                return batch
+
+        def _worker() -> None:
+            while batch := _next_batch():
+                attempt = 0
+                while True:
+                    try:
+                        vectors = self._embeddings.embed_documents([texts[i] for i in batch])
+                        break
+                    except Exception as e:
+                        if not is_overloaded(e) or attempt >= self._max_retries:
+                            raise
+                        with self._lock:
+                            stats.rate_limited += 1
+                            self._batch_size = max(1, self._batch_size // 2)
+                            # Shrink this batch too; the remainder goes back on the queue
+                            if len(batch) > self._batch_size:
+                                pending.extendleft(reversed(batch[self._batch_size :]))
+                                batch = batch[: self._batch_size]
+                        wait = self._base_backoff * (2**attempt) * (0.5 + random.random())
+                        logger.warning(
+                            f"Embedding rate limited, batch size now {self._batch_size}, "
+                            f"retrying in {wait:.1f}s"
+                        )
+                        time.sleep(wait)
+                        attempt += 1
+
+                for i, vector in zip(batch, vectors, strict=True):
+                    results[i] = vector
+                with self._lock:
+                    stats.batches += 1
+                    self._batch_size = min(self._max_batch_size, self._batch_size + 1)
+
+        workers = min(self._max_in_flight, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_worker) for _ in range(workers)]
+            for future in futures:
+                future.result()
+
+        stats.seconds = time.perf_counter() - start
+        self.last_stats = stats
+        logger.info(
+            f"Embedded {stats.documents} docs in {stats.batches} batches "
+            f"({stats.docs_per_sec:.1f} docs/sec, {stats.rate_limited} rate-limited)"
+        )
+        return results  # type: ignore[return-value]
 
 
 def _job_to_document(job: JobPosting) -> Document:
@@ -40,15 +180,25 @@ def _job_to_document(job: JobPosting) -> Document:
 
 
 class JobEmbedder:
-    """Manages ChromaDB vector store for job postings."""
+    """Manages ChromaDB vector store for job postings.
+
+    Duplicate detection only queries the IDs of the incoming batch, backed by an
+    in-process set of IDs known to be indexed, so indexing cost scales with the
+    batch rather than with the whole collection.
+    """
 
     COLLECTION_NAME = "job_postings"
 
+    # Max IDs per existence lookup against Chroma
+    ID_LOOKUP_CHUNK = 500
+
     def __init__(
         self,
         embeddings: Embeddings,
         chroma_client: chromadb.ClientAPI | None = None,
         persist_directory: str | None = None,
+        embed_batch_size: int = 100,
+        embed_max_in_flight: int = 4,
     ) -> None:
         if chroma_client is not None:
             self._client = chroma_client
@@ -60,11 +210,22 @@ class JobEmbedder:
                 path=str(settings.chroma_db_dir),
             )
 
+        self._batcher = EmbeddingBatcher(
+            embeddings,
+            max_batch_size=embed_batch_size,
+            max_in_flight=embed_max_in_flight,
+        )
         self._vectorstore = Chroma(
             client=self._client,
             collection_name=self.COLLECTION_NAME,
-            embedding_function=embeddings,
+            embedding_function=self._batcher,
         )
+        self._known_ids: set[str] = set()
+
+    @property
+    def batcher(self) -> EmbeddingBatcher:
+        """Access the document embedding batcher (throughput stats in ``last_stats``)."""
+        return self._batcher
 
     @property
     def vectorstore(self) -> Chroma:
@@ -76,6 +237,19 @@ class JobEmbedder:
         collection = self._client.get_or_create_collection(self.COLLECTION_NAME)
         return collection.count()
 
+    def _existing_ids(self, collection, candidate_ids: list[str]) -> set[str]:
+        """Return which candidate IDs are already indexed.
+
+        IDs seen before are answered from the in-process set; only unknown IDs
+        are looked up in Chroma, without fetching documents or metadata.
+        """
+        unknown = [i for i in dict.fromkeys(candidate_ids) if i not in self._known_ids]
+        for start in range(0, len(unknown), self.ID_LOOKUP_CHUNK):
+            chunk = unknown[start : start + self.ID_LOOKUP_CHUNK]
+            found = collection.get(ids=chunk, include=[])["ids"]
+            self._known_ids.update(found)
+        return {i for i in candidate_ids if i in self._known_ids}
+
     def index_jobs(self, jobs: list[JobPosting]) -> int:
         """Index job postings into ChromaDB, skipping duplicates.
 
@@ -85,20 +259,26 @@ class JobEmbedder:
         Returns:
             Number of newly indexed jobs.
         """
+        if not jobs:
+            return 0
+
         collection = self._client.get_or_create_collection(self.COLLECTION_NAME)
-        existing_ids = set(collection.get()["ids"])
+        candidate_ids = [f"{job.source}:{job.external_id}" for job in jobs]
+        existing_ids = self._existing_ids(collection, candidate_ids)
 
         new_docs: list[Document] = []
         new_ids: list[str] = []
 
-        for job in jobs:
-            doc_id = f"{job.source}:{job.external_id}"
+        for job, doc_id in zip(jobs, candidate_ids, strict=True):
             if doc_id not in existing_ids:
+                # Also skips repeats within the same batch
+                existing_ids.add(doc_id)
                 new_docs.append(_job_to_document(job))
                 new_ids.append(doc_id)
 
         if new_docs:
             self._vectorstore.add_documents(new_docs, ids=new_ids)
+            self._known_ids.update(new_ids)
 
         return len(new_docs)
 
@@ -0,0 +1,236 @@
+"""Per-stage timing and token instrumentation for the matching pipeline.
+
+A PipelineReport collects one StageMetrics entry per pipeline stage (wall time,
+items in/out, LLM calls, tokens, estimated cost). It can be serialized to a dict,
+appended to a JSONL file, rendered in the Prometheus text exposition format, or
+replayed as OpenTelemetry spans.
+
+Usage:
+    report = PipelineReport(model="claude-sonnet-4-6")
+    with report.stage("pre_filter", items_in=len(jobs)) as stage:
+        jobs = pre_filter.filter(jobs)
+        stage.items_out = len(jobs)
+    report.finish()
+"""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Approximate USD per million tokens: (input, output, cache read, cache write).
+# Keyed by model-name prefix; used for cost estimates only.
+MODEL_PRICING: dict[str, tuple[float, float, float, float]] = {
+    "claude-opus": (15.0, 75.0, 1.50, 18.75),
+    "claude-sonnet": (3.0, 15.0, 0.30, 3.75),
+    "claude-haiku": (0.80, 4.0, 0.08, 1.0),
+    "gemini": (0.30, 2.50, 0.075, 0.30),
+}
+
+PROMETHEUS_PREFIX = "matching_pipeline"
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float:
+    """Estimate the USD cost of a token count for a model (0.0 if the model is unknown).
+
+    ``input_tokens`` is the total input count as reported by LangChain, which
+    already includes cache reads and writes; those are re-priced at their own rates.
+    """
+    pricing = next((p for prefix, p in MODEL_PRICING.items() if model.startswith(prefix)), None)
+    if pricing is None:
+        return 0.0
+    in_rate, out_rate, read_rate, write_rate = pricing
+    uncached = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+    cost = (
+        uncached * in_rate
+        + output_tokens * out_rate
+        + cache_read_tokens * read_rate
+        + cache_write_tokens * write_rate
+    )
+    return cost / 1_000_000
+
+
+@dataclass
+class StageMetrics:
+    """Measurements for one pipeline stage."""
+
+    name: str
+    started_at: float = 0.0  # unix timestamp
+    seconds: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add_usage(self, usage: Any, model: str = "") -> None:
+        """Add token counts from a ScoringUsage-like object and price them."""
+        self.llm_calls += usage.calls
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.cache_read_tokens += usage.cache_read_tokens
+        self.cache_write_tokens += usage.cache_write_tokens
+        self.cost_usd += estimate_cost(
+            model,
+            usage.input_tokens,
+            usage.output_tokens,
+            usage.cache_read_tokens,
+            usage.cache_write_tokens,
+        )
+
+
+@dataclass
+class PipelineReport:
+    """Per-stage breakdown of a single MatchingPipeline.match() run."""
+
+    model: str = ""
+    started_at: float = field(default_factory=time.time)
+    total_seconds: float = 0.0
+    stages: list[StageMetrics] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str, items_in: int = 0) -> Iterator[StageMetrics]:
+        """Time a stage; the yielded StageMetrics can be filled in by the caller."""
+        metrics = StageMetrics(name=name, started_at=time.time(), items_in=items_in)
+        self.stages.append(metrics)
+        start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.seconds = time.perf_counter() - start
+
+    def get(self, name: str) -> StageMetrics | None:
+        """Return the metrics for a stage by name, if it ran."""
+        return next((s for s in self.stages if s.name == name), None)
+
+    def finish(self) -> None:
+        """Record total wall time since the report was created."""
+        self.total_seconds = time.time() - self.started_at
+
+    @property
+    def llm_calls(self) -> int:
+        return sum(s.llm_calls for s in self.stages)
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(s.input_tokens for s in self.stages)
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(s.output_tokens for s in self.stages)
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(s.cost_usd for s in self.stages)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, including run totals."""
+        return {
+            "model": self.model,
+            "started_at": self.started_at,
+            "total_seconds": round(self.total_seconds, 4),
+            "llm_calls": self.llm_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def summary(self) -> str:
+        """One-line human-readable breakdown for logs."""
+        parts = [
+            f"{s.name}={s.seconds:.2f}s ({s.items_in}->{s.items_out})" for s in self.stages
+        ]
+        return (
+            f"total={self.total_seconds:.2f}s, {self.llm_calls} LLM calls, "
+            f"${self.cost_usd:.4f} | " + ", ".join(parts)
+        )
+
+    def append_jsonl(self, path: Path | str) -> None:
+        """Append this report as one JSON line to a file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(self.to_dict()) + "\n")
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """Render the report in the Prometheus text exposition format.
+
+        Stage metrics are gauges labelled by stage, describing the latest run.
+        """
+        gauges = [
+            ("stage_seconds", "Wall time of the stage in seconds", "seconds"),
+            ("stage_items_in", "Items entering the stage", "items_in"),
+            ("stage_items_out", "Items leaving the stage", "items_out"),
+            ("stage_llm_calls", "LLM calls made by the stage", "llm_calls"),
+            ("stage_input_tokens", "LLM input tokens used by the stage", "input_tokens"),
+            ("stage_output_tokens", "LLM output tokens used by the stage", "output_tokens"),
+            ("stage_cache_read_tokens", "Prompt-cache read tokens", "cache_read_tokens"),
+            ("stage_cache_write_tokens", "Prompt-cache write tokens", "cache_write_tokens"),
+            ("stage_cost_usd", "Estimated LLM cost of the stage in USD", "cost_usd"),
+        ]
+        lines: list[str] = []
+        for metric, help_text, attr in gauges:
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for s in self.stages:
+                lines.append(f'{name}{{stage="{s.name}"}} {getattr(s, attr)}')
+        name = f"{prefix}_total_seconds"
+        lines.append(f"# HELP {name} Wall time of the whole run in seconds")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {self.total_seconds}")
+        return "\n".join(lines) + "\n"
+
+    def export_otel_spans(self, tracer: Any = None) -> None:
+        """Replay the report as an OpenTelemetry span tree (one child span per stage).
+
+        Requires the optional ``otel`` extra (``opentelemetry-api``). Without a
+        configured SDK/exporter the spans are no-ops.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            msg = (
+                "export_otel_spans() requires opentelemetry-api; "
+                "install the 'otel' extra (pip install 'job-application-agent[otel]')"
+            )
+            raise ImportError(msg) from e
+
+        if tracer is None:
+            tracer = trace.get_tracer(__name__)
+
+        root_start = int(self.started_at * 1e9)
+        root = tracer.start_span("matching_pipeline.match", start_time=root_start)
+        root.set_attribute("pipeline.model", self.model)
+        root.set_attribute("pipeline.llm_calls", self.llm_calls)
+        root.set_attribute("pipeline.cost_usd", self.cost_usd)
+        ctx = trace.set_span_in_context(root)
+        for s in self.stages:
+            start_ns = int(s.started_at * 1e9)
+            span = tracer.start_span(
+                f"matching_pipeline.{s.name}", context=ctx, start_time=start_ns
+            )
+            for key, value in asdict(s).items():
+                if key not in ("name", "started_at"):
+                    span.set_attribute(f"stage.{key}", value)
+            span.end(end_time=start_ns + int(s.seconds * 1e9))
+        root.end(end_time=root_start + int(self.total_seconds * 1e9))
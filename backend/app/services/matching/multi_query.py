@@ -11,6 +11,7 @@ from langchain_core.documents import Document
 from langchain_core.language_models import BaseChatModel
 
 from app.services.matching.retriever import TwoStageRetriever
+from app.services.matching.scorer import ScoringUsage
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,20 @@ class MultiQueryRetriever:
         self._retriever = retriever
         self._llm = llm
         self._num_queries = num_queries
+        self._model_name = str(
+            getattr(llm, "model", None) or getattr(llm, "model_name", None) or ""
+        )
+        self._usage = ScoringUsage()
+
+    @property
+    def model_name(self) -> str:
+        """Name of the query-generation model (used in cost estimates)."""
+        return self._model_name
+
+    def reset_usage(self) -> ScoringUsage:
+        """Return the token usage of generate_queries() calls and start a fresh counter."""
+        usage, self._usage = self._usage, ScoringUsage()
+        return usage
 
     async def generate_queries(self, original_query: str) -> list[str]:
         """Generate alternative search queries using Gemini."""
@@ -45,6 +60,7 @@ class MultiQueryRetriever:
             response = await self._llm.ainvoke(
                 _QUERY_GEN_PROMPT.format(query=original_query, n=self._num_queries)
             )
+            self._usage.add(getattr(response, "usage_metadata", None))
             content = response.content if hasattr(response, "content") else str(response)
             text = content if isinstance(content, str) else str(content)
             # Gemini sometimes returns single-quoted JSON; normalize to double quotes
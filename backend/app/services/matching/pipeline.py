@@ -6,14 +6,22 @@ Combines all stages: pre-filter → embed → retrieve → quick-score → full-
 import asyncio
 import logging
 import re
+import time
+import warnings
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import aclosing
+from pathlib import Path
 
 from langchain_core.documents import Document
 
-from app.config import MatchingWeights, UserConfig
+from app.config import MatchingWeights, UserConfig, get_settings
 from app.schemas.matching import JobPosting, ScoredMatch
+from app.services.cache.scores import get_score_cache
 from app.services.llm_factory import LLMTask, get_embeddings, get_llm
-from app.services.matching.ats_scorer import compute_ats_score
+from app.services.matching.ats_scorer import compute_ats_scores_batch
+from app.services.matching.concurrency import AdaptiveLimiter
 from app.services.matching.embedder import JobEmbedder
+from app.services.matching.instrumentation import PipelineReport, StageMetrics
 from app.services.matching.multi_query import MultiQueryRetriever
 from app.services.matching.pre_filter import JobPreFilter
 from app.services.matching.retriever import TwoStageRetriever, compute_dynamic_k
@@ -24,6 +32,22 @@ logger = logging.getLogger(__name__)
 # Minimum quick-score relevance to proceed to full scoring
 QUICK_SCORE_THRESHOLD = 4
 
+# Jobs packed into one batched quick-score prompt (1 = one LLM call per job)
+DEFAULT_QUICK_SCORE_BATCH_SIZE = 8
+
+# Jobs passed to match(): a list, or an async stream of chunks consumed incrementally
+JobSource = list[JobPosting] | AsyncGenerator[list[JobPosting]]
+
+# Loads full postings for (external_id, source) keys; used to resolve streamed jobs
+JobLoader = Callable[[list[tuple[str, str]]], Awaitable[list[JobPosting]]]
+
+# Adaptive LLM concurrency shared by quick-score and full-score
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Attempts per full-score call before the job is dropped
+SCORE_MAX_ATTEMPTS = 3
+
 
 def _doc_metadata_to_job(doc: Document, jobs_by_id: dict[str, JobPosting]) -> JobPosting | None:
     """Resolve a retrieved Document back to its JobPosting."""
@@ -63,7 +87,7 @@ def _weights_to_percentages(weights: MatchingWeights) -> dict[str, int]:
     }
 
 
-def _compute_integrated_score(
+def compute_integrated_score(
     llm_score: float,
     ats_score: float,
     requirements_met_ratio: float | None = None,
@@ -94,6 +118,10 @@ def _compute_integrated_score(
     )
 
 
+# Former private name, kept for existing imports
+_compute_integrated_score = compute_integrated_score
+
+
 class MatchingPipeline:
     """Orchestrates the full job matching pipeline.
 
@@ -101,9 +129,13 @@ class MatchingPipeline:
         0. Pre-filter jobs (seniority, location, employment type)
         1. Index filtered jobs into ChromaDB with Gemini embeddings
         2. Two-stage retrieval with focused query
-        3. Quick-score all reranked candidates (parallel, cheap)
+        3. Quick-score all reranked candidates (batched, parallel, cheap)
         4. Full-score only candidates with relevance >= threshold (parallel, expensive)
-        5. Sort by overall_score descending
+        5. Sort by integrated_score descending (overall_score when it is unset)
+
+    Steps 3 and 4 share one AdaptiveLimiter, which raises LLM concurrency while
+    call latency (``scoring_latency_target``) and error rate are healthy and backs
+    off on 429/overload responses or sustained failures.
     """
 
     def __init__(
@@ -113,28 +145,59 @@ class MatchingPipeline:
         user_config: UserConfig | None = None,
         initial_k: int = 30,
         final_k: int = 10,
-        score_concurrency: int = 1,
-        quick_score_concurrency: int = 5,
+        quick_score_batch_size: int = DEFAULT_QUICK_SCORE_BATCH_SIZE,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        limiter: AdaptiveLimiter | None = None,
+        metrics_path: Path | str | None = None,
+        score_concurrency: int | None = None,
+        quick_score_concurrency: int | None = None,
     ) -> None:
+        # Deprecated fixed-semaphore sizes: now just the limiter's starting point
+        legacy = [c for c in (score_concurrency, quick_score_concurrency) if c is not None]
+        if legacy:
+            warnings.warn(
+                "score_concurrency and quick_score_concurrency are deprecated; "
+                "use initial_concurrency/max_concurrency",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            initial_concurrency = max(legacy)
+
         # Embedder (ChromaDB + Gemini)
         if embedder is not None:
             self._embedder = embedder
         else:
-            self._embedder = JobEmbedder(embeddings=get_embeddings("retrieval_document"))
+            self._embedder = JobEmbedder(
+                embeddings=get_embeddings("retrieval_document", cached=True),
+            )
 
         # Scorer (Claude LLM-as-Judge)
         if scorer is not None:
             self._scorer = scorer
         else:
-            self._scorer = JobScorer(llm=get_llm(LLMTask.SCORE))
+            self._scorer = JobScorer(llm=get_llm(LLMTask.SCORE), cache=get_score_cache())
 
         # User config
         self._user_config = user_config
 
         self._initial_k = initial_k
         self._final_k = final_k
-        self._score_concurrency = score_concurrency
-        self._quick_score_concurrency = quick_score_concurrency
+        self._limiter = limiter or AdaptiveLimiter(
+            initial_limit=initial_concurrency,
+            max_limit=max_concurrency,
+            latency_target=get_settings().scoring_latency_target,
+            name="scoring",
+        )
+        self._quick_score_batch_size = max(1, quick_score_batch_size)
+        # Per-stage timings/tokens of the latest match() run, optionally appended as JSONL
+        self._metrics_path = Path(metrics_path) if metrics_path else None
+        self.last_report: PipelineReport | None = None
+
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        """The adaptive concurrency limiter shared by quick- and full-scoring."""
+        return self._limiter
 
     def index_jobs(self, jobs: list[JobPosting]) -> int:
         """Index jobs into the vector store."""
@@ -161,30 +224,95 @@ class MatchingPipeline:
 
         return " ".join(parts) if parts else resume_text
 
+    def _record_scorer_usage(self, stage: StageMetrics, model: str) -> None:
+        """Move the scorer's accumulated token usage into a stage's metrics."""
+        stage.add_usage(self._scorer.reset_usage(), model)
+
     async def match(
         self,
         resume_text: str,
-        jobs: list[JobPosting] | None = None,
+        jobs: JobSource | None = None,
         target_title: str | None = None,
+        load_jobs: JobLoader | None = None,
     ) -> list[ScoredMatch]:
         """Run the full matching pipeline.
 
+        Per-stage instrumentation for the run is kept in ``last_report``; use
+        match_with_report() to receive it directly.
+
         Args:
             resume_text: The candidate's resume text.
-            jobs: Optional list of jobs to index first. If None, uses existing index.
+            jobs: Optional jobs to index first, either a list or an async generator
+                of chunks (pre-filtered and indexed as each chunk arrives, keeping
+                only survivor keys in memory). If None, uses existing index.
             target_title: The job title being searched for (e.g. "Software Engineer").
+            load_jobs: For streamed jobs, loads the full postings of retrieved
+                survivors by (external_id, source). Without it they are rebuilt
+                from the indexed documents.
+
+        Returns:
+            List of ScoredMatch objects sorted by integrated_score descending.
+        """
+        matches, _ = await self.match_with_report(resume_text, jobs, target_title, load_jobs)
+        return matches
+
+    async def match_with_report(
+        self,
+        resume_text: str,
+        jobs: JobSource | None = None,
+        target_title: str | None = None,
+        load_jobs: JobLoader | None = None,
+    ) -> tuple[list[ScoredMatch], PipelineReport]:
+        """Run the full matching pipeline and return its per-stage report.
 
         Returns:
-            List of ScoredMatch objects sorted by overall_score descending.
+            Tuple of (matches sorted by score, PipelineReport with wall time, item
+            counts, LLM calls, tokens and estimated cost per stage).
         """
+        report = PipelineReport(model=self._scorer.model_name)
+        try:
+            matches = await self._run(report, resume_text, jobs, target_title, load_jobs)
+        finally:
+            report.finish()
+            self.last_report = report
+            logger.info(f"Pipeline report: {report.summary()}")
+            if self._metrics_path is not None:
+                try:
+                    report.append_jsonl(self._metrics_path)
+                except OSError as e:
+                    logger.warning(f"Failed to persist pipeline metrics: {e}")
+        return matches, report
+
+    async def _run(
+        self,
+        report: PipelineReport,
+        resume_text: str,
+        jobs: JobSource | None,
+        target_title: str | None,
+        load_jobs: JobLoader | None,
+    ) -> list[ScoredMatch]:
+        # Steps 0-1 chunk by chunk for streamed job sources
+        if jobs is not None and not isinstance(jobs, list):
+            survivor_keys = await self._ingest_chunks(report, jobs, target_title)
+            if self._embedder.get_collection_count() == 0:
+                logger.warning("No jobs in vector store, returning empty results")
+                return []
+            return await self._retrieve_and_score(
+                report, resume_text, None, target_title, survivor_keys, load_jobs
+            )
+
         # Step 0: Pre-filter jobs if we have config and jobs
         if jobs and self._user_config:
-            pre_filter = JobPreFilter(self._user_config)
-            jobs = pre_filter.filter(jobs, target_title=target_title)
+            with report.stage("pre_filter", items_in=len(jobs)) as stage:
+                pre_filter = JobPreFilter(self._user_config)
+                jobs = pre_filter.filter(jobs, target_title=target_title)
+                stage.items_out = len(jobs)
 
         # Step 1: Index new jobs if provided
         if jobs:
-            new_count = self.index_jobs(jobs)
+            with report.stage("index", items_in=len(jobs)) as stage:
+                new_count = self.index_jobs(jobs)
+                stage.items_out = new_count
             logger.info(f"Indexed {new_count} new jobs")
 
         # Check if vectorstore has any documents
@@ -192,6 +320,71 @@ class MatchingPipeline:
             logger.warning("No jobs in vector store, returning empty results")
             return []
 
+        return await self._retrieve_and_score(report, resume_text, jobs, target_title)
+
+    async def _ingest_chunks(
+        self,
+        report: PipelineReport,
+        chunks: AsyncGenerator[list[JobPosting]],
+        target_title: str | None,
+    ) -> set[tuple[str, str]]:
+        """Pre-filter and index streamed job chunks as they arrive.
+
+        Only the (external_id, source) keys of pre-filter survivors are retained,
+        so memory does not grow with the job table. Indexing runs in a worker
+        thread to keep the event loop (and the source's open cursor) responsive.
+        The source is closed on exit, even if filtering or indexing raises, so a
+        database-backed stream releases its connection. Stage timings and counts
+        are accumulated across chunks.
+
+        Returns:
+            Keys of the jobs that passed the pre-filter.
+        """
+        pre_filter = JobPreFilter(self._user_config) if self._user_config else None
+        load = StageMetrics(name="load", started_at=time.time())
+        filtered = StageMetrics(name="pre_filter", started_at=time.time())
+        index = StageMetrics(name="index", started_at=time.time())
+        report.stages.extend([load, filtered, index] if pre_filter else [load, index])
+
+        survivors: set[tuple[str, str]] = set()
+        mark = time.perf_counter()
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                now = time.perf_counter()
+                load.seconds += now - mark
+                load.items_out += len(chunk)
+
+                if pre_filter is not None:
+                    filtered.items_in += len(chunk)
+                    chunk = pre_filter.filter(chunk, target_title=target_title)
+                    filtered.items_out += len(chunk)
+                    filtered.seconds += time.perf_counter() - now
+
+                if chunk:
+                    started = time.perf_counter()
+                    index.items_in += len(chunk)
+                    index.items_out += await asyncio.to_thread(self.index_jobs, chunk)
+                    index.seconds += time.perf_counter() - started
+                    survivors.update((job.external_id, job.source) for job in chunk)
+                mark = time.perf_counter()
+        load.seconds += time.perf_counter() - mark
+
+        load.items_in = load.items_out
+        logger.info(
+            f"Streamed {load.items_out} jobs: {len(survivors)} passed pre-filter, "
+            f"indexed {index.items_out} new"
+        )
+        return survivors
+
+    async def _retrieve_and_score(
+        self,
+        report: PipelineReport,
+        resume_text: str,
+        jobs: list[JobPosting] | None,
+        target_title: str | None,
+        survivor_keys: set[tuple[str, str]] | None = None,
+        load_jobs: JobLoader | None = None,
+    ) -> list[ScoredMatch]:
         # Step 2: Two-stage retrieval with focused query
         # Use dynamic k based on collection size, unless explicitly overridden
         collection_size = self._embedder.get_collection_count()
@@ -220,21 +413,42 @@ class MatchingPipeline:
         enable_multi_query = (
             self._user_config.enable_multi_query if self._user_config else False
         )
+        mq: MultiQueryRetriever | None = None
+        alt_queries: list[str] = []
         if enable_multi_query:
-            try:
-                llm = get_llm(LLMTask.CLASSIFY)  # Gemini (cheap)
-                mq = MultiQueryRetriever(retriever=retriever, llm=llm)
-                alt_queries = await mq.generate_queries(query)
-                retrieved_docs = mq.retrieve(query, alternative_queries=alt_queries)
-            except Exception as e:
-                logger.warning(f"Multi-query retrieval failed, falling back: {e}")
+            with report.stage("multi_query", items_in=1) as stage:
+                try:
+                    llm = get_llm(LLMTask.CLASSIFY)  # Gemini (cheap)
+                    mq = MultiQueryRetriever(retriever=retriever, llm=llm)
+                    alt_queries = await mq.generate_queries(query)
+                    stage.items_out = len(alt_queries)
+                except Exception as e:
+                    logger.warning(f"Multi-query generation failed, falling back: {e}")
+                    mq = None
+                else:
+                    stage.add_usage(mq.reset_usage(), mq.model_name)
+
+        # The reranker runs inside the retriever, so retrieval and rerank share a stage
+        with report.stage("retrieve_rerank", items_in=collection_size) as stage:
+            if mq is not None:
+                try:
+                    retrieved_docs = mq.retrieve(query, alternative_queries=alt_queries)
+                except Exception as e:
+                    logger.warning(f"Multi-query retrieval failed, falling back: {e}")
+                    retrieved_docs = retriever.retrieve(query)
+            else:
                 retrieved_docs = retriever.retrieve(query)
-        else:
-            retrieved_docs = retriever.retrieve(query)
+            stage.items_out = len(retrieved_docs)
 
         logger.info(f"Retrieved {len(retrieved_docs)} candidates after reranking")
 
-        # Build lookup from indexed jobs
+        # Build lookup from indexed jobs; streamed survivors are loaded by key
+        if survivor_keys and load_jobs is not None:
+            retrieved_keys = [
+                (doc.metadata.get("job_id", ""), doc.metadata.get("source", ""))
+                for doc in retrieved_docs
+            ]
+            jobs = await load_jobs([k for k in retrieved_keys if k in survivor_keys])
         jobs_by_id: dict[str, JobPosting] = {}
         if jobs:
             for job in jobs:
@@ -280,106 +494,152 @@ class MatchingPipeline:
 
         # Step 3: Quick-score all candidates (cheap, parallel)
         resume_summary = _extract_skills_section(resume_text) or resume_text[:500]
-        qs_sem = asyncio.Semaphore(self._quick_score_concurrency)
+        limiter = self._limiter
 
         async def _quick_score_one(job: JobPosting) -> tuple[JobPosting, int, str]:
-            async with qs_sem:
-                try:
-                    relevance, reason = await self._scorer.quick_score(
+            try:
+                relevance, reason = await limiter.call(
+                    lambda: self._scorer.quick_score(
                         resume_summary=resume_summary,
                         job_title=job.title,
                         job_company=job.company,
                         job_description=job.description,
                         target_role=target_role,
                         experience_level=experience_level,
-                    )
-                    return (job, relevance, reason)
-                except Exception as e:
-                    logger.warning(f"Quick-score failed for '{job.title}': {e}")
-                    # On failure, give benefit of the doubt
-                    return (job, QUICK_SCORE_THRESHOLD, "quick-score error")
-
-        quick_results = await asyncio.gather(*[_quick_score_one(j) for j in resolved_jobs])
-
-        # Filter by quick-score threshold
-        candidates = []
-        skipped = 0
-        for job, relevance, reason in quick_results:
-            if relevance >= QUICK_SCORE_THRESHOLD:
-                candidates.append(job)
+                    ),
+                    max_attempts=2,
+                )
+                return (job, relevance, reason)
+            except Exception as e:
+                logger.warning(f"Quick-score failed for '{job.title}': {e}")
+                # On failure, give benefit of the doubt
+                return (job, QUICK_SCORE_THRESHOLD, "quick-score error")
+
+        async def _quick_score_batch(
+            batch: list[JobPosting],
+        ) -> list[tuple[JobPosting, int, str]]:
+            try:
+                scores = await limiter.call(
+                    lambda: self._scorer.quick_score_batch(
+                        resume_summary=resume_summary,
+                        jobs=batch,
+                        target_role=target_role,
+                        experience_level=experience_level,
+                        fallback=False,
+                    ),
+                    max_attempts=2,
+                )
+            except Exception as e:
+                logger.warning(f"Quick-score failed for batch of {len(batch)}: {e}")
+                return [(job, QUICK_SCORE_THRESHOLD, "quick-score error") for job in batch]
+
+            # Jobs the batch response did not cover are retried one by one, each
+            # taking its own limiter slot
+            missing = [i for i, score in enumerate(scores) if score is None]
+            retried = dict(zip(
+                missing,
+                await asyncio.gather(*[_quick_score_one(batch[i]) for i in missing]),
+                strict=True,
+            ))
+            return [
+                retried[i] if score is None else (job, *score)
+                for i, (job, score) in enumerate(zip(batch, scores, strict=True))
+            ]
+
+        with report.stage("quick_score", items_in=len(resolved_jobs)) as stage:
+            self._scorer.reset_usage()
+            batch_size = self._quick_score_batch_size
+            if batch_size > 1:
+                batches = [
+                    resolved_jobs[i : i + batch_size]
+                    for i in range(0, len(resolved_jobs), batch_size)
+                ]
+                batch_results = await asyncio.gather(*[_quick_score_batch(b) for b in batches])
+                quick_results = [r for batch in batch_results for r in batch]
             else:
-                skipped += 1
-                logger.debug(f"Skipped '{job.title}' (quick-score {relevance}: {reason})")
+                quick_results = await asyncio.gather(
+                    *[_quick_score_one(j) for j in resolved_jobs]
+                )
 
-        if skipped > 0:
-            logger.info(
-                f"Quick-score: {len(resolved_jobs)} → {len(candidates)} "
-                f"(skipped {skipped} below threshold {QUICK_SCORE_THRESHOLD})"
-            )
+            # Filter by quick-score threshold
+            candidates = []
+            skipped = 0
+            for job, relevance, reason in quick_results:
+                if relevance >= QUICK_SCORE_THRESHOLD:
+                    candidates.append(job)
+                else:
+                    skipped += 1
+                    logger.debug(f"Skipped '{job.title}' (quick-score {relevance}: {reason})")
+
+            if skipped > 0:
+                logger.info(
+                    f"Quick-score: {len(resolved_jobs)} → {len(candidates)} "
+                    f"(skipped {skipped} below threshold {QUICK_SCORE_THRESHOLD})"
+                )
+            stage.items_out = len(candidates)
+            self._record_scorer_usage(stage, report.model)
 
         # Step 4: Full-score surviving candidates with Claude
-        sem = asyncio.Semaphore(self._score_concurrency)
-
         async def _score_one(job: JobPosting) -> ScoredMatch | None:
-            async with sem:
-                for attempt in range(3):
-                    try:
-                        score = await self._scorer.score(
-                            resume_text=resume_text,
-                            job_title=job.title,
-                            job_company=job.company,
-                            job_description=job.description,
-                            job_location=job.location or "Not specified",
-                            job_requirements=job.requirements or "Not specified",
-                            job_salary=(
-                                f"${job.salary_min:,} - ${job.salary_max:,}"
-                                if job.salary_min and job.salary_max
-                                else "Not specified"
-                            ),
-                            preferred_locations=preferred_locations,
-                            salary_range=salary_range,
-                            target_role=target_role,
-                            experience_level=experience_level,
-                            workplace_types=workplace_types,
-                            weights=weights_pct,
-                        )
-                        return ScoredMatch(job=job, score=score)
-                    except Exception as e:
-                        if attempt < 2:
-                            wait = 2 ** attempt
-                            logger.warning(
-                                f"Score attempt {attempt+1} failed for "
-                                f"'{job.title}' at {job.company}, "
-                                f"retrying in {wait}s: {e}"
-                            )
-                            await asyncio.sleep(wait)
-                        else:
-                            logger.error(
-                                f"Scoring failed for '{job.title}' at "
-                                f"{job.company} after 3 attempts: {e}"
-                            )
-                            return None
-
-        results = await asyncio.gather(*[_score_one(j) for j in candidates])
-        scored_matches = [m for m in results if m is not None]
+            try:
+                score = await limiter.call(
+                    lambda: self._scorer.score(
+                        resume_text=resume_text,
+                        job_title=job.title,
+                        job_company=job.company,
+                        job_description=job.description,
+                        job_location=job.location or "Not specified",
+                        job_requirements=job.requirements or "Not specified",
+                        job_salary=(
+                            f"${job.salary_min:,} - ${job.salary_max:,}"
+                            if job.salary_min and job.salary_max
+                            else "Not specified"
+                        ),
+                        preferred_locations=preferred_locations,
+                        salary_range=salary_range,
+                        target_role=target_role,
+                        experience_level=experience_level,
+                        workplace_types=workplace_types,
+                        weights=weights_pct,
+                    ),
+                    max_attempts=SCORE_MAX_ATTEMPTS,
+                )
+                return ScoredMatch(job=job, score=score)
+            except Exception as e:
+                logger.error(
+                    f"Scoring failed for '{job.title}' at "
+                    f"{job.company} after {SCORE_MAX_ATTEMPTS} attempts: {e}"
+                )
+                return None
+
+        with report.stage("full_score", items_in=len(candidates)) as stage:
+            results = await asyncio.gather(*[_score_one(j) for j in candidates])
+            scored_matches = [m for m in results if m is not None]
+            stage.items_out = len(scored_matches)
+            self._record_scorer_usage(stage, report.model)
+        logger.info(f"Scoring limiter: {limiter.metrics()}")
 
         # Step 4.5: Compute ATS scores and integrated scores
-        for match in scored_matches:
+        with report.stage("ats", items_in=len(scored_matches)) as stage:
+            # Resume keywords are extracted once and reused for every job
             try:
-                ats = compute_ats_score(
-                    resume_text=resume_text,
-                    job_description=match.job.description,
-                    job_requirements=match.job.requirements,
+                ats_scores = compute_ats_scores_batch(
+                    resume_text, [m.job for m in scored_matches]
                 )
+            except Exception as e:
+                logger.warning(f"ATS scoring failed for {len(scored_matches)} matches: {e}")
+                ats_scores = [None] * len(scored_matches)
+            for match, ats in zip(scored_matches, ats_scores, strict=True):
+                if ats is None:
+                    match.integrated_score = match.score.overall_score
+                    continue
                 match.ats_score = ats
-                match.integrated_score = _compute_integrated_score(
+                match.integrated_score = compute_integrated_score(
                     llm_score=match.score.overall_score,
                     ats_score=ats.score,
                     requirements_met_ratio=match.score.requirements_met_ratio,
                 )
-            except Exception as e:
-                logger.warning(f"ATS scoring failed for '{match.job.title}': {e}")
-                match.integrated_score = match.score.overall_score
+            stage.items_out = len(scored_matches)
 
         # Step 5: Sort by integrated score (fallback to overall_score)
         scored_matches.sort(
@@ -1,10 +1,15 @@
 """Pre-filter module to remove obviously irrelevant jobs before expensive scoring.
 
 Applies fast heuristic filters: seniority level, location, and employment type.
+Patterns are compiled once (per module or per UserConfig) and batches are
+evaluated column by column, computing each check once per distinct value.
 """
 
 import logging
 import re
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
 
 from app.config import UserConfig
 from app.schemas.matching import JobPosting
@@ -37,6 +42,25 @@ _SENIORITY_KEYWORDS: list[tuple[str, int, bool]] = [
     (" cio", 8, False),
 ]
 
+_SENIORITY_LEVELS: dict[str, int] = {kw: level for kw, level, _ in _SENIORITY_KEYWORDS}
+
+
+def _compile_seniority_pattern() -> re.Pattern[str]:
+    """One alternation over all seniority keywords, wrapped in a lookahead.
+
+    The zero-width lookahead reports a match at every position, so overlapping
+    keywords (e.g. "sr " followed by " cto") are all seen; the most senior
+    alternatives come first so each position yields its highest level.
+    """
+    ordered = sorted(_SENIORITY_KEYWORDS, key=lambda k: -k[1])
+    parts = [rf"\b{re.escape(kw)}\b" if wb else re.escape(kw) for kw, _, wb in ordered]
+    return re.compile(f"(?=({'|'.join(parts)}))")
+
+
+_SENIORITY_RE = _compile_seniority_pattern()
+
+_REMOTE_RE = re.compile("remote|anywhere|distributed|work from home")
+
 # Maps user experience_level to the acceptable seniority range (min_level, max_level)
 _LEVEL_RANGES: dict[str, tuple[int, int]] = {
     "entry": (0, 2),      # intern, junior, mid
@@ -67,18 +91,8 @@ _EMPLOYMENT_ALIASES: dict[str, str] = {
 def _detect_seniority(title: str) -> int | None:
     """Detect seniority level from job title. Returns None if undetectable."""
     title_lower = f" {title.lower()} "  # pad for word boundary matching
-    detected: int | None = None
-    for keyword, level, word_boundary in _SENIORITY_KEYWORDS:
-        if word_boundary:
-            # Check as whole word using word boundaries
-            if re.search(rf"\b{re.escape(keyword)}\b", title_lower):
-                if detected is None or level > detected:
-                    detected = level
-        else:
-            if keyword in title_lower:
-                if detected is None or level > detected:
-                    detected = level
-    return detected
+    levels = [_SENIORITY_LEVELS[m.group(1)] for m in _SENIORITY_RE.finditer(title_lower)]
+    return max(levels, default=None)
 
 
 def _normalize_employment_type(raw: str) -> str:
@@ -87,6 +101,48 @@ def _normalize_employment_type(raw: str) -> str:
     return _EMPLOYMENT_ALIASES.get(raw_lower, raw.upper())
 
 
+def _substring_pattern(needles: Sequence[str]) -> re.Pattern[str] | None:
+    """Compile lowercase ``needles`` into one substring-alternation regex."""
+    unique = sorted({n.lower() for n in needles}, key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(n) for n in unique))
+
+
+class _LocationMatcher:
+    """User location preferences preprocessed into a single token regex."""
+
+    def __init__(self, user_locations: Sequence[str]) -> None:
+        user_lower = [u.lower() for u in user_locations]
+        # If user wants remote, also allow jobs that don't specify remote
+        # (we can't be sure they're NOT remote)
+        self.accept_all = False
+        if "remote" in user_lower:
+            user_lower = [u for u in user_lower if u != "remote"]
+            # User ONLY wants remote → every job passes (let the scorer decide,
+            # since location info can be unreliable)
+            self.accept_all = not user_lower
+
+        # Significant words (>2 chars) of each preference,
+        # e.g. "United States" matches "New York, United States"
+        tokens = [w for loc in user_lower for w in re.split(r"[,\s]+", loc) if len(w) > 2]
+        self._tokens = _substring_pattern(tokens)
+
+    def matches(self, job_location: str | None) -> bool:
+        if not job_location:
+            return True
+        loc_lower = job_location.lower()
+        # Remote jobs always pass
+        if self.accept_all or _REMOTE_RE.search(loc_lower):
+            return True
+        return self._tokens is not None and self._tokens.search(loc_lower) is not None
+
+
+@lru_cache(maxsize=64)
+def _location_matcher(user_locations: tuple[str, ...]) -> _LocationMatcher:
+    return _LocationMatcher(user_locations)
+
+
 def _location_matches(job_location: str | None, user_locations: list[str]) -> bool:
     """Check if job location is compatible with user's preferred locations.
 
@@ -95,47 +151,63 @@ def _location_matches(job_location: str | None, user_locations: list[str]) -> bo
     - Job is remote/anywhere
     - Job location overlaps with any user location keyword
     """
-    if not job_location:
-        return True
+    return _location_matcher(tuple(user_locations)).matches(job_location)
 
-    loc_lower = job_location.lower()
 
-    # Remote jobs always pass
-    remote_keywords = ["remote", "anywhere", "distributed", "work from home"]
-    if any(kw in loc_lower for kw in remote_keywords):
-        return True
+def _map_unique[K: Hashable, V](fn: Callable[[K], V], values: Sequence[K]) -> list[V]:
+    """Apply ``fn`` once per distinct value and broadcast the results."""
+    cache: dict[K, V] = {}
+    out: list[V] = []
+    for value in values:
+        if value not in cache:
+            cache[value] = fn(value)
+        out.append(cache[value])
+    return out
 
-    # If user wants remote, also allow jobs that don't specify remote
-    # (we can't be sure they're NOT remote)
-    user_lower = [u.lower() for u in user_locations]
-    if "remote" in user_lower:
-        # User wants remote — remote jobs already passed above.
-        # For non-remote jobs, check if any other location matches.
-        non_remote = [u for u in user_lower if u != "remote"]
-        if not non_remote:
-            # User ONLY wants remote, but this job isn't remote → still pass
-            # (let the scorer decide, since location info can be unreliable)
-            return True
-        user_lower = non_remote
 
-    # Check for keyword overlap with user's location preferences
-    for user_loc in user_lower:
-        # Split into individual words for flexible matching
-        # e.g. "United States" matches "New York, United States"
-        words = re.split(r"[,\s]+", user_loc)
-        # Match if any significant word (>2 chars) appears in job location
-        for word in words:
-            if len(word) > 2 and word in loc_lower:
-                return True
+@dataclass
+class JobColumns:
+    """Column-oriented batch of postings: one list per field, aligned by index."""
+
+    titles: list[str]
+    locations: list[str | None]
+    employment_types: list[str | None]
+    salary_mins: list[int | None]
+    salary_maxs: list[int | None]
 
-    return False
+    @classmethod
+    def from_jobs(cls, jobs: Sequence[JobPosting]) -> "JobColumns":
+        return cls(
+            titles=[j.title for j in jobs],
+            locations=[j.location for j in jobs],
+            employment_types=[j.employment_type for j in jobs],
+            salary_mins=[j.salary_min for j in jobs],
+            salary_maxs=[j.salary_max for j in jobs],
+        )
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+
+# Drop reasons in the order the checks are applied
+_DROP_REASONS = ("seniority", "location", "employment type", "salary", "excluded location")
 
 
 class JobPreFilter:
-    """Removes obviously irrelevant jobs before expensive embedding/scoring."""
+    """Removes obviously irrelevant jobs before expensive embedding/scoring.
+
+    Everything derived from the UserConfig (seniority range, location token
+    regex, exclusion regex, employment types) is prepared once at construction.
+    """
 
     def __init__(self, user_config: UserConfig) -> None:
         self._config = user_config
+        self._level_range = _LEVEL_RANGES.get(user_config.experience_level, (0, 8))
+        self._locations = (
+            _location_matcher(tuple(user_config.locations)) if user_config.locations else None
+        )
+        self._employment_types = set(user_config.employment_types)
+        self._excluded = _substring_pattern(user_config.excluded_locations)
 
     def filter(
         self,
@@ -151,53 +223,19 @@ class JobPreFilter:
         Returns:
             Filtered list of jobs that pass all heuristic checks.
         """
-        initial_count = len(jobs)
-        seniority_dropped = 0
-        location_dropped = 0
-        employment_dropped = 0
-        salary_dropped = 0
-        exclusion_dropped = 0
-
-        result: list[JobPosting] = []
-        for job in jobs:
-            # Seniority filter
-            if not self._passes_seniority(job.title):
-                seniority_dropped += 1
-                continue
-
-            # Location filter
-            if self._config.locations and not _location_matches(
-                job.location, self._config.locations
-            ):
-                location_dropped += 1
-                continue
-
-            # Employment type filter
-            if not self._passes_employment_type(job.employment_type):
-                employment_dropped += 1
-                continue
-
-            # Salary range filter
-            if not self._passes_salary_range(job):
-                salary_dropped += 1
-                continue
-
-            # Location exclusion filter
-            if not self._passes_location_exclusion(job.location):
-                exclusion_dropped += 1
-                continue
-
-            result.append(job)
+        keep, drops = self.evaluate(JobColumns.from_jobs(jobs))
+        result = [job for job, kept in zip(jobs, keep, strict=True) if kept]
 
+        initial_count = len(jobs)
         dropped = initial_count - len(result)
         if dropped > 0:
             logger.info(
                 f"Pre-filtered: {initial_count} → {len(result)} "
-                f"(dropped {seniority_dropped} seniority, "
-                f"{location_dropped} location, "
-                f"{employment_dropped} employment type, "
-                f"{salary_dropped} salary, "
-                f"{exclusion_dropped} excluded location)"
+                f"(dropped {drops['seniority']} seniority, "
+                f"{drops['location']} location, "
+                f"{drops['employment type']} employment type, "
+                f"{drops['salary']} salary, "
+                f"{drops['excluded location']} excluded location)"
             )
         else:
             logger.info(
@@ -206,6 +244,38 @@ class JobPreFilter:
 
         return result
 
+    def evaluate(self, columns: JobColumns) -> tuple[list[bool], dict[str, int]]:
+        """Evaluate all checks over a column batch.
+
+        Checks run in order over the rows still alive; each check is computed
+        once per distinct value (titles and locations repeat heavily).
+
+        Returns:
+            (keep mask aligned with the input rows, drop count per reason)
+        """
+        keep = [True] * len(columns)
+        drops = dict.fromkeys(_DROP_REASONS, 0)
+
+        def _apply(reason: str, values: Sequence, passes: Callable) -> None:
+            alive = [i for i, k in enumerate(keep) if k]
+            results = _map_unique(passes, [values[i] for i in alive])
+            for i, ok in zip(alive, results, strict=True):
+                if not ok:
+                    keep[i] = False
+                    drops[reason] += 1
+
+        _apply("seniority", columns.titles, self._passes_seniority)
+        if self._locations is not None:
+            _apply("location", columns.locations, self._locations.matches)
+        if self._employment_types:
+            _apply("employment type", columns.employment_types, self._passes_employment_type)
+        if self._config.salary_min is not None or self._config.salary_max is not None:
+            salaries = list(zip(columns.salary_mins, columns.salary_maxs, strict=True))
+            _apply("salary", salaries, lambda s: self._passes_salary(*s))
+        if self._excluded is not None:
+            _apply("excluded location", columns.locations, self._passes_location_exclusion)
+        return keep, drops
+
     def _passes_seniority(self, title: str) -> bool:
         """Check if job title seniority matches user's experience level."""
         level = _detect_seniority(title)
@@ -213,23 +283,21 @@ class JobPreFilter:
             # Can't detect seniority → let it pass
             return True
 
-        exp = self._config.experience_level
-        min_level, max_level = _LEVEL_RANGES.get(exp, (0, 8))
+        min_level, max_level = self._level_range
         return min_level <= level <= max_level
 
     def _passes_employment_type(self, job_type: str | None) -> bool:
         """Check if job employment type matches user's preferences."""
-        if not self._config.employment_types:
+        if not self._employment_types:
             return True
         if not job_type:
             # Unknown type → let it pass
             return True
 
-        normalized = _normalize_employment_type(job_type)
-        return normalized in self._config.employment_types
+        return _normalize_employment_type(job_type) in self._employment_types
 
-    def _passes_salary_range(self, job: JobPosting) -> bool:
-        """Check if job salary overlaps with user's salary expectations.
+    def _passes_salary(self, job_min: int | None, job_max: int | None) -> bool:
+        """Check a job salary range against the user's expectations.
 
         Passes if:
         - User has no salary_min/salary_max configured
@@ -241,17 +309,17 @@ class JobPreFilter:
 
         if user_min is None and user_max is None:
             return True
-        if job.salary_min is None and job.salary_max is None:
+        if job_min is None and job_max is None:
             return True
 
         # If job pays too little: job's max < user's min
-        if user_min is not None and job.salary_max is not None:
-            if job.salary_max < user_min:
+        if user_min is not None and job_max is not None:
+            if job_max < user_min:
                 return False
 
         # If job pays too much: job's min > user's max
-        if user_max is not None and job.salary_min is not None:
-            if job.salary_min > user_max:
+        if user_max is not None and job_min is not None:
+            if job_min > user_max:
                 return False
 
         return True
@@ -264,15 +332,9 @@ class JobPreFilter:
         - Job has no location
         - Job location doesn't contain any excluded keyword
         """
-        excluded = self._config.excluded_locations
-        if not excluded:
+        if self._excluded is None:
             return True
         if not job_location:
             return True
 
-        loc_lower = job_location.lower()
-        for excl in excluded:
-            if excl.lower() in loc_lower:
-                return False
-
-        return True
+        return self._excluded.search(job_location.lower()) is None
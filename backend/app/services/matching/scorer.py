@@ -1,22 +1,31 @@
 """LLM-as-Judge scoring using Claude Sonnet with structured output.
 
 Scores job-resume matches on multiple dimensions using Claude's reasoning.
-Includes a lightweight quick_score() for fast relevance pre-screening.
+Includes a lightweight quick_score() for fast relevance pre-screening, and
+quick_score_batch() which packs several jobs into one prompt.
 """
 
+import asyncio
 import json
 import logging
+import re
+from dataclasses import asdict, dataclass
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 
-from app.schemas.matching import JobMatchScore
+from app.schemas.matching import JobMatchScore, JobPosting
+from app.services.cache.scores import ScoreCache, make_score_key, prompt_version
+from app.services.llm_factory import mark_cache_breakpoint, supports_prompt_caching
 
 logger = logging.getLogger(__name__)
 
+# The system message holds everything that is constant for a matching run (instructions,
+# candidate context, resume, preferences, weights) so it can be sent as a cached prefix;
+# only the human message changes from job to job.
 SCORING_PROMPT = ChatPromptTemplate.from_messages([
     (
-        "human",
+        "system",
         """You are an expert job matching analyst. Score how well a candidate's resume \
 matches a job posting on multiple dimensions. Be precise and actionable in your \
 reasoning. Score each dimension from 1 (poor match) to 10 (perfect match).
@@ -26,19 +35,9 @@ The candidate is targeting: {target_role} positions
 Candidate Experience Level: {experience_level}
 Preferred Workplace: {workplace_types}
 
-Evaluate this resume against the job posting.
-
 ## Resume
 {resume_text}
 
-## Job Posting
-Title: {job_title}
-Company: {job_company}
-Location: {job_location}
-Description: {job_description}
-Requirements: {job_requirements}
-Salary Range: {job_salary}
-
 ## Candidate Preferences
 Preferred Locations: {preferred_locations}
 Salary Range: {salary_range}
@@ -84,6 +83,18 @@ Also provide:
 - missing_skills: Skills the job requires that the candidate lacks
 - interview_talking_points: Key points the candidate should emphasize""",
     ),
+    (
+        "human",
+        """Evaluate the resume against this job posting.
+
+## Job Posting
+Title: {job_title}
+Company: {job_company}
+Location: {job_location}
+Description: {job_description}
+Requirements: {job_requirements}
+Salary Range: {job_salary}""",
+    ),
 ])
 
 QUICK_SCORE_PROMPT = ChatPromptTemplate.from_messages([
@@ -102,13 +113,141 @@ Return ONLY valid JSON: {{"relevance": <int 1-10>, "reason": "<15 words max>"}}"
     ),
 ])
 
+BATCH_QUICK_SCORE_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "human",
+        """Rate 1-10 how relevant each job below is for the candidate. Consider:
+- Does the role type match their target ({target_role})?
+- Are the core technical skills aligned?
+- Is the seniority level appropriate for someone with {experience_level} experience?
+
+Resume (key skills): {resume_summary}
+
+## Jobs
+{job_briefs}
+
+Return ONLY a valid JSON array with one object per job, in any order:
+[{{"index": <job number>, "relevance": <int 1-10>, "reason": "<15 words max>"}}, ...]""",
+    ),
+])
+
+SCORING_PROMPT_VERSION = prompt_version(SCORING_PROMPT)
+QUICK_SCORE_PROMPT_VERSION = prompt_version(QUICK_SCORE_PROMPT)
+BATCH_QUICK_SCORE_PROMPT_VERSION = prompt_version(BATCH_QUICK_SCORE_PROMPT)
+
+# Max description chars sent to the quick-score prompts
+QUICK_BRIEF_CHARS = 500
+
+# Per-job quick_score() calls in flight when a batch response is incomplete
+QUICK_SCORE_FALLBACK_CONCURRENCY = 4
+
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*\}")
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def _parse_batch_response(text: str, count: int) -> dict[int, tuple[int, str]]:
+    """Parse a batched quick-score response into {job position: (relevance, reason)}.
+
+    Accepts a JSON array (optionally fenced or wrapped in {"results": [...]}).
+    If the whole response is not valid JSON, e.g. truncated mid-array, each
+    complete object is recovered individually. Items whose index is missing fall
+    back to their position in the array; out-of-range or malformed items are dropped.
+    """
+    text = _CODE_FENCE_RE.sub("", text.strip())
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get("results", [data])
+        items = data if isinstance(data, list) else []
+    except json.JSONDecodeError:
+        items = []
+        for match in _JSON_OBJECT_RE.finditer(text):
+            try:
+                items.append(json.loads(match.group(0)))
+            except json.JSONDecodeError:
+                continue
+
+    parsed: dict[int, tuple[int, str]] = {}
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        try:
+            # Jobs are numbered from 1 in the prompt
+            index = int(item["index"]) - 1 if "index" in item else position
+            relevance = max(1, min(10, int(item["relevance"])))
+        except (KeyError, ValueError, TypeError):
+            continue
+        if 0 <= index < count and index not in parsed:
+            parsed[index] = (relevance, str(item.get("reason", "")))
+    return parsed
+
+
+@dataclass
+class ScoringUsage:
+    """Token usage accumulated across scorer LLM calls."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def add(self, usage_metadata: dict | None) -> None:
+        """Accumulate a LangChain ``usage_metadata`` dict from one response."""
+        if not isinstance(usage_metadata, dict):
+            return
+        details = usage_metadata.get("input_token_details") or {}
+        self.calls += 1
+        self.input_tokens += usage_metadata.get("input_tokens") or 0
+        self.output_tokens += usage_metadata.get("output_tokens") or 0
+        self.cache_read_tokens += details.get("cache_read") or 0
+        self.cache_write_tokens += details.get("cache_creation") or 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
 
 class JobScorer:
-    """Scores job-resume matches using Claude as LLM-as-Judge."""
+    """Scores job-resume matches using Claude as LLM-as-Judge.
+
+    When a ScoreCache is supplied, identical (resume, job, preferences, weights,
+    prompt version, model) inputs are answered from the cache without an LLM call.
+
+    For Claude, the SCORING_PROMPT system message (instructions + resume) is marked
+    as a prompt-cache breakpoint, so scoring many jobs for one resume pays for the
+    resume tokens once. Cache read/write token counts are tracked in ``usage``.
+    """
 
-    def __init__(self, llm: BaseChatModel) -> None:
+    def __init__(self, llm: BaseChatModel, cache: ScoreCache | None = None) -> None:
         self._llm = llm
-        self._structured_llm = self._llm.with_structured_output(JobMatchScore)
+        # include_raw keeps the AIMessage so its usage_metadata can be recorded
+        self._structured_llm = self._llm.with_structured_output(JobMatchScore, include_raw=True)
+        self._cache = cache
+        self._prompt_caching = supports_prompt_caching(llm)
+        self._usage = ScoringUsage()
+        self._model_name = str(
+            getattr(llm, "model", None) or getattr(llm, "model_name", None) or ""
+        )
+
+    @property
+    def cache(self) -> ScoreCache | None:
+        """The score cache in front of the LLM, if any."""
+        return self._cache
+
+    @property
+    def model_name(self) -> str:
+        """Name of the underlying chat model (used in cache keys and cost estimates)."""
+        return self._model_name
+
+    @property
+    def usage(self) -> ScoringUsage:
+        """Token usage accumulated since construction or the last reset_usage()."""
+        return self._usage
+
+    def reset_usage(self) -> ScoringUsage:
+        """Return the accumulated usage and start a fresh counter."""
+        usage, self._usage = self._usage, ScoringUsage()
+        return usage
 
     async def score(
         self,
@@ -155,7 +294,7 @@ class JobScorer:
                 "salary": 10,
             }
 
-        prompt_value = await SCORING_PROMPT.ainvoke({
+        variables = {
             "resume_text": resume_text,
             "job_title": job_title,
             "job_company": job_company,
@@ -173,8 +312,33 @@ class JobScorer:
             "education_weight": weights["education"],
             "location_weight": weights["location"],
             "salary_weight": weights["salary"],
-        })
-        result = await self._structured_llm.ainvoke(prompt_value)
+        }
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = make_score_key(
+                "score", SCORING_PROMPT_VERSION, self._model_name, variables
+            )
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                return JobMatchScore.model_validate(cached)
+
+        messages = (await SCORING_PROMPT.ainvoke(variables)).to_messages()
+        if self._prompt_caching:
+            messages[0] = mark_cache_breakpoint(messages[0])
+        result = await self._structured_llm.ainvoke(messages)
+
+        if isinstance(result, dict) and "parsed" in result:
+            raw = result.get("raw")
+            self._usage.add(getattr(raw, "usage_metadata", None))
+            if result.get("parsing_error") is not None:
+                raise result["parsing_error"]
+            result = result["parsed"]
+
+        if cache_key is not None and isinstance(result, JobMatchScore):
+            await asyncio.to_thread(
+                self._cache.set, cache_key, result.model_dump(mode="json")
+            )
         return result
 
     async def quick_score(
@@ -200,18 +364,30 @@ class JobScorer:
             Tuple of (relevance score 1-10, short reason string).
         """
         # Truncate description for speed
-        job_brief = job_description[:500] if len(job_description) > 500 else job_description
+        job_brief = job_description[:QUICK_BRIEF_CHARS]
 
-        prompt_value = await QUICK_SCORE_PROMPT.ainvoke({
+        variables = {
             "resume_summary": resume_summary,
             "job_title": job_title,
             "job_company": job_company,
             "job_brief": job_brief,
             "target_role": target_role,
             "experience_level": experience_level,
-        })
+        }
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = make_score_key(
+                "quick", QUICK_SCORE_PROMPT_VERSION, self._model_name, variables
+            )
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                return (int(cached["relevance"]), str(cached["reason"]))
+
+        prompt_value = await QUICK_SCORE_PROMPT.ainvoke(variables)
 
         response = await self._llm.ainvoke(prompt_value)
+        self._usage.add(getattr(response, "usage_metadata", None))
         text = response.content if hasattr(response, "content") else str(response)
 
         try:
@@ -220,7 +396,123 @@ class JobScorer:
             reason = str(data.get("reason", ""))
         except (json.JSONDecodeError, ValueError, TypeError):
             logger.warning(f"Failed to parse quick_score response: {text[:100]}")
-            relevance = 5
-            reason = "Could not parse response"
+            return (5, "Could not parse response")
+
+        relevance = max(1, min(10, relevance))
+        if cache_key is not None:
+            await asyncio.to_thread(
+                self._cache.set, cache_key, {"relevance": relevance, "reason": reason}
+            )
+        return (relevance, reason)
+
+    async def quick_score_batch(
+        self,
+        resume_summary: str,
+        jobs: list[JobPosting],
+        target_role: str = "Software Engineer",
+        experience_level: str = "mid",
+        fallback: bool = True,
+    ) -> list[tuple[int, str] | None]:
+        """Quick-score several jobs with a single LLM call.
+
+        Cached jobs are answered from the score cache; the rest are packed into
+        one BATCH_QUICK_SCORE_PROMPT. Errors from the LLM call itself (including
+        429/overload responses) propagate, so a caller's AdaptiveLimiter can back
+        off and retry. Jobs missing from the parsed response fall back to per-job
+        quick_score(), at most QUICK_SCORE_FALLBACK_CONCURRENCY at a time.
 
-        return (max(1, min(10, relevance)), reason)
+        Args:
+            resume_summary: Short summary of candidate's key skills.
+            jobs: Jobs to score.
+            target_role: The role the user is searching for.
+            experience_level: User's experience level.
+            fallback: Whether to re-score unparsed jobs here. Pass False to get
+                None for them instead and retry them under your own limiter.
+
+        Returns:
+            List of (relevance 1-10, reason) tuples, in the same order as jobs.
+            With ``fallback=False``, unparsed jobs are None.
+        """
+        results: list[tuple[int, str] | None] = [None] * len(jobs)
+        keys: list[str | None] = [None] * len(jobs)
+
+        if self._cache is not None:
+            for i, job in enumerate(jobs):
+                keys[i] = make_score_key(
+                    "quick",
+                    BATCH_QUICK_SCORE_PROMPT_VERSION,
+                    self._model_name,
+                    {
+                        "resume_summary": resume_summary,
+                        "job_title": job.title,
+                        "job_company": job.company,
+                        "job_brief": job.description[:QUICK_BRIEF_CHARS],
+                        "target_role": target_role,
+                        "experience_level": experience_level,
+                    },
+                )
+            found = await asyncio.to_thread(self._cache.get_many, keys)
+            for i, key in enumerate(keys):
+                cached = found.get(key)
+                if cached is not None:
+                    results[i] = (int(cached["relevance"]), str(cached["reason"]))
+
+        pending = [i for i, r in enumerate(results) if r is None]
+        if not pending:
+            return results
+
+        job_briefs = "\n\n".join(
+            f"[{n}] {jobs[i].title} at {jobs[i].company}\n"
+            f"Brief: {jobs[i].description[:QUICK_BRIEF_CHARS]}"
+            for n, i in enumerate(pending, 1)
+        )
+        prompt_value = await BATCH_QUICK_SCORE_PROMPT.ainvoke({
+            "resume_summary": resume_summary,
+            "job_briefs": job_briefs,
+            "target_role": target_role,
+            "experience_level": experience_level,
+        })
+        response = await self._llm.ainvoke(prompt_value)
+        self._usage.add(getattr(response, "usage_metadata", None))
+        text = response.content if hasattr(response, "content") else str(response)
+
+        parsed: dict[int, tuple[int, str]] = {}
+        try:
+            parsed = _parse_batch_response(text, len(pending))
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not parse batched quick_score for {len(pending)} jobs: {e}")
+
+        fresh: dict[str, dict] = {}
+        for n, i in enumerate(pending):
+            if n in parsed:
+                results[i] = parsed[n]
+                if keys[i] is not None:
+                    relevance, reason = parsed[n]
+                    fresh[keys[i]] = {"relevance": relevance, "reason": reason}
+        if fresh:
+            await asyncio.to_thread(self._cache.set_many, fresh)
+
+        missing = [i for i in pending if results[i] is None]
+        if missing and fallback:
+            logger.info(
+                f"Batched quick_score parsed {len(pending) - len(missing)}/{len(pending)} "
+                f"jobs, falling back to per-job calls for {len(missing)}"
+            )
+            sem = asyncio.Semaphore(QUICK_SCORE_FALLBACK_CONCURRENCY)
+
+            async def _score_one(job: JobPosting) -> tuple[int, str]:
+                async with sem:
+                    return await self.quick_score(
+                        resume_summary=resume_summary,
+                        job_title=job.title,
+                        job_company=job.company,
+                        job_description=job.description,
+                        target_role=target_role,
+                        experience_level=experience_level,
+                    )
+
+            rescored = await asyncio.gather(*[_score_one(jobs[i]) for i in missing])
+            for i, result in zip(missing, rescored, strict=True):
+                results[i] = result
+
+        return results
@@ -7,6 +7,7 @@ Requires ADZUNA_APP_ID and ADZUNA_APP_KEY in settings.
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -17,6 +18,10 @@ from app.services.scraping.base import BaseScraper, ScrapingResult
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.adzuna.com/v1/api/jobs"
+# Results requested per page; a shorter page is the last one
+RESULTS_PER_PAGE = 20
+# Pages requested concurrently
+PAGE_CONCURRENCY = 5
 
 
 class AdzunaScraper(BaseScraper):
@@ -30,11 +35,13 @@ class AdzunaScraper(BaseScraper):
         app_key: str | None = None,
         country: str = "us",
         client: httpx.AsyncClient | None = None,
+        page_concurrency: int = PAGE_CONCURRENCY,
     ) -> None:
         super().__init__(client)
         self._app_id = app_id
         self._app_key = app_key
         self._country = country
+        self._page_concurrency = page_concurrency
 
     def _get_credentials(self) -> tuple[str, str]:
         settings = get_settings()
@@ -51,55 +58,72 @@ class AdzunaScraper(BaseScraper):
                 - location: Location string.
                 - num_pages: Number of pages to fetch (default: 1).
         """
-        result = ScrapingResult(source=self.SOURCE)
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(
+        self, query: str = "Software Engineer", **kwargs
+    ) -> AsyncIterator[ScrapingResult]:
+        """Yield one ScrapingResult per fetched page. Accepts the same kwargs as `scrape()`.
+
+        Pages are fetched concurrently (up to ``page_concurrency``) but yielded
+        in page order.
+        """
         client = await self._get_client()
         app_id, app_key = self._get_credentials()
 
         if not app_id or not app_key:
-            result.errors.append("Adzuna credentials not configured")
-            return result
+            yield ScrapingResult(
+                source=self.SOURCE, errors=["Adzuna credentials not configured"]
+            )
+            return
 
         num_pages = kwargs.get("num_pages", 1)
         location = kwargs.get("location", "")
 
-        for page in range(1, num_pages + 1):
-            try:
-                url = f"{BASE_URL}/{self._country}/search/{page}"
-                params: dict[str, str | int] = {
-                    "app_id": app_id,
-                    "app_key": app_key,
-                    "what": query,
-                    "results_per_page": 20,
-                    "content-type": "application/json",
-                }
-                if location:
-                    params["where"] = location
-
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                jobs_data = data.get("results", [])
-                for raw in jobs_data:
-                    posting = self.normalize(raw)
-                    if posting:
-                        result.jobs.append(posting)
-
-                result.total_found += len(jobs_data)
-
-                if not jobs_data:
-                    break
-
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Adzuna API error (page {page}): {e}")
-                result.errors.append(f"HTTP {e.response.status_code} on page {page}")
-                break
-            except httpx.HTTPError as e:
-                logger.error(f"Adzuna request failed (page {page}): {e}")
-                result.errors.append(f"Request failed on page {page}")
-                break
-
-        return result
+        params: dict[str, str | int] = {
+            "app_id": app_id,
+            "app_key": app_key,
+            "what": query,
+            "results_per_page": RESULTS_PER_PAGE,
+            "content-type": "application/json",
+        }
+        if location:
+            params["where"] = location
+
+        async def fetch_page(page: int) -> ScrapingResult:
+            return await self._fetch_page(client, page, params)
+
+        async for chunk in self._stream_pages(
+            fetch_page, num_pages, RESULTS_PER_PAGE, self._page_concurrency
+        ):
+            yield chunk
+
+    async def _fetch_page(
+        self, client: httpx.AsyncClient, page: int, params: dict
+    ) -> ScrapingResult:
+        """Fetch and normalize one results page, recording failures as errors."""
+        chunk = ScrapingResult(source=self.SOURCE)
+        try:
+            url = f"{BASE_URL}/{self._country}/search/{page}"
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            jobs_data = data.get("results", [])
+            for raw in jobs_data:
+                posting = self.normalize(raw)
+                if posting:
+                    chunk.jobs.append(posting)
+
+            chunk.total_found += len(jobs_data)
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Adzuna API error (page {page}): {e}")
+            chunk.errors.append(f"HTTP {e.response.status_code} on page {page}")
+        except httpx.HTTPError as e:
+            logger.error(f"Adzuna request failed (page {page}): {e}")
+            chunk.errors.append(f"Request failed on page {page}")
+        return chunk
 
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Convert Adzuna API response to JobPosting."""
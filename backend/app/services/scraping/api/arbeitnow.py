@@ -5,6 +5,7 @@ API docs: https://www.arbeitnow.com/api/job-board-api
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -29,17 +30,22 @@ class ArbeitnowScraper(BaseScraper):
             **kwargs: Optional filters:
                 - num_pages: Number of pages to fetch (default: 1).
         """
-        result = ScrapingResult(source=self.SOURCE)
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(
+        self, query: str = "Software Engineer", **kwargs
+    ) -> AsyncIterator[ScrapingResult]:
+        """Yield one ScrapingResult per fetched page. Accepts the same kwargs as `scrape()`."""
         client = await self._get_client()
         num_pages = kwargs.get("num_pages", 1)
         query_lower = query.lower()
 
         for page in range(1, num_pages + 1):
+            chunk = ScrapingResult(source=self.SOURCE)
             try:
-                params: dict[str, int] = {"page": page}
-                response = await client.get(BASE_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+                data = await self._snapshot(
+                    f"page={page}", lambda: self._fetch_page(client, page)
+                )
 
                 jobs_data = data.get("data", [])
 
@@ -52,24 +58,32 @@ class ArbeitnowScraper(BaseScraper):
                     if query_lower in title or query_lower in description or query_lower in tags:
                         posting = self.normalize(raw)
                         if posting:
-                            result.jobs.append(posting)
-
-                result.total_found += len(jobs_data)
+                            chunk.jobs.append(posting)
 
-                # Check pagination
-                if not jobs_data or not data.get("links", {}).get("next"):
-                    break
+                chunk.total_found += len(jobs_data)
 
             except httpx.HTTPStatusError as e:
                 logger.error(f"Arbeitnow API error (page {page}): {e}")
-                result.errors.append(f"HTTP {e.response.status_code} on page {page}")
+                chunk.errors.append(f"HTTP {e.response.status_code} on page {page}")
+                yield chunk
                 break
             except httpx.HTTPError as e:
                 logger.error(f"Arbeitnow request failed (page {page}): {e}")
-                result.errors.append(f"Request failed on page {page}")
+                chunk.errors.append(f"Request failed on page {page}")
+                yield chunk
+                break
+
+            yield chunk
+
+            # Check pagination
+            if not jobs_data or not data.get("links", {}).get("next"):
                 break
 
-        return result
+    async def _fetch_page(self, client: httpx.AsyncClient, page: int) -> dict:
+        """Fetch one page of the board (the API has no query parameter)."""
+        return await self._fetch_parsed(
+            client, BASE_URL, lambda response: response.json(), params={"page": page}
+        )
 
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Convert Arbeitnow API response to JobPosting."""
@@ -7,11 +7,13 @@ No authentication required. Well-structured JSON responses.
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
 from app.schemas.matching import JobPosting
 from app.services.scraping.base import BaseScraper, ScrapingResult
+from app.services.scraping.snapshots import FeedSnapshots
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +29,9 @@ class GreenhouseScraper(BaseScraper):
         self,
         board_tokens: list[str] | None = None,
         client: httpx.AsyncClient | None = None,
+        snapshots: FeedSnapshots | None = None,
     ) -> None:
-        super().__init__(client)
+        super().__init__(client, snapshots)
         self._board_tokens = board_tokens or []
 
     async def scrape(self, query: str = "", **kwargs) -> ScrapingResult:
@@ -39,41 +42,56 @@ class GreenhouseScraper(BaseScraper):
                    All jobs from the board are returned.
             **kwargs: Optional 'board_tokens' to override configured boards.
         """
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(self, query: str = "", **kwargs) -> AsyncIterator[ScrapingResult]:
+        """Yield one ScrapingResult per board. Accepts the same kwargs as `scrape()`."""
         tokens = kwargs.get("board_tokens", self._board_tokens)
-        result = ScrapingResult(source=self.SOURCE)
         client = await self._get_client()
 
         for token in tokens:
+            chunk = ScrapingResult(source=self.SOURCE)
             try:
-                jobs = await self._fetch_board(client, token)
-                for raw in jobs:
-                    raw["_board_token"] = token
-                    posting = self.normalize(raw)
-                    if posting:
-                        result.jobs.append(posting)
-                result.total_found += len(jobs)
+                postings, found = await self._snapshot(
+                    token, lambda: self._load_board(client, token)
+                )
+                chunk.jobs.extend(postings)
+                chunk.total_found += found
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
-                    logger.warning(f"Rate limited on board {token}, skipping")
-                    result.errors.append(f"Rate limited: {token}")
+                    logger.warning(f"Rate limited on board {token} after retries, skipping")
+                    chunk.errors.append(f"Rate limited: {token}")
                 else:
                     logger.error(f"HTTP error for board {token}: {e}")
-                    result.errors.append(f"HTTP {e.response.status_code}: {token}")
+                    chunk.errors.append(f"HTTP {e.response.status_code}: {token}")
             except httpx.HTTPError as e:
                 logger.error(f"Request failed for board {token}: {e}")
-                result.errors.append(f"Request failed: {token}")
-
-        return result
+                chunk.errors.append(f"Request failed: {token}")
+            yield chunk
 
-    async def _fetch_board(
+    async def _load_board(
         self, client: httpx.AsyncClient, board_token: str
-    ) -> list[dict]:
-        """Fetch all jobs from a single Greenhouse board."""
+    ) -> tuple[list[JobPosting], int]:
+        """Fetch and normalize one board. Returns (postings, jobs found)."""
         url = f"{BASE_URL}/{board_token}/jobs"
-        response = await client.get(url, params={"content": "true"})
-        response.raise_for_status()
-        data = response.json()
-        return data.get("jobs", [])
+        return await self._fetch_parsed(
+            client,
+            url,
+            lambda response: self._parse_board(response, board_token),
+            params={"content": "true"},
+        )
+
+    def _parse_board(
+        self, response: httpx.Response, board_token: str
+    ) -> tuple[list[JobPosting], int]:
+        jobs = response.json().get("jobs", [])
+        postings = []
+        for raw in jobs:
+            raw["_board_token"] = board_token
+            posting = self.normalize(raw)
+            if posting:
+                postings.append(posting)
+        return postings, len(jobs)
 
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Convert Greenhouse API response to JobPosting."""
@@ -7,6 +7,7 @@ Requires JSEARCH_API_KEY (X-RapidAPI-Key header).
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
@@ -17,6 +18,10 @@ from app.services.scraping.base import BaseScraper, ScrapingResult
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://jsearch.p.rapidapi.com/search"
+# Results per page; a shorter page is the last one
+PAGE_SIZE = 10
+# Pages requested concurrently
+PAGE_CONCURRENCY = 5
 
 
 class JSearchScraper(BaseScraper):
@@ -28,9 +33,11 @@ class JSearchScraper(BaseScraper):
         self,
         api_key: str | None = None,
         client: httpx.AsyncClient | None = None,
+        page_concurrency: int = PAGE_CONCURRENCY,
     ) -> None:
         super().__init__(client)
         self._api_key = api_key
+        self._page_concurrency = page_concurrency
 
     def _get_api_key(self) -> str:
         if self._api_key:
@@ -54,7 +61,16 @@ class JSearchScraper(BaseScraper):
                 - employment_type: "FULLTIME", "PARTTIME", "CONTRACTOR", etc.
                 - num_pages: Number of pages to fetch (default: 1).
         """
-        result = ScrapingResult(source=self.SOURCE)
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(
+        self, query: str = "Software Engineer", **kwargs
+    ) -> AsyncIterator[ScrapingResult]:
+        """Yield one ScrapingResult per fetched page. Accepts the same kwargs as `scrape()`.
+
+        Pages are fetched concurrently (up to ``page_concurrency``) but yielded
+        in page order.
+        """
         client = await self._get_client()
         headers = self._get_headers()
 
@@ -63,46 +79,49 @@ class JSearchScraper(BaseScraper):
         employment_type = kwargs.get("employment_type")
         num_pages = kwargs.get("num_pages", 1)
 
-        full_query = f"{query} in {location}" if location else query
-
-        for page in range(1, num_pages + 1):
-            try:
-                params: dict[str, str | int | bool] = {
-                    "query": full_query,
-                    "page": page,
-                    "num_pages": 1,
-                }
-                if remote_only:
-                    params["remote_jobs_only"] = True
-                if employment_type:
-                    params["employment_types"] = employment_type
-
-                response = await client.get(BASE_URL, headers=headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                jobs_data = data.get("data", [])
-                for raw in jobs_data:
-                    posting = self.normalize(raw)
-                    if posting:
-                        result.jobs.append(posting)
-
-                result.total_found += len(jobs_data)
-
-                # Stop pagination if no more results
-                if not jobs_data:
-                    break
-
-            except httpx.HTTPStatusError as e:
-                logger.error(f"JSearch API error (page {page}): {e}")
-                result.errors.append(f"HTTP {e.response.status_code} on page {page}")
-                break
-            except httpx.HTTPError as e:
-                logger.error(f"JSearch request failed (page {page}): {e}")
-                result.errors.append(f"Request failed on page {page}")
-                break
-
-        return result
+        params: dict[str, str | int | bool] = {
+            "query": f"{query} in {location}" if location else query,
+            "num_pages": 1,
+        }
+        if remote_only:
+            params["remote_jobs_only"] = True
+        if employment_type:
+            params["employment_types"] = employment_type
+
+        async def fetch_page(page: int) -> ScrapingResult:
+            return await self._fetch_page(client, headers, {**params, "page": page})
+
+        async for chunk in self._stream_pages(
+            fetch_page, num_pages, PAGE_SIZE, self._page_concurrency
+        ):
+            yield chunk
+
+    async def _fetch_page(
+        self, client: httpx.AsyncClient, headers: dict[str, str], params: dict
+    ) -> ScrapingResult:
+        """Fetch and normalize one results page, recording failures as errors."""
+        page = params["page"]
+        chunk = ScrapingResult(source=self.SOURCE)
+        try:
+            response = await client.get(BASE_URL, headers=headers, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+            jobs_data = data.get("data", [])
+            for raw in jobs_data:
+                posting = self.normalize(raw)
+                if posting:
+                    chunk.jobs.append(posting)
+
+            chunk.total_found += len(jobs_data)
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"JSearch API error (page {page}): {e}")
+            chunk.errors.append(f"HTTP {e.response.status_code} on page {page}")
+        except httpx.HTTPError as e:
+            logger.error(f"JSearch request failed (page {page}): {e}")
+            chunk.errors.append(f"Request failed on page {page}")
+        return chunk
 
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Convert JSearch API response to JobPosting."""
@@ -7,11 +7,13 @@ No authentication required. Returns JSON array of postings.
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 import httpx
 
 from app.schemas.matching import JobPosting
 from app.services.scraping.base import BaseScraper, ScrapingResult
+from app.services.scraping.snapshots import FeedSnapshots
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +29,9 @@ class LeverScraper(BaseScraper):
         self,
         companies: list[str] | None = None,
         client: httpx.AsyncClient | None = None,
+        snapshots: FeedSnapshots | None = None,
     ) -> None:
-        super().__init__(client)
+        super().__init__(client, snapshots)
         self._companies = companies or []
 
     async def scrape(self, query: str = "", **kwargs) -> ScrapingResult:
@@ -38,40 +41,56 @@ class LeverScraper(BaseScraper):
             query: Not used for filtering (Lever API lists all postings).
             **kwargs: Optional 'companies' to override configured list.
         """
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(self, query: str = "", **kwargs) -> AsyncIterator[ScrapingResult]:
+        """Yield one ScrapingResult per company. Accepts the same kwargs as `scrape()`."""
         companies = kwargs.get("companies", self._companies)
-        result = ScrapingResult(source=self.SOURCE)
         client = await self._get_client()
 
         for company in companies:
+            chunk = ScrapingResult(source=self.SOURCE)
             try:
-                postings = await self._fetch_company(client, company)
-                for raw in postings:
-                    raw["_company_slug"] = company
-                    posting = self.normalize(raw)
-                    if posting:
-                        result.jobs.append(posting)
-                result.total_found += len(postings)
+                postings, found = await self._snapshot(
+                    company, lambda: self._load_company(client, company)
+                )
+                chunk.jobs.extend(postings)
+                chunk.total_found += found
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
-                    logger.warning(f"Rate limited on company {company}")
-                    result.errors.append(f"Rate limited: {company}")
+                    logger.warning(f"Rate limited on company {company} after retries")
+                    chunk.errors.append(f"Rate limited: {company}")
                 else:
                     logger.error(f"HTTP error for company {company}: {e}")
-                    result.errors.append(f"HTTP {e.response.status_code}: {company}")
+                    chunk.errors.append(f"HTTP {e.response.status_code}: {company}")
             except httpx.HTTPError as e:
                 logger.error(f"Request failed for company {company}: {e}")
-                result.errors.append(f"Request failed: {company}")
-
-        return result
+                chunk.errors.append(f"Request failed: {company}")
+            yield chunk
 
-    async def _fetch_company(
+    async def _load_company(
         self, client: httpx.AsyncClient, company: str
-    ) -> list[dict]:
-        """Fetch all postings for a single Lever company."""
+    ) -> tuple[list[JobPosting], int]:
+        """Fetch and normalize one company's postings. Returns (postings, found)."""
         url = f"{BASE_URL}/{company}"
-        response = await client.get(url, params={"mode": "json"})
-        response.raise_for_status()
-        return response.json()
+        return await self._fetch_parsed(
+            client,
+            url,
+            lambda response: self._parse_company(response, company),
+            params={"mode": "json"},
+        )
+
+    def _parse_company(
+        self, response: httpx.Response, company: str
+    ) -> tuple[list[JobPosting], int]:
+        raw_postings = response.json()
+        postings = []
+        for raw in raw_postings:
+            raw["_company_slug"] = company
+            posting = self.normalize(raw)
+            if posting:
+                postings.append(posting)
+        return postings, len(raw_postings)
 
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Convert Lever API response to JobPosting."""
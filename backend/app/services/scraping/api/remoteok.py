@@ -33,15 +33,7 @@ class RemoteOKScraper(BaseScraper):
         query_lower = query.lower()
 
         try:
-            response = await client.get(
-                API_URL,
-                headers={"User-Agent": "JobApplicationAgent/1.0"},
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # First item is a metadata object (legal notice), skip it
-            jobs_data = data[1:] if isinstance(data, list) and len(data) > 1 else []
+            jobs_data = await self._snapshot(API_URL, lambda: self._fetch_feed(client))
             result.total_found = len(jobs_data)
 
             for raw in jobs_data:
@@ -70,6 +62,21 @@ class RemoteOKScraper(BaseScraper):
 
         return result
 
+    async def _fetch_feed(self, client: httpx.AsyncClient) -> list[dict]:
+        """Fetch the full feed (RemoteOK has no query params)."""
+        return await self._fetch_parsed(
+            client,
+            API_URL,
+            self._parse_feed,
+            headers={"User-Agent": "JobApplicationAgent/1.0"},
+        )
+
+    @staticmethod
+    def _parse_feed(response: httpx.Response) -> list[dict]:
+        data = response.json()
+        # First item is a metadata object (legal notice), skip it
+        return data[1:] if isinstance(data, list) and len(data) > 1 else []
+
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Convert RemoteOK API response to JobPosting."""
         try:
@@ -6,11 +6,13 @@ No authentication required.
 
 import logging
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
 
 import httpx
 
 from app.schemas.matching import JobPosting
 from app.services.scraping.base import BaseScraper, ScrapingResult
+from app.services.scraping.snapshots import FeedSnapshots
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +34,9 @@ class WeWorkRemotelyScraper(BaseScraper):
         self,
         client: httpx.AsyncClient | None = None,
         categories: list[str] | None = None,
+        snapshots: FeedSnapshots | None = None,
     ) -> None:
-        super().__init__(client)
+        super().__init__(client, snapshots)
         self._categories = categories or list(CATEGORY_FEEDS.keys())
 
     async def scrape(self, query: str = "Software Engineer", **kwargs) -> ScrapingResult:
@@ -43,7 +46,12 @@ class WeWorkRemotelyScraper(BaseScraper):
             query: Job search query (used for client-side filtering).
             **kwargs: Optional: categories (list of category slugs).
         """
-        result = ScrapingResult(source=self.SOURCE)
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(
+        self, query: str = "Software Engineer", **kwargs
+    ) -> AsyncIterator[ScrapingResult]:
+        """Yield one ScrapingResult per category feed. Accepts the same kwargs as `scrape()`."""
         client = await self._get_client()
         query_lower = query.lower()
         categories = kwargs.get("categories", self._categories)
@@ -53,12 +61,10 @@ class WeWorkRemotelyScraper(BaseScraper):
             if not feed_url:
                 continue
 
+            chunk = ScrapingResult(source=self.SOURCE)
             try:
-                response = await client.get(feed_url)
-                response.raise_for_status()
-
-                items = self._parse_rss(response.text)
-                result.total_found += len(items)
+                items = await self._snapshot(feed_url, lambda: self._fetch_feed(client, feed_url))
+                chunk.total_found += len(items)
 
                 for raw in items:
                     title = (raw.get("title") or "").lower()
@@ -68,19 +74,24 @@ class WeWorkRemotelyScraper(BaseScraper):
                         raw["category"] = category
                         posting = self.normalize(raw)
                         if posting:
-                            result.jobs.append(posting)
+                            chunk.jobs.append(posting)
 
             except httpx.HTTPStatusError as e:
                 logger.error(f"WeWorkRemotely feed error ({category}): {e}")
-                result.errors.append(f"HTTP {e.response.status_code} for {category}")
+                chunk.errors.append(f"HTTP {e.response.status_code} for {category}")
             except httpx.HTTPError as e:
                 logger.error(f"WeWorkRemotely request failed ({category}): {e}")
-                result.errors.append(f"Request failed for {category}")
+                chunk.errors.append(f"Request failed for {category}")
             except ET.ParseError as e:
                 logger.error(f"WeWorkRemotely XML parse error ({category}): {e}")
-                result.errors.append(f"XML parse error for {category}")
-
-        return result
+                chunk.errors.append(f"XML parse error for {category}")
+            yield chunk
+
+    async def _fetch_feed(self, client: httpx.AsyncClient, feed_url: str) -> list[dict]:
+        """Download and parse one category feed."""
+        return await self._fetch_parsed(
+            client, feed_url, lambda response: self._parse_rss(response.text)
+        )
 
     def _parse_rss(self, xml_text: str) -> list[dict]:
         """Parse RSS XML into list of item dicts."""
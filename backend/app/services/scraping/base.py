@@ -1,11 +1,16 @@
 """Abstract base scraper defining the interface for all job scrapers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 
 import httpx
 
 from app.schemas.matching import JobPosting
+from app.services.cache.http import CACHE_VERSION_EXTENSION, parsed_responses
+from app.services.scraping.http_client import get_http_client
+from app.services.scraping.snapshots import FeedSnapshots
 
 
 @dataclass
@@ -26,19 +31,67 @@ class BaseScraper(ABC):
 
     SOURCE: str = "unknown"
 
-    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        snapshots: FeedSnapshots | None = None,
+    ) -> None:
         self._client = client
-        self._owns_client = client is None
+        self._snapshots = snapshots
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        """The injected client, or else the process-wide pooled scraper client."""
+        if self._client is not None:
+            return self._client
+        return get_http_client()
 
     async def close(self) -> None:
-        if self._owns_client and self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Release per-scraper resources.
+
+        HTTP clients are not closed here: an injected client belongs to the
+        caller and the shared client to the http_client registry, so pooled
+        connections outlive a single orchestrator run.
+        """
+
+    async def _snapshot[T](self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Fetch a query-independent feed once per run when snapshots are shared.
+
+        Without a FeedSnapshots, ``fetch`` is simply awaited.
+        """
+        if self._snapshots is None:
+            return await fetch()
+        return await self._snapshots.get(f"{self.SOURCE}:{key}", fetch)
+
+    async def _fetch_parsed[T](
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        parse: Callable[[httpx.Response], T],
+        **kwargs,
+    ) -> T:
+        """GET ``url`` and parse it, reusing the previous parse if the body is unchanged.
+
+        Responses answered by the HTTP cache carry the version of their body, so
+        a feed that revalidated as unchanged skips ``parse`` (and whatever
+        normalization it does). ``parse`` results are shared, so treat them as
+        read-only.
+
+        Raises:
+            httpx.HTTPStatusError: On a non-2xx response.
+        """
+        response = await client.get(url, **kwargs)
+        response.raise_for_status()
+        version = response.extensions.get(CACHE_VERSION_EXTENSION)
+        if version is None:
+            return parse(response)
+
+        key = f"{self.SOURCE}:{response.url}"
+        cached = parsed_responses.get(key, version)
+        if cached is not None:
+            return cached
+        parsed = parse(response)
+        parsed_responses.set(key, version, parsed)
+        return parsed
 
     @abstractmethod
     async def scrape(self, query: str, **kwargs) -> ScrapingResult:
@@ -53,6 +106,65 @@ class BaseScraper(ABC):
         """
         ...
 
+    async def stream(self, query: str, **kwargs) -> AsyncIterator[ScrapingResult]:
+        """Yield partial results as they become available.
+
+        Each yielded ScrapingResult holds one chunk (a page, board or feed) of
+        jobs plus any errors encountered while fetching it. The default
+        implementation yields a single chunk from `scrape()`; paginated and
+        multi-board scrapers override this to yield as each request completes.
+
+        Args:
+            query: Job search query.
+            **kwargs: Source-specific parameters, as for `scrape()`.
+        """
+        yield await self.scrape(query, **kwargs)
+
+    async def _stream_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[ScrapingResult]],
+        num_pages: int,
+        page_size: int,
+        concurrency: int,
+    ) -> AsyncIterator[ScrapingResult]:
+        """Fetch pages 1..num_pages concurrently and yield them in page order.
+
+        At most ``concurrency`` page requests are in flight. Pagination stops
+        after the first page that has errors, comes back empty or holds fewer
+        than ``page_size`` results; requests for later pages are cancelled.
+
+        Args:
+            fetch_page: Fetches and normalizes one page, recording failures in
+                the returned chunk's ``errors``.
+            num_pages: Maximum number of pages.
+            page_size: Results per full page.
+            concurrency: Maximum page requests in flight.
+        """
+        tasks: dict[int, asyncio.Task[ScrapingResult]] = {}
+        next_page = 1
+        try:
+            for page in range(1, num_pages + 1):
+                while next_page <= num_pages and len(tasks) < max(1, concurrency):
+                    tasks[next_page] = asyncio.create_task(fetch_page(next_page))
+                    next_page += 1
+                chunk = await tasks.pop(page)
+                yield chunk
+                if chunk.errors or chunk.total_found < page_size:
+                    break
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def _collect(self, chunks: AsyncIterator[ScrapingResult]) -> ScrapingResult:
+        """Merge streamed chunks into a single ScrapingResult."""
+        result = ScrapingResult(source=self.SOURCE)
+        async for chunk in chunks:
+            result.jobs.extend(chunk.jobs)
+            result.errors.extend(chunk.errors)
+            result.total_found += chunk.total_found
+        return result
+
     @abstractmethod
     def normalize(self, raw_data: dict) -> JobPosting | None:
         """Normalize a raw API/page response into a JobPosting.
@@ -0,0 +1,253 @@
+"""Shared HTTP client for scrapers.
+
+One httpx.AsyncClient is shared per process by every scraper that is not given
+its own client, so keep-alive connections survive across queries, sources and
+ARQ jobs instead of being rebuilt on every orchestrator run. Requests are routed
+to a separate connection pool per origin (scheme, host, port), so the
+connection limits apply per host and one slow board cannot starve the others.
+
+GET responses go through the on-disk conditional-request cache in cache.http
+unless it is disabled; requests that reach the network are subject to the
+per-host quotas and retry policy in rate_limit. The client is created by
+init_http_client() from the ARQ startup hook, or lazily on first use, and
+closed by close_http_client() on shutdown.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+
+import httpx
+
+from app.config import get_settings
+from app.services.cache.http import (
+    CachingTransport,
+    HttpCache,
+    get_http_cache,
+    parsed_responses,
+)
+from app.services.scraping.rate_limit import (
+    RateLimitedTransport,
+    RateLimiter,
+    RateLimitMetrics,
+    RetryPolicy,
+    get_rate_limiter,
+    get_retry_policy,
+)
+
+logger = logging.getLogger(__name__)
+
+# Origin key used to pick a per-host connection pool
+Origin = tuple[str, str, int | None]
+
+
+@dataclass
+class HttpClientMetrics:
+    """Request and connection counters for the shared scraper client."""
+
+    requests: int = 0
+    failures: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    http2_responses: int = 0
+    requests_per_host: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def reuse_ratio(self) -> float:
+        completed = self.connections_opened + self.connections_reused
+        return self.connections_reused / completed if completed else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["reuse_ratio"] = round(self.reuse_ratio, 4)
+        return data
+
+
+class HostPoolTransport(httpx.AsyncBaseTransport):
+    """Route requests to one pooled transport per origin and record reuse metrics.
+
+    A new connection is detected from httpcore's ``connect_tcp`` trace event;
+    a request that completes without one was served on a kept-alive connection.
+    """
+
+    def __init__(
+        self,
+        metrics: HttpClientMetrics,
+        transport_factory: Callable[[], httpx.AsyncBaseTransport],
+    ) -> None:
+        self._metrics = metrics
+        self._transport_factory = transport_factory
+        self._pools: dict[Origin, httpx.AsyncBaseTransport] = {}
+
+    def _pool_for(self, url: httpx.URL) -> httpx.AsyncBaseTransport:
+        origin = (url.scheme, url.host, url.port)
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = self._pools[origin] = self._transport_factory()
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self._metrics
+        host = request.url.host
+        metrics.requests += 1
+        metrics.requests_per_host[host] = metrics.requests_per_host.get(host, 0) + 1
+
+        opened = False
+        outer_trace = request.extensions.get("trace")
+
+        async def _trace(event: str, info: dict) -> None:
+            nonlocal opened
+            if event == "connection.connect_tcp.complete":
+                opened = True
+            if outer_trace is not None:
+                await outer_trace(event, info)
+
+        request.extensions["trace"] = _trace
+        try:
+            response = await self._pool_for(request.url).handle_async_request(request)
+        except Exception:
+            metrics.failures += 1
+            raise
+
+        if opened:
+            metrics.connections_opened += 1
+        else:
+            metrics.connections_reused += 1
+        if response.extensions.get("http_version") == b"HTTP/2":
+            metrics.http2_responses += 1
+        return response
+
+    async def aclose(self) -> None:
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            await pool.aclose()
+
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_cache: HttpCache | None = None
+_limiter: RateLimiter | None = None
+_rate_limit_metrics = RateLimitMetrics()
+_http_metrics = HttpClientMetrics()
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_client(
+    metrics: HttpClientMetrics | None = None,
+    transport_factory: Callable[[], httpx.AsyncBaseTransport] | None = None,
+    cache: HttpCache | None = None,
+    limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+) -> httpx.AsyncClient:
+    """Create a scraper client with per-host pools from the configured settings.
+
+    Most code should use the shared client via get_http_client(); this builds a
+    standalone client the caller is responsible for closing. With a ``cache``,
+    GET requests are revalidated against it (see cache.http.CachingTransport);
+    the cache stays open when the client is closed. With a ``limiter`` and/or
+    ``retry`` policy, requests that reach the network take a token from their
+    host's bucket and failures are retried (see rate_limit.RateLimitedTransport).
+    """
+    settings = get_settings()
+    http2 = settings.scraper_http2
+    if http2 and not _http2_available():
+        logger.warning("SCRAPER_HTTP2 is enabled but the h2 package is missing; using HTTP/1.1")
+        http2 = False
+
+    if transport_factory is None:
+        limits = httpx.Limits(
+            max_connections=settings.scraper_http_max_connections_per_host,
+            max_keepalive_connections=settings.scraper_http_max_connections_per_host,
+            keepalive_expiry=settings.scraper_http_keepalive_expiry,
+        )
+
+        def _pooled_transport() -> httpx.AsyncBaseTransport:
+            return httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+
+        transport_factory = _pooled_transport
+
+    timeout = httpx.Timeout(
+        settings.scraper_http_timeout,
+        connect=settings.scraper_http_connect_timeout,
+    )
+    if metrics is None:
+        metrics = HttpClientMetrics()
+    transport: httpx.AsyncBaseTransport = HostPoolTransport(metrics, transport_factory)
+    if limiter is not None or retry is not None:
+        transport = RateLimitedTransport(
+            transport, limiter or RateLimiter({}), retry or RetryPolicy(max_retries=0)
+        )
+    if cache is not None:
+        transport = CachingTransport(
+            transport, cache, replay_ttl=settings.scraper_http_cache_replay_ttl
+        )
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """Create the process-wide scraper client (idempotent within an event loop).
+
+    A client left over from a different (closed) event loop, as happens across
+    separate ``asyncio.run()`` calls, is discarded: its pooled connections, and
+    the rate limiter's Redis connections, are bound to that loop and cannot be
+    reused.
+    """
+    global _client, _client_loop, _cache, _limiter
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client_loop is not loop:
+        logger.debug("Discarding scraper HTTP client bound to another event loop")
+        if _cache is not None:
+            _cache.close()
+        if _limiter is not None:
+            _limiter.detach()
+        _client = None
+    if _client is None:
+        _cache = get_http_cache()
+        _limiter = get_rate_limiter(_rate_limit_metrics)
+        _client = build_http_client(
+            _http_metrics, cache=_cache, limiter=_limiter, retry=get_retry_policy()
+        )
+        _client_loop = loop
+        settings = get_settings()
+        logger.info(
+            f"Scraper HTTP client initialized "
+            f"({settings.scraper_http_max_connections_per_host} connections/host, "
+            f"http2={settings.scraper_http2})"
+        )
+    return _client
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared scraper client, creating it on first use."""
+    return init_http_client()
+
+
+async def close_http_client() -> None:
+    """Close all pooled scraper connections and drop the shared client."""
+    global _client, _client_loop, _cache, _limiter
+    if _client is not None:
+        if _client_loop is asyncio.get_running_loop():
+            await _client.aclose()
+            if _limiter is not None:
+                await _limiter.aclose()
+        if _cache is not None:
+            _cache.close()
+        logger.info(f"Scraper HTTP client closed (metrics: {_http_metrics.to_dict()})")
+    _client = None
+    _client_loop = None
+    _cache = None
+    _limiter = None
+
+
+def http_client_stats() -> dict:
+    """Request, connection-reuse, rate-limit and HTTP cache counters of the shared client."""
+    stats = _http_metrics.to_dict()
+    stats["rate_limit"] = _rate_limit_metrics.to_dict()
+    if _cache is not None:
+        stats["cache"] = {**_cache.stats(), "parses_skipped": parsed_responses.hits}
+    return stats
@@ -4,16 +4,27 @@ Coordinates multiple scrapers, deduplicates results, and feeds them into
 the ChromaDB vector store for the matching pipeline.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from dataclasses import dataclass, field
 
 from app.schemas.matching import JobPosting
 from app.services.matching.embedder import JobEmbedder
-from app.services.scraping.base import BaseScraper
+from app.services.scraping.base import BaseScraper, ScrapingResult
 from app.services.scraping.deduplicator import JobDeduplicator
 
 logger = logging.getLogger(__name__)
 
+# Defaults for concurrent fan-out across scrapers
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_SOURCE_TIMEOUT = 120.0
+
+# Streaming mode: postings per dedup/index micro-batch
+DEFAULT_STREAM_BATCH_SIZE = 50
+
 
 @dataclass
 class OrchestrationResult:
@@ -28,17 +39,64 @@ class OrchestrationResult:
 
 
 class ScrapingOrchestrator:
-    """Runs all scrapers, deduplicates, and indexes results."""
+    """Runs all scrapers, deduplicates, and indexes results.
+
+    By default scrapers run concurrently as asyncio tasks, bounded by
+    ``max_concurrency`` and with a per-source timeout, so a run takes roughly
+    as long as its slowest source. Results are merged in scraper order, so
+    first-seen deduplication is identical to a sequential run.
+    """
 
     def __init__(
         self,
         scrapers: list[BaseScraper],
         deduplicator: JobDeduplicator | None = None,
         embedder: JobEmbedder | None = None,
+        concurrent: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        source_timeout: float | None = DEFAULT_SOURCE_TIMEOUT,
+        stream_batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
     ) -> None:
         self._scrapers = scrapers
         self._deduplicator = deduplicator or JobDeduplicator()
         self._embedder = embedder
+        self._concurrent = concurrent
+        self._max_concurrency = max(1, max_concurrency)
+        self._source_timeout = source_timeout
+        self._stream_batch_size = max(1, stream_batch_size)
+
+    async def _scrape_one(
+        self, scraper: BaseScraper, query: str, **kwargs
+    ) -> ScrapingResult:
+        """Run a single scraper, enforcing the per-source timeout."""
+        if self._source_timeout is None:
+            return await scraper.scrape(query, **kwargs)
+        return await asyncio.wait_for(
+            scraper.scrape(query, **kwargs), timeout=self._source_timeout
+        )
+
+    async def _gather_results(
+        self, query: str, **kwargs
+    ) -> list[ScrapingResult | BaseException]:
+        """Run all scrapers and return their results (or exceptions) in scraper order."""
+        if not self._concurrent:
+            outcomes: list[ScrapingResult | BaseException] = []
+            for scraper in self._scrapers:
+                try:
+                    outcomes.append(await self._scrape_one(scraper, query, **kwargs))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        sem = asyncio.Semaphore(self._max_concurrency)
+
+        async def _bounded(scraper: BaseScraper) -> ScrapingResult:
+            async with sem:
+                return await self._scrape_one(scraper, query, **kwargs)
+
+        return await asyncio.gather(
+            *[_bounded(s) for s in self._scrapers], return_exceptions=True
+        )
 
     async def run(self, query: str, **kwargs) -> OrchestrationResult:
         """Run all scrapers, deduplicate, and optionally index results.
@@ -54,21 +112,29 @@ class ScrapingOrchestrator:
 
         # Step 1: Run all scrapers and collect raw jobs
         all_jobs: list[JobPosting] = []
+        outcomes = await self._gather_results(query, **kwargs)
 
-        for scraper in self._scrapers:
-            try:
-                scraping_result = await scraper.scrape(query, **kwargs)
-                all_jobs.extend(scraping_result.jobs)
-                result.per_source[scraper.SOURCE] = len(scraping_result.jobs)
-                result.errors.extend(scraping_result.errors)
-                logger.info(
-                    f"{scraper.SOURCE}: found {scraping_result.total_found}, "
-                    f"normalized {len(scraping_result.jobs)}"
+        for scraper, outcome in zip(self._scrapers, outcomes, strict=True):
+            if isinstance(outcome, TimeoutError):
+                logger.error(
+                    f"Scraper {scraper.SOURCE} timed out after {self._source_timeout}s"
+                )
+                result.errors.append(
+                    f"{scraper.SOURCE} timed out after {self._source_timeout}s"
                 )
-            except Exception as e:
-                logger.error(f"Scraper {scraper.SOURCE} failed: {e}")
-                result.errors.append(f"{scraper.SOURCE} failed: {e}")
                 result.per_source[scraper.SOURCE] = 0
+            elif isinstance(outcome, BaseException):
+                logger.error(f"Scraper {scraper.SOURCE} failed: {outcome}")
+                result.errors.append(f"{scraper.SOURCE} failed: {outcome}")
+                result.per_source[scraper.SOURCE] = 0
+            else:
+                all_jobs.extend(outcome.jobs)
+                result.per_source[scraper.SOURCE] = len(outcome.jobs)
+                result.errors.extend(outcome.errors)
+                logger.info(
+                    f"{scraper.SOURCE}: found {outcome.total_found}, "
+                    f"normalized {len(outcome.jobs)}"
+                )
 
         result.total = len(all_jobs)
 
@@ -89,10 +155,142 @@ class ScrapingOrchestrator:
             logger.info(f"Indexed {indexed} new jobs into ChromaDB")
 
         # Step 4: Close scraper clients
+        await self._close_scrapers()
+
+        return result
+
+    async def stream(
+        self,
+        query: str,
+        stats: OrchestrationResult | None = None,
+        **kwargs,
+    ) -> AsyncIterator[list[JobPosting]]:
+        """Yield deduplicated micro-batches of jobs while scrapers are still running.
+
+        Each batch is indexed into ChromaDB (if an embedder is configured) before
+        it is yielded. Chunks flow through a bounded queue, so a slow consumer
+        applies backpressure to the scrapers instead of buffering postings.
+        ``source_timeout`` budgets only the time a scraper spends fetching
+        chunks; time blocked on that backpressure does not count against it.
+        With ``concurrent=False`` scrapers stream one after another, in order.
+
+        Args:
+            query: Job search query.
+            stats: Optional OrchestrationResult updated in place with totals,
+                per-source counts and errors (``jobs`` is left untouched).
+            **kwargs: Passed through to each scraper's ``stream()``.
+
+        Yields:
+            Lists of at most ``stream_batch_size`` unique, newly seen jobs.
+        """
+        stats = stats if stats is not None else OrchestrationResult()
+        queue: asyncio.Queue[tuple[BaseScraper, ScrapingResult | None]] = asyncio.Queue(
+            maxsize=self._max_concurrency * 2
+        )
+        # Semaphore waiters are woken FIFO, so a single slot runs producers in
+        # scraper order.
+        sem = asyncio.Semaphore(self._max_concurrency if self._concurrent else 1)
+
+        async def _produce(scraper: BaseScraper) -> None:
+            async with sem:
+                try:
+                    async with aclosing(scraper.stream(query, **kwargs)) as chunks:
+                        budget = self._source_timeout
+                        while True:
+                            started = time.monotonic()
+                            try:
+                                async with asyncio.timeout(budget):
+                                    chunk = await anext(chunks)
+                            except StopAsyncIteration:
+                                break
+                            if budget is not None:
+                                budget -= time.monotonic() - started
+                            await queue.put((scraper, chunk))
+                except TimeoutError:
+                    logger.error(
+                        f"Scraper {scraper.SOURCE} timed out after {self._source_timeout}s"
+                    )
+                    stats.errors.append(
+                        f"{scraper.SOURCE} timed out after {self._source_timeout}s"
+                    )
+                except Exception as e:
+                    logger.error(f"Scraper {scraper.SOURCE} failed: {e}")
+                    stats.errors.append(f"{scraper.SOURCE} failed: {e}")
+            await queue.put((scraper, None))
+
+        for scraper in self._scrapers:
+            stats.per_source.setdefault(scraper.SOURCE, 0)
+
+        tasks = [asyncio.create_task(_produce(s)) for s in self._scrapers]
+        pending = len(tasks)
+        buffer: list[JobPosting] = []
+
+        try:
+            while pending:
+                scraper, chunk = await queue.get()
+                if chunk is None:
+                    pending -= 1
+                    continue
+
+                stats.per_source[scraper.SOURCE] += len(chunk.jobs)
+                stats.errors.extend(chunk.errors)
+                stats.total += len(chunk.jobs)
+
+                unique = self._deduplicator.deduplicate(chunk.jobs)
+                stats.new += len(unique)
+                stats.duplicates += len(chunk.jobs) - len(unique)
+                buffer.extend(unique)
+
+                while len(buffer) >= self._stream_batch_size:
+                    batch = buffer[: self._stream_batch_size]
+                    buffer = buffer[self._stream_batch_size :]
+                    await self._index_batch(batch)
+                    yield batch
+
+            if buffer:
+                await self._index_batch(buffer)
+                yield buffer
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._close_scrapers()
+
+    async def run_streaming(
+        self, query: str, keep_jobs: bool = False, **kwargs
+    ) -> OrchestrationResult:
+        """Run all scrapers in streaming mode and return aggregated stats.
+
+        Args:
+            query: Job search query.
+            keep_jobs: Also collect the unique jobs into ``result.jobs``. Off by
+                default so memory stays bounded; only enable for small scrapes.
+            **kwargs: Passed through to each scraper.
+
+        Returns:
+            OrchestrationResult with aggregated stats.
+        """
+        result = OrchestrationResult()
+        async for batch in self.stream(query, stats=result, **kwargs):
+            if keep_jobs:
+                result.jobs.extend(batch)
+
+        logger.info(
+            f"Streaming orchestration complete: {result.total} total, "
+            f"{result.new} unique, {result.duplicates} duplicates"
+        )
+        return result
+
+    async def _index_batch(self, batch: list[JobPosting]) -> None:
+        """Index a micro-batch off the event loop so downloads keep flowing."""
+        if self._embedder is None:
+            return
+        indexed = await asyncio.to_thread(self._embedder.index_jobs, batch)
+        logger.debug(f"Indexed {indexed} new jobs into ChromaDB")
+
+    async def _close_scrapers(self) -> None:
         for scraper in self._scrapers:
             try:
                 await scraper.close()
             except Exception:
                 pass
-
-        return result
@@ -0,0 +1,354 @@
+"""Per-host rate limiting and retries for the scraper HTTP client.
+
+Every request to a host with a configured quota first takes a token from that
+host's bucket (``rate`` requests/second, bursts of up to ``burst``). Buckets are
+process-local by default; with the Redis backend they live in Redis, so all
+worker processes share one quota per host.
+
+Failed requests (429, 502-504, connection errors and timeouts) are retried with
+full-jitter exponential backoff. A ``Retry-After`` header overrides the backoff
+and also pauses the host's bucket, so concurrent requests to the same host wait
+instead of piling on more 429s.
+"""
+
+import asyncio
+import email.utils
+import logging
+import math
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+
+import httpx
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+REDIS_KEY_PREFIX = "scraper:ratelimit:"
+
+# KEYS: bucket hash, pause key. ARGV: rate (tokens/s), capacity.
+# Returns 0 when a token was taken, else milliseconds to wait before retrying.
+_TAKE_TOKEN_LUA = """
+local pause = redis.call('PTTL', KEYS[2])
+if pause > 0 then
+    return pause
+end
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return wait
+"""
+
+
+@dataclass
+class RateLimitMetrics:
+    """Throttling and retry counters for the scraper client."""
+
+    throttled: int = 0
+    throttled_seconds: float = 0.0
+    retries: int = 0
+    retries_exhausted: int = 0
+    backend_errors: int = 0
+    retries_per_host: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["throttled_seconds"] = round(self.throttled_seconds, 3)
+        return data
+
+
+class Bucket(Protocol):
+    async def acquire(self) -> float: ...
+
+    async def pause(self, seconds: float) -> None: ...
+
+
+class TokenBucket:
+    """Process-local token bucket."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self._rate = rate
+        self._capacity = max(1, burst)
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _reserve(self, now: float) -> float:
+        """Take a token if available; otherwise return the seconds to wait."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self._rate
+
+    async def acquire(self) -> float:
+        """Wait for a token. Returns the seconds spent waiting."""
+        waited = 0.0
+        while (wait := self._reserve(time.monotonic())) > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    async def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds`` (e.g. after a Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RedisTokenBucket:
+    """Token bucket stored in Redis, shared by every process using the same key.
+
+    Falls back to a process-local bucket while Redis is unreachable, so a Redis
+    outage slows nothing down beyond the local quota.
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        host: str,
+        rate: float,
+        burst: int = 1,
+        metrics: RateLimitMetrics | None = None,
+    ) -> None:
+        self._redis = redis
+        self._rate = rate
+        self._capacity = max(1, burst)
+        self._keys = [f"{REDIS_KEY_PREFIX}{host}", f"{REDIS_KEY_PREFIX}{host}:pause"]
+        self._fallback = TokenBucket(rate, burst)
+        self._metrics = metrics or RateLimitMetrics()
+
+    async def _take(self) -> float | None:
+        """Seconds to wait (0 = token taken), or None if Redis failed."""
+        from redis.exceptions import RedisError
+
+        try:
+            wait_ms = await self._redis.eval(
+                _TAKE_TOKEN_LUA, 2, *self._keys, self._rate, self._capacity
+            )
+        except (RedisError, OSError) as e:
+            self._metrics.backend_errors += 1
+            logger.warning(f"Redis rate limiter unavailable, using local bucket: {e}")
+            return None
+        return int(wait_ms) / 1000
+
+    async def acquire(self) -> float:
+        waited = 0.0
+        while True:
+            wait = await self._take()
+            if wait is None:
+                return waited + await self._fallback.acquire()
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    async def pause(self, seconds: float) -> None:
+        from redis.exceptions import RedisError
+
+        await self._fallback.pause(seconds)
+        try:
+            await self._redis.set(self._keys[1], 1, px=max(1, math.ceil(seconds * 1000)))
+        except (RedisError, OSError) as e:
+            self._metrics.backend_errors += 1
+            logger.warning(f"Could not share rate-limit pause through Redis: {e}")
+
+
+class RateLimiter:
+    """Registry of per-host buckets built from configured quotas.
+
+    Args:
+        limits: Requests per second by host name. Hosts not listed are unlimited.
+        redis: Async Redis client; if given, buckets are shared through Redis.
+        metrics: Counters updated as requests are throttled.
+
+    The burst size of each bucket is its per-second rate, rounded down (at least 1).
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, float],
+        redis: Any = None,
+        metrics: RateLimitMetrics | None = None,
+    ) -> None:
+        self._limits = {host: rate for host, rate in limits.items() if rate > 0}
+        self._redis = redis
+        self.metrics = metrics or RateLimitMetrics()
+        self._buckets: dict[str, Bucket] = {}
+
+    def bucket(self, host: str) -> Bucket | None:
+        """The bucket for ``host``, or None if it has no quota."""
+        rate = self._limits.get(host)
+        if rate is None:
+            return None
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            burst = max(1, int(rate))
+            if self._redis is not None:
+                bucket = RedisTokenBucket(self._redis, host, rate, burst, self.metrics)
+            else:
+                bucket = TokenBucket(rate, burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        bucket = self.bucket(host)
+        if bucket is None:
+            return
+        waited = await bucket.acquire()
+        if waited > 0:
+            self.metrics.throttled += 1
+            self.metrics.throttled_seconds += waited
+
+    async def pause(self, host: str, seconds: float) -> None:
+        bucket = self.bucket(host)
+        if bucket is not None:
+            await bucket.pause(seconds)
+
+    async def aclose(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    def detach(self) -> None:
+        """Drop Redis connections bound to an event loop that can no longer run.
+
+        Stand-in for aclose() when the limiter outlives its loop: the pooled
+        connections are released without touching the dead loop, and their
+        sockets close as the transports are collected.
+        """
+        if self._redis is not None:
+            self._redis.connection_pool.reset()
+            self._redis = None
+            self._buckets.clear()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Full-jitter exponential backoff for retryable failures.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying).
+        base_delay: Backoff ceiling for the first retry, doubled per attempt.
+        max_delay: Cap on the backoff; a Retry-After longer than this is not
+            waited for and the response is returned as is.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retry number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper applying per-host quotas and the retry policy."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: RateLimiter,
+        retry: RetryPolicy,
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+        self._retry = retry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        retryable = request.method in RETRY_METHODS
+        attempt = 0
+        while True:
+            await self._limiter.acquire(host)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRY_ERRORS as e:
+                if not retryable or attempt >= self._retry.max_retries:
+                    self._give_up(attempt)
+                    raise
+                delay = self._retry.backoff(attempt)
+                reason = type(e).__name__
+            else:
+                if not retryable or response.status_code not in RETRY_STATUSES:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if retry_after is not None:
+                    await self._limiter.pause(host, retry_after)
+                too_long = retry_after is not None and retry_after > self._retry.max_delay
+                if too_long or attempt >= self._retry.max_retries:
+                    self._give_up(attempt)
+                    return response
+                await response.aclose()
+                delay = retry_after if retry_after is not None else self._retry.backoff(attempt)
+                reason = f"HTTP {response.status_code}"
+
+            # Path only: query strings may carry API keys
+            logger.info(f"Retrying {host}{request.url.path} in {delay:.2f}s after {reason}")
+            attempt += 1
+            metrics = self._limiter.metrics
+            metrics.retries += 1
+            metrics.retries_per_host[host] = metrics.retries_per_host.get(host, 0) + 1
+            await asyncio.sleep(delay)
+
+    def _give_up(self, attempt: int) -> None:
+        if attempt > 0:
+            self._limiter.metrics.retries_exhausted += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def get_rate_limiter(metrics: RateLimitMetrics | None = None) -> RateLimiter:
+    """Build the scraper rate limiter from settings (Redis-backed if configured)."""
+    settings = get_settings()
+    redis = None
+    if settings.scraper_rate_limit_backend == "redis":
+        from redis.asyncio import Redis
+
+        redis = Redis.from_url(settings.redis_url)
+    return RateLimiter(settings.scraper_rate_limits, redis=redis, metrics=metrics)
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Build the scraper retry policy from settings."""
+    settings = get_settings()
+    return RetryPolicy(
+        max_retries=settings.scraper_retry_attempts,
+        base_delay=settings.scraper_retry_base_delay,
+        max_delay=settings.scraper_retry_max_delay,
+    )
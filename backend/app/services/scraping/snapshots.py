@@ -0,0 +1,64 @@
+"""Per-run snapshots of query-independent feeds.
+
+Board and feed scrapers (Greenhouse, Lever, RemoteOK, WeWorkRemotely) download
+the whole board or feed and filter locally, so their downloads do not depend on
+the search query. A FeedSnapshots shared by the scrapers of one scraping run
+fetches each feed once; every later query in the run is evaluated against the
+in-memory snapshot.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class FeedSnapshots:
+    """In-memory cache of fetched feeds for the lifetime of one scraping run.
+
+    Entries hold the fetch task itself, so concurrent callers for the same key
+    share one in-flight download. Failed fetches are not kept: the next caller
+    retries.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the snapshot for ``key``, calling ``fetch`` on first use.
+
+        Raises:
+            Whatever ``fetch`` raised, for every caller awaiting that attempt.
+        """
+        task = self._entries.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(fetch())
+            self._entries[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            self.hits += 1
+        # Shielded: a caller hitting its source timeout must not cancel a
+        # download other queries are waiting on.
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is not None:
+            if self._entries.get(key) is task:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"feeds": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Drop all snapshots, cancelling downloads nobody is waiting on anymore."""
+        for task in self._entries.values():
+            task.cancel()
+        self._entries.clear()
@@ -7,6 +7,7 @@ from arq.connections import RedisSettings
 
 from app.config import get_settings
 from app.worker.tasks import (
+    rescore_ats,
     run_agent,
     run_matching,
     run_scraping,
@@ -37,7 +38,7 @@ def get_redis_settings() -> RedisSettings:
 class WorkerSettings:
     """ARQ worker configuration."""
 
-    functions = [run_scraping, run_matching, run_agent]
+    functions = [run_scraping, run_matching, run_agent, rescore_ats]
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = get_redis_settings()
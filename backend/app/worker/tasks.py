@@ -3,12 +3,17 @@
 These tasks are enqueued from the API layer and run by the ARQ worker process.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, tuple_, update
+from sqlalchemy.orm import defer
 
 from app.config import UserConfig, get_settings, load_user_config
-from app.db.session import get_db_session_ctx
+from app.db.bulk import UpsertResult, upsert_jobs, upsert_match_results
+from app.db.session import dispose_engine, get_db_session_ctx, init_engine
 from app.models.application import Application
 from app.models.job import Job
 from app.models.match import MatchResult
@@ -16,10 +21,25 @@ from app.models.user import User
 from app.schemas.matching import JobPosting
 from app.services.agent.graph import compile_agent_graph
 from app.services.agent.state import make_initial_state
-from app.services.matching.pipeline import MatchingPipeline
+from app.services.cache.scores import close_score_cache
+from app.services.llm_factory import close_embedding_caches, get_embeddings
+from app.services.matching.ats_batch import (
+    ATSRow,
+    default_workers,
+    make_ats_executor,
+    score_in_pool,
+)
+from app.services.matching.embedder import JobEmbedder
+from app.services.matching.pipeline import MatchingPipeline, compute_integrated_score
 from app.services.scraping.api.jsearch import JSearchScraper
 from app.services.scraping.deduplicator import JobDeduplicator
-from app.services.scraping.orchestrator import ScrapingOrchestrator
+from app.services.scraping.http_client import (
+    close_http_client,
+    http_client_stats,
+    init_http_client,
+)
+from app.services.scraping.orchestrator import OrchestrationResult, ScrapingOrchestrator
+from app.services.scraping.snapshots import FeedSnapshots
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +61,55 @@ def _job_model_to_posting(j: Job) -> JobPosting:
         employment_type=j.employment_type,
         experience_level=j.experience_level,
         apply_url=j.apply_url,
+        db_id=j.id,
     )
 
 
-def _build_scrapers(config: UserConfig) -> list:
-    """Build scraper list based on user's enabled_sources config."""
+def _unscored_jobs_query(user_id: int):
+    """Jobs without a match result for ``user_id`` (NOT EXISTS anti-join)."""
+    scored = exists().where(MatchResult.job_id == Job.id, MatchResult.user_id == user_id)
+    return select(Job).where(~scored)
+
+
+async def _stream_unscored_jobs(
+    user_id: int, chunk_size: int
+) -> AsyncIterator[list[JobPosting]]:
+    """Yield unscored jobs in chunks from a server-side cursor.
+
+    ``raw_data`` is never loaded, and the session's identity map only holds weak
+    references, so each chunk is freed once the consumer moves on.
+    """
+    query = (
+        _unscored_jobs_query(user_id)
+        .options(defer(Job.raw_data))
+        .order_by(Job.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    async with get_db_session_ctx() as db:
+        result = await db.stream_scalars(query)
+        async for partition in result.partitions():
+            yield [_job_model_to_posting(j) for j in partition]
+
+
+async def _load_postings(keys: list[tuple[str, str]]) -> list[JobPosting]:
+    """Load full postings for (external_id, source) keys, without ``raw_data``."""
+    if not keys:
+        return []
+    query = (
+        select(Job)
+        .options(defer(Job.raw_data))
+        .where(tuple_(Job.external_id, Job.source).in_(list(dict.fromkeys(keys))))
+    )
+    async with get_db_session_ctx() as db:
+        result = await db.execute(query)
+        return [_job_model_to_posting(j) for j in result.scalars().all()]
+
+
+def _build_scrapers(config: UserConfig, snapshots: FeedSnapshots | None = None) -> list:
+    """Build scraper list based on user's enabled_sources config.
+
+    Board/feed scrapers share ``snapshots`` so each feed is downloaded once per run.
+    """
     scrapers = []
 
     if "jsearch" in config.enabled_sources:
@@ -57,23 +121,25 @@ def _build_scrapers(config: UserConfig) -> list:
 
     if "arbeitnow" in config.enabled_sources:
         from app.services.scraping.api.arbeitnow import ArbeitnowScraper
-        scrapers.append(ArbeitnowScraper())
+        scrapers.append(ArbeitnowScraper(snapshots=snapshots))
 
     if "greenhouse" in config.enabled_sources and config.greenhouse_board_tokens:
         from app.services.scraping.api.greenhouse import GreenhouseScraper
-        scrapers.append(GreenhouseScraper(board_tokens=config.greenhouse_board_tokens))
+        scrapers.append(
+            GreenhouseScraper(board_tokens=config.greenhouse_board_tokens, snapshots=snapshots)
+        )
 
     if "lever" in config.enabled_sources and config.lever_companies:
         from app.services.scraping.api.lever import LeverScraper
-        scrapers.append(LeverScraper(companies=config.lever_companies))
+        scrapers.append(LeverScraper(companies=config.lever_companies, snapshots=snapshots))
 
     if "remoteok" in config.enabled_sources:
         from app.services.scraping.api.remoteok import RemoteOKScraper
-        scrapers.append(RemoteOKScraper())
+        scrapers.append(RemoteOKScraper(snapshots=snapshots))
 
     if "weworkremotely" in config.enabled_sources:
         from app.services.scraping.api.weworkremotely import WeWorkRemotelyScraper
-        scrapers.append(WeWorkRemotelyScraper())
+        scrapers.append(WeWorkRemotelyScraper(snapshots=snapshots))
 
     # Default to JSearch if no scrapers configured
     if not scrapers:
@@ -87,6 +153,11 @@ async def run_scraping(
 ):
     """Background task: run scraping orchestrator.
 
+    Deduplicated batches stream out of the orchestrator while scrapers are still
+    running; each batch is indexed into ChromaDB and upserted in its own
+    transaction, so postings become searchable as they arrive and memory stays
+    bounded by the batch size.
+
     Args:
         ctx: ARQ worker context (contains Redis pool).
         queries: List of search queries.
@@ -97,66 +168,58 @@ async def run_scraping(
 
     settings = get_settings()
     config = load_user_config(settings.user_config_path)
-    scrapers = _build_scrapers(config)
+    # Feeds are query-independent: fetch each once and reuse it for every query
+    snapshots = FeedSnapshots()
+    scrapers = _build_scrapers(config, snapshots)
 
     orchestrator = ScrapingOrchestrator(
         scrapers=scrapers,
         deduplicator=JobDeduplicator(),
+        embedder=JobEmbedder(embeddings=get_embeddings("retrieval_document", cached=True)),
+        max_concurrency=settings.scraper_max_concurrency,
+        source_timeout=settings.scraper_source_timeout,
     )
 
     results = {}
-    all_jobs: list[JobPosting] = []
-
-    for query in queries:
-        result = await orchestrator.run(
-            query,
-            location=location,
-            remote_only=remote_only,
-            num_pages=config.num_pages_per_source,
-            employment_type=(
-                config.employment_types[0] if config.employment_types else None
-            ),
-            date_posted=config.date_posted,
-        )
-        all_jobs.extend(result.jobs)
-        results[query] = {
-            "total": result.total,
-            "new": result.new,
-            "duplicates": result.duplicates,
-            "errors": result.errors,
-        }
-
-    # Persist scraped jobs to database
-    async with get_db_session_ctx() as db:
-        for posting in all_jobs:
-            # Check for existing job by external_id + source
-            existing = await db.execute(
-                select(Job).where(
-                    Job.external_id == posting.external_id,
-                    Job.source == posting.source,
-                )
-            )
-            if existing.scalar_one_or_none():
-                continue
-
-            job = Job(
-                external_id=posting.external_id,
-                source=posting.source,
-                title=posting.title,
-                company=posting.company,
-                location=posting.location,
-                workplace_type=posting.workplace_type,
-                description=posting.description,
-                requirements=posting.requirements,
-                salary_min=posting.salary_min,
-                salary_max=posting.salary_max,
-                salary_currency=posting.salary_currency,
-                employment_type=posting.employment_type,
-                experience_level=posting.experience_level,
-                apply_url=posting.apply_url,
-                raw_data=posting.raw_data,
+    persisted = UpsertResult()
+
+    try:
+        for query in queries:
+            stats = OrchestrationResult()
+            batches = orchestrator.stream(
+                query,
+                stats=stats,
+                location=location,
+                remote_only=remote_only,
+                num_pages=config.num_pages_per_source,
+                employment_type=(
+                    config.employment_types[0] if config.employment_types else None
+                ),
+                date_posted=config.date_posted,
             )
-            db.add(job)
+            async with aclosing(batches):
+                async for batch in batches:
+                    # Persist scraped jobs in bulk (INSERT ... ON CONFLICT), one batch at a time
+                    async with get_db_session_ctx() as db:
+                        upserted = await upsert_jobs(
+                            db, batch, update_existing=settings.scraper_refresh_existing_jobs
+                        )
+                    persisted.inserted += upserted.inserted
+                    persisted.updated += upserted.updated
+                    persisted.skipped += upserted.skipped
+            results[query] = {
+                "total": stats.total,
+                "new": stats.new,
+                "duplicates": stats.duplicates,
+                "errors": stats.errors,
+            }
+        results["feeds"] = snapshots.stats()
+    finally:
+        snapshots.clear()
+
+    results["persisted"] = persisted.to_dict()
+    # Cumulative for this worker process: the pooled client outlives the task
+    results["http"] = http_client_stats()
 
     logger.info(f"Scraping complete: {results}")
     return results
@@ -171,7 +234,7 @@ async def run_matching(ctx: dict, user_id: int = 1):
     """
     logger.info(f"Starting matching task for user {user_id}")
 
-    # Load user and jobs from DB
+    # Load user and check for unscored jobs
     async with get_db_session_ctx() as db:
         user = await db.get(User, user_id)
         if not user or not user.resume_text:
@@ -179,83 +242,128 @@ async def run_matching(ctx: dict, user_id: int = 1):
             return {"status": "failed", "error": "User not found or missing resume"}
 
         resume_text = user.resume_text
-        jobs_result = await db.execute(select(Job))
-        db_jobs = jobs_result.scalars().all()
+        # Cheap probe so an up-to-date user doesn't pay for pipeline setup
+        probe = await db.execute(_unscored_jobs_query(user_id).with_only_columns(Job.id).limit(1))
+        has_unscored = bool(probe.scalars().all())
 
-    if not db_jobs:
-        logger.warning("No jobs in database to match against")
+    if not has_unscored:
+        logger.info(f"No unscored jobs for user {user_id}")
         return {"status": "complete", "matches": 0}
 
-    # Skip already-scored jobs for this user
+    settings = get_settings()
+    config = load_user_config(settings.user_config_path)
+    pipeline = MatchingPipeline(
+        final_k=config.final_results_count,
+        user_config=config,
+        metrics_path=(
+            settings.data_dir / "pipeline_metrics.jsonl"
+            if settings.pipeline_metrics_enabled
+            else None
+        ),
+    )
+    matches, report = await pipeline.match_with_report(
+        resume_text,
+        jobs=_stream_unscored_jobs(user_id, settings.matching_load_chunk_size),
+        load_jobs=_load_postings,
+    )
+
+    # Store results in DB; postings carry their jobs.id, so no per-match lookups
     async with get_db_session_ctx() as db:
-        scored_result = await db.execute(
-            select(MatchResult.job_id).where(MatchResult.user_id == user_id)
-        )
-        scored_job_ids = {row for row in scored_result.scalars().all()}
+        persisted = await upsert_match_results(db, user_id, matches)
+
+    logger.info(f"Matching complete: {len(matches)} matches for user {user_id}")
+    return {
+        "status": "complete",
+        "matches": len(matches),
+        "persisted": persisted.to_dict(),
+        "metrics": report.to_dict(),
+    }
 
-    unscored_jobs = [j for j in db_jobs if j.id not in scored_job_ids]
-    if not unscored_jobs:
-        logger.info(f"All {len(db_jobs)} jobs already scored for user {user_id}")
-        return {"status": "complete", "matches": 0, "skipped": len(db_jobs)}
 
-    logger.info(
-        f"Matching {len(unscored_jobs)} unscored jobs "
-        f"(skipped {len(db_jobs) - len(unscored_jobs)} already scored)"
+async def _stream_match_texts(
+    user_id: int, chunk_size: int
+) -> AsyncIterator[list[tuple[int, float, float | None, str, str | None]]]:
+    """Yield a user's matches with their job texts in chunks from a server-side cursor.
+
+    Rows are (match id, overall score, requirements ratio, description, requirements).
+    """
+    query = (
+        select(
+            MatchResult.id,
+            MatchResult.overall_score,
+            MatchResult.requirements_met_ratio,
+            Job.description,
+            Job.requirements,
+        )
+        .join(Job, MatchResult.job_id == Job.id)
+        .where(MatchResult.user_id == user_id)
+        .order_by(MatchResult.id)
+        .execution_options(yield_per=chunk_size)
     )
+    async with get_db_session_ctx() as db:
+        result = await db.stream(query)
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+
+async def rescore_ats(ctx: dict, user_id: int = 1):
+    """Background task: recompute ATS scores for all of a user's matches.
 
-    postings = [_job_model_to_posting(j) for j in unscored_jobs]
+    Job texts stream from the DB in chunks, are scored across a process pool,
+    and each finished chunk is written back (ats_score, ats_details and
+    integrated_score) in one bulk UPDATE, so the event loop stays free.
 
-    config = load_user_config(get_settings().user_config_path)
-    pipeline = MatchingPipeline(final_k=config.final_results_count, user_config=config)
-    matches = await pipeline.match(resume_text, jobs=postings)
+    Args:
+        ctx: ARQ worker context.
+        user_id: The user whose matches to rescore.
+    """
+    logger.info(f"Starting ATS rescoring for user {user_id}")
 
-    # Store results in DB
     async with get_db_session_ctx() as db:
-        for m in matches:
-            # Find the DB job ID by external_id + source
-            job_result = await db.execute(
-                select(Job).where(
-                    Job.external_id == m.job.external_id,
-                    Job.source == m.job.source,
-                )
-            )
-            db_job = job_result.scalar_one_or_none()
-            if not db_job:
-                continue
-
-            # Check for existing match
-            existing = await db.execute(
-                select(MatchResult).where(
-                    MatchResult.user_id == user_id,
-                    MatchResult.job_id == db_job.id,
-                )
-            )
-            if existing.scalar_one_or_none():
-                continue
-
-            match_result = MatchResult(
-                user_id=user_id,
-                job_id=db_job.id,
-                overall_score=m.score.overall_score,
-                score_breakdown=m.score.breakdown,
-                reasoning=m.score.reasoning,
-                strengths=m.score.strengths,
-                missing_skills=m.score.missing_skills,
-                interview_talking_points=getattr(m.score, "interview_talking_points", []),
-                ats_score=m.ats_score.score if m.ats_score else None,
-                ats_details=m.ats_score.model_dump() if m.ats_score else None,
-                requirement_matches=(
-                    [rm.model_dump() for rm in m.score.requirement_matches]
-                    if m.score.requirement_matches
-                    else None
-                ),
-                requirements_met_ratio=m.score.requirements_met_ratio,
-                integrated_score=m.integrated_score,
-            )
-            db.add(match_result)
+        user = await db.get(User, user_id)
+        if not user or not user.resume_text:
+            logger.error(f"User {user_id} not found or has no resume")
+            return {"status": "failed", "error": "User not found or missing resume"}
+        resume_text = user.resume_text
 
-    logger.info(f"Matching complete: {len(matches)} matches for user {user_id}")
-    return {"status": "complete", "matches": len(matches)}
+    settings = get_settings()
+    workers = settings.ats_backfill_workers or default_workers()
+    # LLM scores of in-flight matches, needed to recompute integrated_score
+    llm_scores: dict[int, tuple[float, float | None]] = {}
+
+    async def _rows() -> AsyncIterator[list[ATSRow]]:
+        async for chunk in _stream_match_texts(user_id, settings.ats_backfill_chunk_size):
+            rows = []
+            for match_id, overall, ratio, description, requirements in chunk:
+                llm_scores[match_id] = (overall, ratio)
+                rows.append((match_id, description, requirements))
+            yield rows
+
+    updated = 0
+    executor = make_ats_executor(resume_text, workers)
+    try:
+        async for results in score_in_pool(executor, _rows(), max_in_flight=2 * workers):
+            values = []
+            for match_id, details in results:
+                overall, ratio = llm_scores.pop(match_id)
+                values.append({
+                    "id": match_id,
+                    "ats_score": details["score"],
+                    "ats_details": details,
+                    "integrated_score": compute_integrated_score(
+                        llm_score=overall,
+                        ats_score=details["score"],
+                        requirements_met_ratio=ratio,
+                    ),
+                })
+            async with get_db_session_ctx() as db:
+                await db.execute(update(MatchResult), values)
+            updated += len(values)
+    finally:
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    logger.info(f"ATS rescoring complete: {updated} matches for user {user_id}")
+    return {"status": "complete", "rescored": updated}
 
 
 async def run_agent(ctx: dict, job_id: int, user_id: int = 1):
@@ -333,8 +441,14 @@ async def run_agent(ctx: dict, job_id: int, user_id: int = 1):
 async def startup(ctx: dict):
     """ARQ worker startup hook."""
     logger.info("ARQ worker starting up")
+    init_engine()
+    init_http_client()
 
 
 async def shutdown(ctx: dict):
     """ARQ worker shutdown hook."""
     logger.info("ARQ worker shutting down")
+    await close_http_client()
+    close_score_cache()
+    close_embedding_caches()
+    await dispose_engine()
@@ -0,0 +1,115 @@
+"""Benchmark JobPreFilter throughput on synthetic postings.
+
+Usage:
+    uv run python scripts/benchmark_pre_filter.py [--jobs 100000] [--repeat 5]
+
+Needs no API keys or database; postings are generated in memory.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import UserConfig
+from app.schemas.matching import JobPosting
+from app.services.matching.pre_filter import JobColumns, JobPreFilter
+
+SENIORITY = ["", "Junior ", "Senior ", "Sr. ", "Staff ", "Principal ", "Lead ", "Intern "]
+ROLES = [
+    "Software Engineer",
+    "Backend Developer",
+    "Data Scientist",
+    "Platform Engineer",
+    "ML Engineer",
+    "Director of Engineering",
+    "VP of Engineering",
+    "Engineering Manager",
+]
+TEAMS = ["", ", Payments", ", Infrastructure", " - Search", " (Remote)", ", Growth"]
+LOCATIONS = [
+    None,
+    "Remote",
+    "Remote - US",
+    "New York, NY, United States",
+    "San Francisco, CA",
+    "Toronto, Canada",
+    "Berlin, Germany",
+    "London, United Kingdom",
+    "Bengaluru, India",
+    "Austin, Texas, United States",
+]
+EMPLOYMENT = [None, "Full-time", "FULLTIME", "Contract", "Part-time", "Internship"]
+
+
+def make_jobs(count: int, seed: int = 7) -> list[JobPosting]:
+    """Generate postings with a realistic mix of repeated and unique titles."""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        title = f"{rng.choice(SENIORITY)}{rng.choice(ROLES)}{rng.choice(TEAMS)}"
+        if rng.random() < 0.3:
+            title += f" {i}"  # long tail of one-off titles
+        low = rng.choice([None, 80_000, 120_000, 160_000, 220_000])
+        jobs.append(
+            JobPosting(
+                external_id=f"bench-{i}",
+                source="bench",
+                title=title,
+                company=f"Company {i % 5000}",
+                description="",
+                location=rng.choice(LOCATIONS),
+                employment_type=rng.choice(EMPLOYMENT),
+                salary_min=low,
+                salary_max=low + 40_000 if low else None,
+            )
+        )
+    return jobs
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config = UserConfig(
+        experience_level="mid",
+        locations=["Remote", "United States", "Canada"],
+        employment_types=["FULLTIME", "CONTRACT"],
+        salary_min=100_000,
+        salary_max=200_000,
+        excluded_locations=["India"],
+    )
+    jobs = make_jobs(args.jobs)
+    pre_filter = JobPreFilter(config)
+    columns = JobColumns.from_jobs(jobs)
+
+    kept = len(pre_filter.filter(jobs))
+    timings = {
+        "filter(jobs)": _best_of(lambda: pre_filter.filter(jobs), args.repeat),
+        "evaluate(columns)": _best_of(lambda: pre_filter.evaluate(columns), args.repeat),
+        "JobColumns.from_jobs": _best_of(lambda: JobColumns.from_jobs(jobs), args.repeat),
+    }
+
+    print(f"{args.jobs:,} postings, {kept:,} kept (best of {args.repeat})")
+    for name, seconds in timings.items():
+        per_job_us = seconds / args.jobs * 1e6
+        print(f"  {name:<22} {seconds * 1000:8.1f} ms  {per_job_us:6.2f} µs/job")
+
+
+if __name__ == "__main__":
+    main()
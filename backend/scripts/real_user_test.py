@@ -326,7 +326,7 @@ async def main():
     import chromadb
     chroma_client = chromadb.EphemeralClient()
 
-    embeddings = get_embeddings("retrieval_document")
+    embeddings = get_embeddings("retrieval_document", cached=True)
     embedder = JobEmbedder(embeddings=embeddings, chroma_client=chroma_client)
 
     jobs = [JobPosting(**j) for j in SAMPLE_JOBS]
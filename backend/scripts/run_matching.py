@@ -18,6 +18,7 @@ import chromadb
 
 from app.config import load_user_config
 from app.schemas.matching import JobPosting
+from app.services.cache.scores import get_score_cache
 from app.services.llm_factory import LLMTask, get_embeddings, get_llm
 from app.services.matching.embedder import JobEmbedder
 from app.services.matching.pipeline import MatchingPipeline
@@ -54,9 +55,9 @@ async def main():
     # Set up pipeline with ephemeral ChromaDB (no persistence for testing)
     print("\nInitializing pipeline...")
     client = chromadb.EphemeralClient()
-    embeddings = get_embeddings("retrieval_document")
+    embeddings = get_embeddings("retrieval_document", cached=True)
     embedder = JobEmbedder(embeddings=embeddings, chroma_client=client)
-    scorer = JobScorer(llm=get_llm(LLMTask.SCORE))
+    scorer = JobScorer(llm=get_llm(LLMTask.SCORE), cache=get_score_cache())
 
     pipeline = MatchingPipeline(
         embedder=embedder,
@@ -100,6 +101,9 @@ async def main():
             print(f"   Gaps:      {', '.join(score.missing_skills)}")
         print()
 
+    if pipeline.last_report:
+        print(f"Pipeline: {pipeline.last_report.summary()}")
+
     print(f"{'=' * 60}")
     print("Pipeline test complete!")
 
@@ -10,6 +10,17 @@ from app.schemas.matching import JobPosting
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _plain_scraper_http_client(monkeypatch):
+    """Keep scrapers off the on-disk HTTP cache, quotas and retry backoff during tests."""
+    from app.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "scraper_http_cache_enabled", False)
+    monkeypatch.setattr(settings, "scraper_rate_limits", {})
+    monkeypatch.setattr(settings, "scraper_retry_attempts", 0)
+
+
 @pytest.fixture
 def sample_resume_text() -> str:
     """Load sample resume text from fixture file."""
@@ -310,7 +310,7 @@ async def match_jobs(
         user_config=USER_CONFIG,
         initial_k=min(top_k + 10, len(jobs)),  # Retrieve a bit more than needed
         final_k=min(top_k, len(jobs)),
-        score_concurrency=3,
+        max_concurrency=3,
     )
 
     logger.info(f"  Indexing {len(jobs)} jobs into ChromaDB...")
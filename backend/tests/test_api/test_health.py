@@ -0,0 +1,26 @@
+"""Tests for the health check and internal diagnostics endpoints."""
+
+from unittest.mock import patch
+
+from app.config import Settings
+
+
+class TestHealthEndpoints:
+    """Tests for GET /health and GET /internal/db-pool."""
+
+    async def test_health_does_not_expose_pool_internals(self, client):
+        resp = await client.get("/health")
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "healthy"}
+
+    async def test_db_pool_hidden_by_default(self, client):
+        with patch("app.main.get_settings", return_value=Settings()):
+            resp = await client.get("/internal/db-pool")
+        assert resp.status_code == 404
+
+    async def test_db_pool_served_when_enabled(self, client):
+        settings = Settings(internal_metrics_enabled=True)
+        with patch("app.main.get_settings", return_value=settings):
+            resp = await client.get("/internal/db-pool")
+        assert resp.status_code == 200
+        assert "checkouts" in resp.json()
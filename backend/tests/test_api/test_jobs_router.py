@@ -22,6 +22,25 @@ class TestListJobs:
         assert len(data["items"]) == 2
         assert data["total"] == 5
 
+    async def test_list_jobs_cursor_walk(self, seeded_client: AsyncClient):
+        ids, cursor = [], None
+        for _ in range(3):
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = (await seeded_client.get("/api/jobs", params=params)).json()
+            ids.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+        assert len(ids) == 5
+        assert len(set(ids)) == 5
+        assert cursor is None
+
+    async def test_list_jobs_estimated_count_falls_back_to_exact(
+        self, seeded_client: AsyncClient
+    ):
+        resp = await seeded_client.get("/api/jobs", params={"count": "estimated"})
+        data = resp.json()
+        assert data["total"] == 5
+        assert data["total_estimated"] is False
+
     async def test_list_jobs_filter_by_location(self, seeded_client: AsyncClient):
         resp = await seeded_client.get("/api/jobs", params={"location": "Remote"})
         assert resp.status_code == 200
@@ -42,6 +61,20 @@ class TestListJobs:
         data = resp.json()
         assert len(data["items"]) >= 1
 
+    async def test_list_jobs_search_rejects_cursor(self, seeded_client: AsyncClient):
+        first = (await seeded_client.get("/api/jobs", params={"limit": 2})).json()
+        resp = await seeded_client.get(
+            "/api/jobs", params={"q": "Engineer", "cursor": first["next_cursor"]}
+        )
+        assert resp.status_code == 422
+
+    async def test_list_jobs_filter_by_company(self, seeded_client: AsyncClient):
+        resp = await seeded_client.get("/api/jobs", params={"company": "company3"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["items"][0]["company"] == "Company3"
+
     async def test_list_jobs_empty_result(self, seeded_client: AsyncClient):
         resp = await seeded_client.get("/api/jobs", params={"q": "nonexistentxyz"})
         assert resp.status_code == 200
@@ -1,6 +1,21 @@
 """Tests for the matches API router."""
 
 from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.match import MatchResult
+
+
+async def _set_scores(db_engine, scores: dict[float, dict]) -> None:
+    """Update integrated/ATS scores keyed by the seeded overall_score."""
+    factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        for overall, values in scores.items():
+            await session.execute(
+                update(MatchResult).where(MatchResult.overall_score == overall).values(**values)
+            )
+        await session.commit()
 
 
 class TestListMatches:
@@ -27,6 +42,62 @@ class TestListMatches:
         assert len(data["items"]) == 2
         assert data["total"] == 5
 
+    async def test_list_matches_cursor_walk(self, seeded_client: AsyncClient):
+        seen, cursor = [], None
+        for _ in range(3):
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = (await seeded_client.get("/api/matches", params=params)).json()
+            seen.extend(m["overall_score"] for m in data["items"])
+            cursor = data["next_cursor"]
+        assert seen == [10.0, 9.0, 8.0, 7.0, 6.0]
+        assert cursor is None
+
+    async def test_list_matches_invalid_cursor(self, seeded_client: AsyncClient):
+        resp = await seeded_client.get("/api/matches", params={"cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+
+
+class TestMatchSorting:
+    """Tests for per-user listing with sort=integrated/ats."""
+
+    async def test_sort_by_integrated_falls_back_to_overall(
+        self, seeded_client: AsyncClient, db_engine
+    ):
+        await _set_scores(db_engine, {6.0: {"integrated_score": 9.5}, 10.0: {"integrated_score": 7.5}})
+        resp = await seeded_client.get("/api/matches", params={"sort": "integrated"})
+        assert resp.status_code == 200
+        overall = [m["overall_score"] for m in resp.json()["items"]]
+        # 6.0 ranks first (9.5), 10.0 drops to 7.5, others keep their LLM score
+        assert overall == [6.0, 9.0, 8.0, 10.0, 7.0]
+
+    async def test_sort_by_ats_puts_unscored_last(self, seeded_client: AsyncClient, db_engine):
+        await _set_scores(db_engine, {7.0: {"ats_score": 80.0}, 9.0: {"ats_score": 40.0}})
+        cursor, ats = None, []
+        for _ in range(3):
+            params = {"sort": "ats", "limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = (await seeded_client.get("/api/matches", params=params)).json()
+            ats.extend(m["ats_score"] for m in data["items"])
+            cursor = data["next_cursor"]
+        assert ats == [80.0, 40.0, None, None, None]
+
+    async def test_min_score_applies_to_sort_key(self, seeded_client: AsyncClient, db_engine):
+        await _set_scores(db_engine, {6.0: {"integrated_score": 9.5}, 10.0: {"integrated_score": 7.5}})
+        params = {"sort": "integrated", "min_score": 8.0}
+        data = (await seeded_client.get("/api/matches", params=params)).json()
+        assert [m["overall_score"] for m in data["items"]] == [6.0, 9.0, 8.0]
+        assert data["total"] == 3
+
+    async def test_filter_by_user(self, seeded_client: AsyncClient):
+        # The seeded user is the only user
+        resp = await seeded_client.get("/api/matches", params={"user_id": 1})
+        assert resp.json()["total"] == 5
+        resp = await seeded_client.get("/api/matches", params={"user_id": 2})
+        assert resp.json()["total"] == 0
+
+    async def test_invalid_sort_rejected(self, seeded_client: AsyncClient):
+        resp = await seeded_client.get("/api/matches", params={"sort": "salary"})
+        assert resp.status_code == 422
+
 
 class TestGetMatch:
     """Tests for GET /api/matches/{id}."""
@@ -0,0 +1,67 @@
+"""Tests for the shared SQLite LRU store backing the persistent caches."""
+
+import time
+
+import pytest
+
+from app.services.cache.store import RowCodec, SqliteLruStore
+
+TEXT_CODEC: RowCodec[str] = RowCodec(
+    columns={"value": "TEXT NOT NULL"},
+    encode=lambda _key, value: (value,),
+    decode=lambda row: row[0],
+)
+
+
+@pytest.fixture
+def store():
+    s = SqliteLruStore("items", TEXT_CODEC, max_entries=3)
+    yield s
+    s.close()
+
+
+class TestSqliteLruStore:
+    """Storage, LRU and TTL semantics."""
+
+    def test_roundtrip_and_stats(self, store):
+        store.set("a", "one")
+        assert store.get("a") == "one"
+        assert store.get("missing") is None
+        assert store.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_get_many_counts_each_requested_key(self, store):
+        store.set_many({"a": "1", "b": "2"})
+        found = store.get_many(["a", "a", "c"])
+        assert found == {"a": "1"}
+        assert (store.hits, store.misses) == (2, 1)
+
+    def test_evicts_least_recently_used(self, store):
+        store.set_many({"a": "1", "b": "2", "c": "3"})
+        store.get("a")  # "b" becomes least recently used
+        store.set("d", "4")
+        assert len(store) == 3
+        assert sorted(store.keys()) == ["a", "c", "d"]
+
+    def test_ttl_expiry(self):
+        store = SqliteLruStore("items", TEXT_CODEC, ttl_seconds=0.01)
+        store.set("k", "v")
+        time.sleep(0.05)
+        assert store.get("k") is None
+        assert len(store) == 0
+        store.close()
+
+    def test_update_and_clear(self, store):
+        store.set("a", "1")
+        store.update("a", value="2")
+        assert store.get("a") == "2"
+        store.clear()
+        assert len(store) == 0
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "nested" / "store.db"
+        first = SqliteLruStore("items", TEXT_CODEC, db_path=path)
+        first.set("k", "v")
+        first.close()
+        second = SqliteLruStore("items", TEXT_CODEC, db_path=path)
+        assert second.get("k") == "v"
+        second.close()
@@ -0,0 +1,187 @@
+"""Tests for bulk INSERT ... ON CONFLICT persistence helpers."""
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.bulk import resolve_job_ids, upsert_jobs, upsert_match_results
+from app.models.job import Job
+from app.models.match import MatchResult
+from app.models.user import User
+from app.schemas.matching import JobPosting, ScoredMatch
+from tests.fixtures.mock_responses import make_high_match_score, make_low_match_score
+
+
+def _posting(idx: int, source: str = "test", **overrides) -> JobPosting:
+    fields = {
+        "external_id": f"ext-{idx:04d}",
+        "source": source,
+        "title": f"Engineer {idx}",
+        "company": "TestCo",
+        "description": "Build things.",
+        "raw_data": {"idx": idx},
+    }
+    fields.update(overrides)
+    return JobPosting(**fields)
+
+
+async def _job_count(db: AsyncSession) -> int:
+    return (await db.execute(select(func.count()).select_from(Job))).scalar_one()
+
+
+class TestUpsertJobs:
+    """Tests for upsert_jobs()."""
+
+    async def test_inserts_new_jobs(self, db_session: AsyncSession):
+        result = await upsert_jobs(db_session, [_posting(i) for i in range(5)])
+        assert result.to_dict() == {"inserted": 5, "updated": 0, "skipped": 0}
+        assert await _job_count(db_session) == 5
+
+    async def test_empty_input_is_noop(self, db_session: AsyncSession):
+        result = await upsert_jobs(db_session, [])
+        assert result.total == 0
+
+    async def test_existing_jobs_skipped_by_default(self, db_session: AsyncSession):
+        await upsert_jobs(db_session, [_posting(1), _posting(2)])
+        result = await upsert_jobs(
+            db_session, [_posting(1, title="Changed"), _posting(3)]
+        )
+        assert result.to_dict() == {"inserted": 1, "updated": 0, "skipped": 1}
+        job = (await db_session.execute(select(Job).where(Job.external_id == "ext-0001"))).scalar_one()
+        assert job.title == "Engineer 1"
+
+    async def test_update_existing_refreshes_changed_rows(self, db_session: AsyncSession):
+        await upsert_jobs(db_session, [_posting(1), _posting(2)])
+        result = await upsert_jobs(
+            db_session,
+            [_posting(1, title="Senior Engineer", salary_min=150_000), _posting(2), _posting(3)],
+            update_existing=True,
+        )
+        assert result.to_dict() == {"inserted": 1, "updated": 1, "skipped": 1}
+
+        db_session.expire_all()
+        job = (await db_session.execute(select(Job).where(Job.external_id == "ext-0001"))).scalar_one()
+        assert job.title == "Senior Engineer"
+        assert job.salary_min == 150_000
+        assert await _job_count(db_session) == 3
+
+    async def test_same_external_id_different_source(self, db_session: AsyncSession):
+        result = await upsert_jobs(db_session, [_posting(1, "lever"), _posting(1, "greenhouse")])
+        assert result.inserted == 2
+
+    async def test_duplicate_keys_in_input_collapsed(self, db_session: AsyncSession):
+        result = await upsert_jobs(
+            db_session, [_posting(1), _posting(1, title="Later copy")], update_existing=True
+        )
+        assert result.to_dict() == {"inserted": 1, "updated": 0, "skipped": 1}
+        job = (await db_session.execute(select(Job))).scalar_one()
+        assert job.title == "Later copy"
+
+    async def test_chunks_into_few_statements(self, db_session: AsyncSession, db_engine):
+        statements: list[str] = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _count)
+        try:
+            result = await upsert_jobs(
+                db_session, [_posting(i) for i in range(250)], chunk_size=100
+            )
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _count)
+
+        assert result.inserted == 250
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 3
+
+
+async def _create_user(db: AsyncSession) -> User:
+    user = User(email="bulk@example.com", full_name="Bulk User")
+    db.add(user)
+    await db.flush()
+    return user
+
+
+class TestResolveJobIds:
+    """Tests for resolve_job_ids()."""
+
+    async def test_resolves_in_one_query_per_chunk(self, db_session: AsyncSession):
+        await upsert_jobs(db_session, [_posting(i) for i in range(3)])
+        ids = await resolve_job_ids(
+            db_session, [("ext-0000", "test"), ("ext-0002", "test"), ("missing", "test")]
+        )
+        assert set(ids) == {("ext-0000", "test"), ("ext-0002", "test")}
+        assert all(isinstance(v, int) for v in ids.values())
+
+
+class TestUpsertMatchResults:
+    """Tests for upsert_match_results()."""
+
+    async def test_inserts_using_carried_db_ids(self, db_session: AsyncSession, db_engine):
+        user = await _create_user(db_session)
+        await upsert_jobs(db_session, [_posting(i) for i in range(3)])
+        ids = await resolve_job_ids(db_session, [(f"ext-{i:04d}", "test") for i in range(3)])
+        matches = [
+            ScoredMatch(
+                job=_posting(i, db_id=ids[(f"ext-{i:04d}", "test")]),
+                score=make_high_match_score(),
+                integrated_score=8.5,
+            )
+            for i in range(3)
+        ]
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            result = await upsert_match_results(db_session, user.id, matches)
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _record)
+
+        assert result.to_dict() == {"inserted": 3, "updated": 0, "skipped": 0}
+        # No job lookups needed: a single INSERT statement
+        assert len(statements) == 1
+        rows = (await db_session.execute(select(MatchResult))).scalars().all()
+        assert {r.integrated_score for r in rows} == {8.5}
+        assert rows[0].score_breakdown["skills"] == make_high_match_score().breakdown.skills
+
+    async def test_resolves_missing_ids_and_skips_unknown_jobs(self, db_session: AsyncSession):
+        user = await _create_user(db_session)
+        await upsert_jobs(db_session, [_posting(1)])
+        matches = [
+            ScoredMatch(job=_posting(1), score=make_high_match_score()),
+            ScoredMatch(job=_posting(99), score=make_high_match_score()),
+        ]
+        result = await upsert_match_results(db_session, user.id, matches)
+        assert result.to_dict() == {"inserted": 1, "updated": 0, "skipped": 1}
+
+    async def test_existing_match_kept_by_default(self, db_session: AsyncSession):
+        user = await _create_user(db_session)
+        await upsert_jobs(db_session, [_posting(1)])
+        await upsert_match_results(
+            db_session, user.id, [ScoredMatch(job=_posting(1), score=make_high_match_score())]
+        )
+        result = await upsert_match_results(
+            db_session, user.id, [ScoredMatch(job=_posting(1), score=make_low_match_score())]
+        )
+        assert result.to_dict() == {"inserted": 0, "updated": 0, "skipped": 1}
+
+    async def test_update_existing_overwrites_scores(self, db_session: AsyncSession):
+        user = await _create_user(db_session)
+        await upsert_jobs(db_session, [_posting(1)])
+        await upsert_match_results(
+            db_session, user.id, [ScoredMatch(job=_posting(1), score=make_high_match_score())]
+        )
+        result = await upsert_match_results(
+            db_session,
+            user.id,
+            [ScoredMatch(job=_posting(1), score=make_low_match_score())],
+            update_existing=True,
+        )
+        assert result.to_dict() == {"inserted": 0, "updated": 1, "skipped": 0}
+        db_session.expire_all()
+        row = (await db_session.execute(select(MatchResult))).scalar_one()
+        assert row.overall_score == make_low_match_score().overall_score
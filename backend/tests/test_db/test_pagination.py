@@ -0,0 +1,48 @@
+"""Tests for keyset pagination helpers."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.pagination import decode_cursor, encode_cursor, keyset_paginate, next_page
+from app.models.job import Job
+
+COLUMNS = (Job.created_at, Job.id)
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        created = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+        cursor = encode_cursor([created, 42])
+        assert decode_cursor(cursor, COLUMNS) == [created, 42]
+
+    @pytest.mark.parametrize("cursor", ["%%%", "bm90IGpzb24", encode_cursor([1]), encode_cursor(["x", 1])])
+    def test_invalid_cursor_raises(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor, COLUMNS)
+
+
+class TestKeysetPaginate:
+    """Tests for keyset_paginate()/next_page()."""
+
+    def test_seek_predicate_and_order(self):
+        cursor = encode_cursor([datetime(2026, 3, 1, tzinfo=UTC), 7])
+        query = keyset_paginate(select(Job), COLUMNS, cursor, 20, "postgresql")
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "(jobs.created_at, jobs.id) < (" in sql
+        assert "ORDER BY jobs.created_at DESC, jobs.id DESC" in sql
+        assert "LIMIT" in sql
+
+    def test_next_page_trims_lookahead(self):
+        page, cursor = next_page([(3,), (2,), (1,)], 2, lambda row: row)
+        assert page == [(3,), (2,)]
+        assert cursor == encode_cursor([2])
+
+    def test_last_page_has_no_cursor(self):
+        page, cursor = next_page([(2,), (1,)], 2, lambda row: row)
+        assert len(page) == 2
+        assert cursor is None
@@ -0,0 +1,36 @@
+"""Tests for job full-text search query building."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.search import apply_job_search, order_by_relevance
+from app.models.job import Job
+
+
+def _sql(query, dialect) -> str:
+    return str(query.compile(dialect=dialect))
+
+
+class TestApplyJobSearch:
+    """Tests for apply_job_search()/order_by_relevance()."""
+
+    def test_postgres_uses_search_vector(self):
+        query = apply_job_search(select(Job), "python -java", "postgresql")
+        sql = _sql(query, postgresql.dialect())
+        assert "jobs.search_vector @@ websearch_to_tsquery" in sql
+        assert "LIKE" not in sql.upper()
+
+    def test_postgres_orders_by_rank(self):
+        query = order_by_relevance(select(Job), "python", "postgresql")
+        sql = _sql(query, postgresql.dialect())
+        assert "ORDER BY ts_rank_cd(jobs.search_vector" in sql
+        assert "DESC, jobs.created_at DESC" in sql
+
+    def test_sqlite_falls_back_to_like(self):
+        query = order_by_relevance(
+            apply_job_search(select(Job), "python", "sqlite"), "python", "sqlite"
+        )
+        sql = _sql(query, sqlite.dialect())
+        assert "search_vector" not in sql
+        assert "LIKE" in sql.upper()
+        assert "ORDER BY jobs.created_at DESC" in sql
@@ -0,0 +1,105 @@
+"""Tests for the process-wide async engine and session factory."""
+
+import pytest
+from sqlalchemy import text
+
+from app.db import session as db_session_module
+from app.db.session import (
+    dispose_engine,
+    get_db_session_ctx,
+    get_engine,
+    get_session_factory,
+    init_engine,
+    pool_stats,
+)
+from app.worker.tasks import shutdown, startup
+
+SQLITE_URL = "sqlite+aiosqlite:///"
+
+
+@pytest.fixture(autouse=True)
+async def _reset_engine():
+    await dispose_engine()
+    yield
+    await dispose_engine()
+
+
+class TestEngineLifecycle:
+    """Tests for init_engine()/dispose_engine() and factory reuse."""
+
+    async def test_session_factory_is_shared(self):
+        init_engine(SQLITE_URL)
+        assert get_session_factory() is get_session_factory()
+
+    async def test_init_engine_is_idempotent(self):
+        engine = init_engine(SQLITE_URL)
+        assert init_engine(SQLITE_URL) is engine
+
+    async def test_sessions_reuse_one_engine(self):
+        engine = init_engine(SQLITE_URL)
+        async with get_db_session_ctx() as first:
+            await first.execute(text("SELECT 1"))
+            assert first.get_bind() is engine.sync_engine
+        async with get_db_session_ctx() as second:
+            assert second.get_bind() is engine.sync_engine
+
+    async def test_dispose_resets_engine(self):
+        engine = init_engine(SQLITE_URL)
+        await dispose_engine()
+        assert db_session_module._engine is None
+        assert init_engine(SQLITE_URL) is not engine
+
+    async def test_explicit_url_gets_standalone_factory(self):
+        init_engine(SQLITE_URL)
+        assert get_session_factory(SQLITE_URL) is not get_session_factory()
+
+    async def test_explicit_url_engine_is_cached_and_disposed(self, monkeypatch):
+        created = []
+
+        def _tracking_engine(url=None):
+            engine = get_engine(url)
+            created.append(engine)
+            return engine
+
+        monkeypatch.setattr(db_session_module, "get_engine", _tracking_engine)
+        assert get_session_factory(SQLITE_URL) is get_session_factory(SQLITE_URL)
+        assert len(created) == 1
+        await dispose_engine()
+        assert db_session_module._url_engines == {}
+
+    async def test_worker_hooks_manage_engine(self, monkeypatch):
+        monkeypatch.setattr(db_session_module, "get_engine", lambda url=None: get_engine(SQLITE_URL))
+        await startup({})
+        assert db_session_module._engine is not None
+        await shutdown({})
+        assert db_session_module._engine is None
+
+
+class TestPoolConfiguration:
+    """Tests for pool settings and metrics."""
+
+    async def test_postgres_engine_uses_pool_settings(self):
+        from app.config import get_settings
+
+        settings = get_settings()
+        engine = get_engine("postgresql+asyncpg://u:p@localhost:5432/db")
+        try:
+            pool = engine.sync_engine.pool
+            assert pool.size() == settings.db_pool_size
+            assert pool._max_overflow == settings.db_max_overflow
+            assert pool._recycle == settings.db_pool_recycle
+            assert pool._pre_ping is settings.db_pool_pre_ping
+        finally:
+            await engine.dispose()
+
+    async def test_pool_stats_count_checkouts(self):
+        init_engine(SQLITE_URL)
+        before = pool_stats()["checkouts"]
+        for _ in range(3):
+            async with get_db_session_ctx() as session:
+                await session.execute(text("SELECT 1"))
+        stats = pool_stats()
+        assert stats["checkouts"] - before == 3
+        assert stats["checked_out"] == 0
+        assert stats["max_hold_seconds"] >= 0
+        assert "status" in stats
@@ -562,8 +562,11 @@ class TestStep5_ReportGeneration:
         assert "Senior Python Engineer" in letter or "CloudScale" in letter
         assert len(letter) > 100
 
-    async def test_report_api_endpoint(self, api_client: AsyncClient, db_factory):
+    async def test_report_api_endpoint(
+        self, api_client: AsyncClient, db_factory, tmp_path, monkeypatch
+    ):
         """POST /api/reports/generate with a seeded match."""
+        monkeypatch.setattr("app.routers.reports.REPORTS_DIR", tmp_path)
         async with db_factory() as session:
             user = User(email="report@test.com", full_name="Report User", resume_text="test")
             session.add(user)
@@ -598,6 +601,7 @@ class TestStep5_ReportGeneration:
         )
         assert resp.status_code == 200
         assert resp.json()["status"] == "complete"
+        assert any(tmp_path.glob(f"report-{match_id}.*"))
 
     async def test_cover_letter_api_endpoint(self, api_client: AsyncClient, db_factory):
         """POST /api/reports/cover-letter stores a cover letter."""
@@ -0,0 +1,63 @@
+"""Tests for process-pool ATS batch scoring."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.matching import ats_batch
+from app.services.matching.ats_batch import make_ats_executor, score_in_pool, score_rows
+from app.services.matching.ats_scorer import compute_ats_score
+
+RESUME = "Python, Docker and Kubernetes. Strong leadership."
+ROWS = [
+    (1, "Python and Docker required", None),
+    (2, "React and TypeScript", "Communication skills"),
+    (3, "Kubernetes on AWS", "Leadership"),
+    (4, "Nothing relevant", None),
+    (5, "Go services", "Python nice to have"),
+]
+
+
+async def _chunks(rows, size):
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def _expected(rows):
+    return {key: compute_ats_score(RESUME, desc, req).model_dump() for key, desc, req in rows}
+
+
+class TestScoreRows:
+    """Tests for score_rows()."""
+
+    def test_requires_initialized_worker(self, monkeypatch):
+        monkeypatch.setattr(ats_batch, "_worker_profile", None)
+        with pytest.raises(RuntimeError, match="not initialized"):
+            score_rows(ROWS)
+
+    def test_matches_compute_ats_score(self, monkeypatch):
+        monkeypatch.setattr(ats_batch, "_worker_profile", None)
+        ats_batch._init_worker(RESUME)
+        assert dict(score_rows(ROWS)) == _expected(ROWS)
+
+
+class TestScoreInPool:
+    """Tests for score_in_pool()."""
+
+    async def test_streams_all_chunks(self, monkeypatch):
+        monkeypatch.setattr(ats_batch, "_worker_profile", None)
+        executor = ThreadPoolExecutor(
+            max_workers=2, initializer=ats_batch._init_worker, initargs=(RESUME,)
+        )
+        with executor:
+            results = [r async for r in score_in_pool(executor, _chunks(ROWS, 2), max_in_flight=2)]
+        assert sorted(len(r) for r in results) == [1, 2, 2]
+        assert dict(item for chunk in results for item in chunk) == _expected(ROWS)
+
+    async def test_process_pool(self):
+        executor = make_ats_executor(RESUME, max_workers=2)
+        try:
+            results = [r async for r in score_in_pool(executor, _chunks(ROWS, 2), max_in_flight=4)]
+        finally:
+            executor.shutdown()
+        assert dict(item for chunk in results for item in chunk) == _expected(ROWS)
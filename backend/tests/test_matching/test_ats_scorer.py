@@ -1,12 +1,15 @@
 """Tests for the ATS keyword scorer."""
 
-from app.schemas.matching import ATSKeywordScore
+from app.schemas.matching import ATSKeywordScore, JobPosting
 from app.services.matching.ats_scorer import (
     SOFT_SKILL_KEYWORDS,
     TECHNICAL_KEYWORDS,
     _extract_keywords,
+    _find_keywords,
     _tokenize,
     compute_ats_score,
+    compute_ats_scores_batch,
+    get_resume_profile,
 )
 
 
@@ -69,6 +72,21 @@ class TestExtractKeywords:
         assert "leadership" in soft
         assert "leadership" not in tech
 
+    def test_matches_tokenizer_ngrams(self):
+        """The trie finds exactly the keywords present among _tokenize() n-grams."""
+        texts = [
+            "Senior Python/Django dev: machine learning, CI/CD, node.js & C++.",
+            "Ruby on Rails . Spring Boot; test driven development",
+            "natural . language processing, self-motivated, .NET, asp.net",
+        ]
+        keywords = TECHNICAL_KEYWORDS | SOFT_SKILL_KEYWORDS
+        for text in texts:
+            assert _find_keywords(text) == _tokenize(text) & keywords
+
+    def test_phrase_broken_by_lone_dot(self):
+        assert "machine learning" not in _find_keywords("machine . learning")
+        assert "machine learning" in _find_keywords("machine learning.")
+
     def test_no_keywords_found(self):
         text = "This job has no recognizable keywords whatsoever"
         tech, soft = _extract_keywords(text)
@@ -192,3 +210,42 @@ class TestComputeAtsScore:
         """Verify the curated keyword sets have reasonable size."""
         assert len(TECHNICAL_KEYWORDS) >= 100
         assert len(SOFT_SKILL_KEYWORDS) >= 20
+
+
+def _job(idx: int, description: str, requirements: str | None = None) -> JobPosting:
+    return JobPosting(
+        external_id=f"ats-{idx}",
+        source="test",
+        title="Engineer",
+        company="Co",
+        description=description,
+        requirements=requirements,
+    )
+
+
+class TestBatchScoring:
+    """Tests for compute_ats_scores_batch() and the resume profile cache."""
+
+    def test_batch_matches_single_scores(self):
+        resume = "Python, Docker, Kubernetes, leadership and mentoring"
+        jobs = [
+            _job(1, "Python and Go services on Kubernetes", "Strong communication"),
+            _job(2, "React frontend with TypeScript"),
+            _job(3, "No keywords here"),
+        ]
+        batch = compute_ats_scores_batch(resume, jobs)
+        single = [compute_ats_score(resume, j.description, j.requirements) for j in jobs]
+        assert batch == single
+
+    def test_resume_profile_cached(self):
+        get_resume_profile.cache_clear()
+        resume = "Python and leadership"
+        compute_ats_scores_batch(resume, [_job(i, "Python role") for i in range(50)])
+        info = get_resume_profile.cache_info()
+        assert (info.misses, info.hits) == (1, 0)
+        profile = get_resume_profile(resume)
+        assert profile.technical == {"python"}
+        assert profile.soft == {"leadership"}
+
+    def test_empty_batch(self):
+        assert compute_ats_scores_batch("Python", []) == []
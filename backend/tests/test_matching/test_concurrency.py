@@ -0,0 +1,226 @@
+"""Tests for the AIMD adaptive concurrency limiter."""
+
+import asyncio
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.matching.concurrency import (
+    AdaptiveLimiter,
+    is_overloaded,
+    retry_after_seconds,
+)
+
+
+class OverloadedError(Exception):
+    """Mimics an SDK status error carrying an HTTP response."""
+
+    def __init__(self, status_code: int = 429, headers: dict | None = None) -> None:
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class TestErrorClassification:
+    """Tests for overload detection and retry-after parsing."""
+
+    @pytest.mark.parametrize("status", [429, 503, 529])
+    def test_overload_statuses(self, status):
+        assert is_overloaded(OverloadedError(status))
+
+    def test_sdk_error_types(self):
+        class RateLimitError(Exception):
+            pass
+
+        assert is_overloaded(RateLimitError("slow down"))
+
+    def test_symbolic_status(self):
+        exc = RuntimeError("quota")
+        exc.status = "RESOURCE_EXHAUSTED"
+        assert is_overloaded(exc)
+
+    def test_wrapped_errors_are_unwrapped(self):
+        try:
+            try:
+                raise OverloadedError(429)
+            except OverloadedError as inner:
+                raise RuntimeError("Error embedding content") from inner
+        except RuntimeError as e:
+            assert is_overloaded(e)
+
+    def test_other_errors_not_overloaded(self):
+        assert not is_overloaded(ValueError("bad input"))
+        assert not is_overloaded(OverloadedError(400))
+        # Messages are not inspected
+        assert not is_overloaded(RuntimeError("invalid request id 429"))
+
+    def test_retry_after_seconds_header(self):
+        assert retry_after_seconds(OverloadedError(headers={"retry-after": "7"})) == 7.0
+
+    def test_retry_after_http_date(self):
+        exc = OverloadedError(headers={"retry-after": formatdate(time.time() + 30, usegmt=True)})
+        assert 25 <= retry_after_seconds(exc) <= 31
+
+    def test_retry_after_attribute(self):
+        exc = RuntimeError("slow down")
+        exc.retry_after = 2
+        assert retry_after_seconds(exc) == 2.0
+
+    def test_missing_retry_after(self):
+        assert retry_after_seconds(ValueError("x")) is None
+        assert retry_after_seconds(OverloadedError(headers={"retry-after": "soon"})) is None
+
+
+class TestAdaptiveLimiter:
+    """Tests for AIMD limit control and the call() retry loop."""
+
+    def test_additive_increase(self):
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=4)
+        for _ in range(4):
+            limiter.record_success(0.1)
+        assert limiter.limit == 3
+        for _ in range(50):
+            limiter.record_success(0.1)
+        assert limiter.limit == 4
+
+    def test_no_increase_above_latency_target(self):
+        limiter = AdaptiveLimiter(initial_limit=2, latency_target=1.0)
+        for _ in range(10):
+            limiter.record_success(5.0)
+        assert limiter.limit == 2
+
+    def test_sustained_errors_decrease_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=8, cooldown=0)
+        for _ in range(3):
+            limiter.record_error()
+        # Isolated failures leave the limit alone
+        assert limiter.limit == 8
+        limiter.record_error()
+        assert limiter.limit == 4
+        assert limiter.errors == 4
+
+    def test_no_increase_while_error_rate_high(self):
+        limiter = AdaptiveLimiter(initial_limit=4, cooldown=60)
+        for _ in range(5):
+            limiter.record_error()
+        assert limiter.limit == 2
+        limiter.record_success(0.1)
+        assert limiter.limit == 2
+        # Recovers once successes bring the failure rate back down
+        for _ in range(10):
+            limiter.record_success(0.1)
+        assert limiter.limit > 2
+
+    async def test_failing_calls_do_not_grow_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=4, base_backoff=0.0, cooldown=0)
+
+        async def server_error():
+            raise RuntimeError("500 Internal Server Error")
+
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                await limiter.call(server_error, max_attempts=2)
+        assert limiter.limit < 4
+        assert limiter.metrics()["error_rate"] > 0.5
+
+    def test_multiplicative_decrease(self):
+        limiter = AdaptiveLimiter(initial_limit=8, cooldown=0)
+        limiter.record_overload()
+        assert limiter.limit == 4
+        limiter.record_overload()
+        limiter.record_overload()
+        limiter.record_overload()
+        assert limiter.limit == 1
+
+    def test_burst_of_overloads_decreases_once(self):
+        limiter = AdaptiveLimiter(initial_limit=8, cooldown=60)
+        for _ in range(5):
+            limiter.record_overload()
+        assert limiter.limit == 4
+        assert limiter.overloads == 5
+
+    async def test_in_flight_never_exceeds_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=3, max_limit=3)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            return True
+
+        results = await asyncio.gather(*[limiter.call(work) for _ in range(12)])
+        assert all(results)
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    async def test_metrics_report_queue_depth(self):
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        tasks = [asyncio.create_task(limiter.call(work)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        metrics = limiter.metrics()
+        assert metrics["limit"] == 1
+        assert metrics["in_flight"] == 1
+        assert metrics["queue_depth"] == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert limiter.metrics()["queue_depth"] == 0
+
+    async def test_retries_then_succeeds(self):
+        limiter = AdaptiveLimiter(initial_limit=4, base_backoff=0.0, cooldown=0)
+        attempts = 0
+
+        async def flaky():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise OverloadedError(529)
+            return "ok"
+
+        assert await limiter.call(flaky, max_attempts=3) == "ok"
+        assert attempts == 3
+        assert limiter.overloads == 2
+        # 4 -> 2 -> 1 on the overloads, then +1 for the success
+        assert limiter.limit == 2
+
+    async def test_raises_after_max_attempts(self):
+        limiter = AdaptiveLimiter(base_backoff=0.0)
+
+        async def broken():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError, match="nope"):
+            await limiter.call(broken, max_attempts=2)
+        assert limiter.errors == 2
+        assert limiter.in_flight == 0
+
+    async def test_honours_retry_after(self):
+        limiter = AdaptiveLimiter(base_backoff=0.0)
+        calls: list[float] = []
+
+        async def throttled():
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise OverloadedError(429, headers={"retry-after": "0.2"})
+            return "ok"
+
+        assert await limiter.call(throttled) == "ok"
+        assert calls[1] - calls[0] >= 0.19
+
+    async def test_retry_after_pauses_other_callers(self):
+        limiter = AdaptiveLimiter(initial_limit=4)
+        limiter.record_overload(retry_after=0.2)
+        start = time.monotonic()
+
+        async def work():
+            return time.monotonic()
+
+        finished = await limiter.call(work)
+        assert finished - start >= 0.19
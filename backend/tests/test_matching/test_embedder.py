@@ -1,12 +1,14 @@
 """Tests for ChromaDB job embedder."""
 
+import threading
+import time
 import uuid
 
 import chromadb
 import pytest
 
 from app.schemas.matching import JobPosting
-from app.services.matching.embedder import JobEmbedder
+from app.services.matching.embedder import EmbeddingBatcher, JobEmbedder
 
 
 class FakeEmbeddings:
@@ -103,6 +105,50 @@ class TestIndexJobs:
         assert new_count == 3
         assert embedder.get_collection_count() == 6
 
+    def test_duplicates_within_batch_indexed_once(self, fake_embeddings, sample_jobs):
+        client = chromadb.EphemeralClient()
+        name = f"test_{uuid.uuid4().hex[:8]}"
+        embedder = _make_embedder(client, name, fake_embeddings)
+        count = embedder.index_jobs([sample_jobs[0], sample_jobs[0]])
+        assert count == 1
+        assert embedder.get_collection_count() == 1
+
+    def test_lookup_only_queries_batch_ids(self, fake_embeddings, sample_jobs):
+        """Existence checks should ask Chroma for the batch IDs, not the whole collection."""
+        client = chromadb.EphemeralClient()
+        name = f"test_{uuid.uuid4().hex[:8]}"
+        embedder = _make_embedder(client, name, fake_embeddings)
+        embedder.index_jobs(sample_jobs[:5])
+
+        collection = client.get_or_create_collection(name)
+        calls: list[dict] = []
+        original_get = collection.get
+
+        def _spy_get(**kwargs):
+            calls.append(kwargs)
+            return original_get(**kwargs)
+
+        collection.get = _spy_get
+        client.get_or_create_collection = lambda _name: collection
+
+        new_count = embedder.index_jobs(sample_jobs[4:7])
+
+        assert new_count == 2
+        assert len(calls) == 1
+        # Job 4 is already known in-process, so only the two unseen IDs are looked up
+        assert len(calls[0]["ids"]) == 2
+        assert calls[0]["include"] == []
+
+    def test_existing_ids_found_across_instances(self, fake_embeddings, sample_jobs):
+        """A fresh embedder on the same collection still skips indexed jobs."""
+        client = chromadb.EphemeralClient()
+        name = f"test_{uuid.uuid4().hex[:8]}"
+        _make_embedder(client, name, fake_embeddings).index_jobs(sample_jobs[:3])
+
+        second = _make_embedder(client, name, fake_embeddings)
+        assert second.index_jobs(sample_jobs[:4]) == 1
+        assert second.get_collection_count() == 4
+
 
 class TestSimilaritySearch:
     """Tests for similarity search."""
@@ -135,6 +181,96 @@ class TestSimilaritySearch:
         assert results == []
 
 
+class RateLimitedError(Exception):
+    """Mimics a provider quota error carrying an HTTP status."""
+
+    status_code = 429
+
+
+class RecordingEmbeddings:
+    """Fake embeddings that record batches and peak concurrency."""
+
+    def __init__(self, delay: float = 0.0, fail_first: int = 0) -> None:
+        self.batches: list[list[str]] = []
+        self.delay = delay
+        self.fail_first = fail_first
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise RateLimitedError()
+            self.batches.append(list(texts))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return [[float(len(t))] for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return [float(len(text))]
+
+
+class TestEmbeddingBatcher:
+    """Tests for batched, parallel document embedding."""
+
+    def test_splits_by_batch_size_and_preserves_order(self):
+        inner = RecordingEmbeddings()
+        batcher = EmbeddingBatcher(inner, max_batch_size=3, max_in_flight=1)
+        texts = [f"doc-{'x' * i}" for i in range(7)]
+        vectors = batcher.embed_documents(texts)
+        assert vectors == [[float(len(t))] for t in texts]
+        assert [len(b) for b in inner.batches] == [3, 3, 1]
+
+    def test_splits_by_token_budget(self):
+        inner = RecordingEmbeddings()
+        batcher = EmbeddingBatcher(inner, max_batch_size=100, max_batch_tokens=10, max_in_flight=1)
+        batcher.embed_documents(["a" * 24, "b" * 24, "c" * 24])  # ~6 tokens each
+        assert [len(b) for b in inner.batches] == [1, 1, 1]
+
+    def test_keeps_multiple_batches_in_flight(self):
+        inner = RecordingEmbeddings(delay=0.05)
+        batcher = EmbeddingBatcher(inner, max_batch_size=1, max_in_flight=4)
+        batcher.embed_documents([f"doc {i}" for i in range(8)])
+        assert inner.peak_in_flight > 1
+        assert batcher.last_stats.batches == 8
+        assert batcher.last_stats.docs_per_sec > 0
+
+    def test_backs_off_on_rate_limit(self):
+        inner = RecordingEmbeddings(fail_first=1)
+        batcher = EmbeddingBatcher(inner, max_batch_size=4, max_in_flight=1, base_backoff=0.0)
+        texts = [f"doc {i}" for i in range(4)]
+        vectors = batcher.embed_documents(texts)
+        assert vectors == [[float(len(t))] for t in texts]
+        assert batcher.last_stats.rate_limited == 1
+        assert len(inner.batches[0]) == 2  # halved after the 429
+
+    def test_non_rate_limit_errors_propagate(self):
+        class Broken(RecordingEmbeddings):
+            def embed_documents(self, texts):
+                raise ValueError("bad input")
+
+        batcher = EmbeddingBatcher(Broken(), base_backoff=0.0)
+        with pytest.raises(ValueError):
+            batcher.embed_documents(["doc"])
+
+    def test_job_embedder_uses_batcher(self, sample_jobs):
+        inner = RecordingEmbeddings()
+        client = chromadb.EphemeralClient()
+
+        class IsolatedEmbedder(JobEmbedder):
+            COLLECTION_NAME = f"test_{uuid.uuid4().hex[:8]}"
+
+        embedder = IsolatedEmbedder(embeddings=inner, chroma_client=client, embed_batch_size=2)
+        embedder.index_jobs(sample_jobs[:5])
+        assert [len(b) for b in inner.batches] == [2, 2, 1]
+        assert embedder.batcher.last_stats.documents == 5
+
+
 def _make_embedder(
     client: chromadb.ClientAPI,
     collection_name: str,
@@ -146,6 +282,7 @@ def _make_embedder(
     embedder = JobEmbedder.__new__(JobEmbedder)
     embedder.COLLECTION_NAME = collection_name
     embedder._client = client
+    embedder._known_ids = set()
     embedder._vectorstore = Chroma(
         client=client,
         collection_name=collection_name,
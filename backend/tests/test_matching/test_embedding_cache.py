@@ -0,0 +1,93 @@
+"""Tests for the content-addressed embedding cache."""
+
+import pytest
+
+from app.services.cache.embeddings import CachedEmbeddings, make_cache_key
+
+
+class CountingEmbeddings:
+    """Fake embeddings that record every text sent to the 'API'."""
+
+    def __init__(self) -> None:
+        self.document_calls: list[list[str]] = []
+        self.query_calls: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_calls.append(list(texts))
+        return [[float(len(t)), 0.5, 0.25] for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.query_calls.append(text)
+        return [float(len(text)), 0.5, 0.25]
+
+
+@pytest.fixture
+def inner():
+    return CountingEmbeddings()
+
+
+@pytest.fixture
+def cache(inner, tmp_path):
+    emb = CachedEmbeddings(
+        inner, model="test-model", task_type="retrieval_document",
+        db_path=tmp_path / "emb.db",
+    )
+    yield emb
+    emb.close()
+
+
+class TestCachedEmbeddings:
+    """Tests for CachedEmbeddings."""
+
+    def test_first_call_forwards_to_model(self, cache, inner):
+        vectors = cache.embed_documents(["alpha", "beta"])
+        assert vectors == [[5.0, 0.5, 0.25], [4.0, 0.5, 0.25]]
+        assert inner.document_calls == [["alpha", "beta"]]
+        assert cache.stats()["misses"] == 2
+
+    def test_repeated_texts_served_from_cache(self, cache, inner):
+        cache.embed_documents(["alpha", "beta"])
+        vectors = cache.embed_documents(["beta", "alpha"])
+        assert vectors == [[4.0, 0.5, 0.25], [5.0, 0.5, 0.25]]
+        assert len(inner.document_calls) == 1
+        assert cache.stats()["hits"] == 2
+
+    def test_only_misses_are_forwarded(self, cache, inner):
+        cache.embed_documents(["alpha"])
+        cache.embed_documents(["alpha", "gamma", "gamma"])
+        assert inner.document_calls[-1] == ["gamma"]
+
+    def test_query_shares_cache_with_documents(self, cache, inner):
+        cache.embed_documents(["python backend"])
+        cache.embed_query("python backend")
+        assert inner.query_calls == []
+
+    def test_cache_persists_across_instances(self, inner, tmp_path):
+        path = tmp_path / "emb.db"
+        first = CachedEmbeddings(inner, "test-model", "retrieval_document", db_path=path)
+        first.embed_documents(["alpha"])
+        first.close()
+
+        second_inner = CountingEmbeddings()
+        second = CachedEmbeddings(second_inner, "test-model", "retrieval_document", db_path=path)
+        assert second.embed_documents(["alpha"]) == [[5.0, 0.5, 0.25]]
+        assert second_inner.document_calls == []
+        second.close()
+
+    def test_key_includes_model_and_task_type(self):
+        base = make_cache_key("m1", "retrieval_document", "text")
+        assert make_cache_key("m2", "retrieval_document", "text") != base
+        assert make_cache_key("m1", "retrieval_query", "text") != base
+        assert make_cache_key("m1", "retrieval_document", "text") == base
+
+    def test_lru_eviction(self, inner):
+        cache = CachedEmbeddings(inner, "test-model", "retrieval_document", max_entries=2)
+        cache.embed_documents(["a"])
+        cache.embed_documents(["bb"])
+        cache.embed_documents(["a"])  # touch "a" so "bb" is least recently used
+        cache.embed_documents(["ccc"])
+        assert len(cache) == 2
+
+        inner.document_calls.clear()
+        cache.embed_documents(["a", "bb"])
+        assert inner.document_calls == [["bb"]]
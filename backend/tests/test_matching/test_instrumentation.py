@@ -0,0 +1,119 @@
+"""Tests for matching pipeline instrumentation."""
+
+import json
+import sys
+import time
+
+import pytest
+
+from app.services.matching.instrumentation import PipelineReport, estimate_cost
+from app.services.matching.scorer import ScoringUsage
+
+
+def _sample_report() -> PipelineReport:
+    report = PipelineReport(model="claude-sonnet-4-6")
+    with report.stage("pre_filter", items_in=100) as stage:
+        stage.items_out = 40
+    with report.stage("full_score", items_in=10) as stage:
+        time.sleep(0.01)
+        stage.add_usage(
+            ScoringUsage(
+                calls=10,
+                input_tokens=50_000,
+                output_tokens=5_000,
+                cache_read_tokens=30_000,
+                cache_write_tokens=3_000,
+            ),
+            "claude-sonnet-4-6",
+        )
+        stage.items_out = 9
+    report.finish()
+    return report
+
+
+class TestEstimateCost:
+    """Tests for token cost estimates."""
+
+    def test_sonnet_pricing(self):
+        # 1M uncached input at $3 + 1M output at $15
+        assert estimate_cost("claude-sonnet-4-6", 1_000_000, 1_000_000) == pytest.approx(18.0)
+
+    def test_cache_reads_are_cheaper(self):
+        full = estimate_cost("claude-sonnet-4-6", 100_000, 0)
+        cached = estimate_cost("claude-sonnet-4-6", 100_000, 0, cache_read_tokens=90_000)
+        assert cached < full / 5
+
+    def test_unknown_model_costs_nothing(self):
+        assert estimate_cost("mystery-model", 1000, 1000) == 0.0
+
+
+class TestPipelineReport:
+    """Tests for PipelineReport collection and export."""
+
+    def test_stage_records_time_and_counts(self):
+        report = _sample_report()
+        full = report.get("full_score")
+        assert full.seconds >= 0.01
+        assert (full.items_in, full.items_out) == (10, 9)
+        assert report.get("pre_filter").items_out == 40
+        assert report.get("missing") is None
+        assert report.total_seconds >= full.seconds
+
+    def test_totals(self):
+        report = _sample_report()
+        assert report.llm_calls == 10
+        assert report.input_tokens == 50_000
+        assert report.output_tokens == 5_000
+        assert report.cost_usd > 0
+
+    def test_stage_time_recorded_on_error(self):
+        report = PipelineReport()
+        with pytest.raises(RuntimeError), report.stage("index"):
+            raise RuntimeError("boom")
+        assert report.get("index") is not None
+
+    def test_to_dict_is_json_serializable(self):
+        data = json.loads(json.dumps(_sample_report().to_dict()))
+        assert [s["name"] for s in data["stages"]] == ["pre_filter", "full_score"]
+        assert data["stages"][1]["cache_read_tokens"] == 30_000
+
+    def test_append_jsonl(self, tmp_path):
+        path = tmp_path / "metrics" / "runs.jsonl"
+        _sample_report().append_jsonl(path)
+        _sample_report().append_jsonl(path)
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["llm_calls"] == 10
+
+    def test_to_prometheus(self):
+        text = _sample_report().to_prometheus()
+        assert "# TYPE matching_pipeline_stage_seconds gauge" in text
+        assert 'matching_pipeline_stage_items_out{stage="pre_filter"} 40' in text
+        assert 'matching_pipeline_stage_llm_calls{stage="full_score"} 10' in text
+        assert "matching_pipeline_total_seconds " in text
+
+    def test_export_otel_spans_without_opentelemetry(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "opentelemetry", None)
+        with pytest.raises(ImportError, match="'otel' extra"):
+            _sample_report().export_otel_spans(tracer=object())
+
+    def test_export_otel_spans(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+        _sample_report().export_otel_spans(tracer=provider.get_tracer("test"))
+
+        spans = {s.name: s for s in exporter.get_finished_spans()}
+        root = spans["matching_pipeline.match"]
+        child = spans["matching_pipeline.full_score"]
+        assert child.parent.span_id == root.context.span_id
+        assert child.attributes["stage.llm_calls"] == 10
+        assert child.end_time > child.start_time
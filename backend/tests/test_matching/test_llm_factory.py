@@ -4,9 +4,18 @@ from unittest.mock import patch
 
 import pytest
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 
-from app.services.llm_factory import LLMTask, get_embeddings, get_llm
+from app.services.cache.embeddings import CachedEmbeddings
+from app.services.llm_factory import (
+    LLMTask,
+    close_embedding_caches,
+    get_embeddings,
+    get_llm,
+    mark_cache_breakpoint,
+    supports_prompt_caching,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -19,6 +28,9 @@ def _mock_settings():
         settings.embedding_model = "gemini-embedding-001"
         settings.google_api_key.get_secret_value.return_value = "test-google-key"
         settings.anthropic_api_key.get_secret_value.return_value = "test-anthropic-key"
+        settings.embedding_cache_enabled = True
+        settings.embedding_cache_max_entries = 100
+        settings.claude_prompt_caching = True
         yield mock
 
 
@@ -76,3 +88,62 @@ class TestGetEmbeddings:
     def test_embeddings_query_task_type(self):
         emb = get_embeddings(task_type="retrieval_query")
         assert emb.task_type == "retrieval_query"
+
+    def test_cached_embeddings_wraps_google(self, _mock_settings, tmp_path):
+        _mock_settings.return_value.data_dir = tmp_path
+        emb = get_embeddings(cached=True)
+        assert isinstance(emb, CachedEmbeddings)
+        assert isinstance(emb.wrapped, GoogleGenerativeAIEmbeddings)
+        assert (tmp_path / ".embedding_cache.db").exists()
+        close_embedding_caches()
+
+    def test_cached_embeddings_shared_per_task_type(self, _mock_settings, tmp_path):
+        _mock_settings.return_value.data_dir = tmp_path
+        try:
+            doc = get_embeddings(cached=True)
+            assert get_embeddings(cached=True) is doc
+            assert get_embeddings("retrieval_query", cached=True) is not doc
+        finally:
+            close_embedding_caches()
+        assert get_embeddings(cached=True) is not doc
+        close_embedding_caches()
+
+    def test_cached_flag_respects_setting(self, _mock_settings):
+        _mock_settings.return_value.embedding_cache_enabled = False
+        emb = get_embeddings(cached=True)
+        assert isinstance(emb, GoogleGenerativeAIEmbeddings)
+
+
+class TestPromptCaching:
+    """Tests for Claude prompt-caching helpers."""
+
+    def test_claude_supports_prompt_caching(self):
+        assert supports_prompt_caching(get_llm(LLMTask.SCORE))
+
+    def test_gemini_does_not_support_prompt_caching(self):
+        assert not supports_prompt_caching(get_llm(LLMTask.PARSE))
+
+    def test_prompt_caching_respects_setting(self, _mock_settings):
+        _mock_settings.return_value.claude_prompt_caching = False
+        assert not supports_prompt_caching(get_llm(LLMTask.SCORE))
+
+    def test_mark_cache_breakpoint_on_string_content(self):
+        original = SystemMessage(content="Instructions and resume")
+        marked = mark_cache_breakpoint(original)
+        assert marked.content == [
+            {
+                "type": "text",
+                "text": "Instructions and resume",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert original.content == "Instructions and resume"
+
+    def test_mark_cache_breakpoint_on_last_text_block(self):
+        original = SystemMessage(
+            content=[{"type": "text", "text": "a"}, {"type": "text", "text": "b"}]
+        )
+        marked = mark_cache_breakpoint(original)
+        assert "cache_control" not in marked.content[0]
+        assert marked.content[1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in original.content[1]
@@ -40,6 +40,17 @@ class TestMultiQueryRetriever:
         assert isinstance(queries, list)
         assert len(queries) == 3
 
+    async def test_generate_queries_records_token_usage(self, mock_retriever, mock_llm):
+        mock_llm.model = "gemini-2.5-flash"
+        mock_llm.ainvoke.return_value.usage_metadata = {"input_tokens": 120, "output_tokens": 30}
+        mq = MultiQueryRetriever(retriever=mock_retriever, llm=mock_llm)
+        await mq.generate_queries("Python engineer")
+
+        usage = mq.reset_usage()
+        assert (usage.calls, usage.input_tokens, usage.output_tokens) == (1, 120, 30)
+        assert mq.model_name == "gemini-2.5-flash"
+        assert mq.reset_usage().calls == 0
+
     async def test_generate_queries_handles_bad_json(self, mock_retriever):
         llm = MagicMock()
         response = MagicMock()
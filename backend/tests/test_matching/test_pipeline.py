@@ -1,17 +1,22 @@
 """Tests for the matching pipeline orchestrator."""
 
+import asyncio
+import json
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.documents import Document
 
-from app.config import UserConfig
+from app.config import UserConfig, get_settings
 from app.schemas.matching import JobPosting, ScoredMatch
+from app.services.matching.concurrency import AdaptiveLimiter
 from app.services.matching.pipeline import (
     MatchingPipeline,
-    _compute_integrated_score,
     _extract_skills_section,
+    compute_integrated_score,
 )
+from app.services.matching.scorer import ScoringUsage
 from tests.fixtures.mock_responses import make_high_match_score, make_medium_match_score
 
 
@@ -60,8 +65,25 @@ def mock_embedder():
 @pytest.fixture
 def mock_scorer():
     scorer = MagicMock()
+    scorer.model_name = "claude-test"
+    scorer.reset_usage = MagicMock(side_effect=ScoringUsage)
     scorer.score = AsyncMock()
     scorer.quick_score = AsyncMock(return_value=(7, "Relevant"))
+
+    async def _quick_score_batch(resume_summary, jobs, fallback=True, **kwargs):
+        # Route batches through quick_score so per-job side effects still apply
+        return [
+            await scorer.quick_score(
+                resume_summary=resume_summary,
+                job_title=job.title,
+                job_company=job.company,
+                job_description=job.description,
+                **kwargs,
+            )
+            for job in jobs
+        ]
+
+    scorer.quick_score_batch = AsyncMock(side_effect=_quick_score_batch)
     return scorer
 
 
@@ -198,6 +220,86 @@ class TestMatchingPipeline:
         assert len(indexed_jobs) == 1
         assert indexed_jobs[0].title == "Software Engineer"
 
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_streamed_chunks_filtered_and_indexed_incrementally(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        """Async chunk sources are pre-filtered and indexed one chunk at a time."""
+        user_config = UserConfig(experience_level="mid")
+        chunks = [
+            [_make_job(1, "Software Engineer"), _make_job(2, "VP of Engineering")],
+            [_make_job(3, "Director of Engineering")],
+            [_make_job(4, "Backend Engineer")],
+        ]
+
+        async def _stream():
+            for chunk in chunks:
+                yield chunk
+
+        stored = {
+            (j.external_id, j.source): j.model_copy(update={"db_id": i})
+            for i, chunk in enumerate(chunks)
+            for j in chunk
+        }
+
+        async def _load(keys):
+            return [stored[k] for k in keys]
+
+        load_jobs = AsyncMock(side_effect=_load)
+        mock_embedder.index_jobs.side_effect = len
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [
+            _make_doc(chunks[0][0]),
+            _make_doc(chunks[2][0]),
+        ]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.score.return_value = make_high_match_score()
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder, scorer=mock_scorer, user_config=user_config
+        )
+        results, report = await pipeline.match_with_report(
+            "Resume text", jobs=_stream(), load_jobs=load_jobs
+        )
+
+        # The all-rejected chunk is never indexed
+        indexed = [c.args[0] for c in mock_embedder.index_jobs.call_args_list]
+        assert [[j.title for j in batch] for batch in indexed] == [
+            ["Software Engineer"],
+            ["Backend Engineer"],
+        ]
+        assert (report.get("load").items_out, report.get("pre_filter").items_out) == (4, 2)
+        assert report.get("index").items_out == 2
+        # Only retrieved survivors are loaded back, as full postings, for scoring
+        load_jobs.assert_awaited_once_with([("job-001", "test"), ("job-004", "test")])
+        assert {(m.job.title, m.job.db_id) for m in results} == {
+            ("Software Engineer", 0),
+            ("Backend Engineer", 2),
+        }
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_streamed_chunks_indexed_off_event_loop(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        """Streamed chunks are indexed in a worker thread, not on the event loop."""
+        loop_thread = threading.get_ident()
+        index_threads: list[int] = []
+
+        def _index(jobs):
+            index_threads.append(threading.get_ident())
+            return len(jobs)
+
+        async def _stream():
+            yield [_make_job(1, "Software Engineer")]
+
+        mock_embedder.index_jobs.side_effect = _index
+        mock_retriever_cls.return_value.retrieve.return_value = []
+
+        pipeline = MatchingPipeline(embedder=mock_embedder, scorer=mock_scorer)
+        await pipeline.match("Resume text", jobs=_stream())
+
+        assert index_threads and loop_thread not in index_threads
+
     @patch("app.services.matching.pipeline.TwoStageRetriever")
     async def test_target_title_passed_through(
         self, mock_retriever_cls, mock_embedder, mock_scorer
@@ -241,6 +343,244 @@ class TestMatchingPipeline:
         assert mock_scorer.score.call_count == 1
         assert len(results) == 1
 
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_quick_score_batches_candidates(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        """Candidates should be quick-scored in batches of quick_score_batch_size."""
+        jobs = [_make_job(i) for i in range(5)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.score.return_value = make_high_match_score()
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder, scorer=mock_scorer, quick_score_batch_size=2
+        )
+        results = await pipeline.match("Resume text", jobs=jobs)
+
+        batch_sizes = [
+            len(call.kwargs["jobs"]) for call in mock_scorer.quick_score_batch.call_args_list
+        ]
+        assert batch_sizes == [2, 2, 1]
+        assert len(results) == 5
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_quick_score_batch_size_one_uses_per_job_calls(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        jobs = [_make_job(i) for i in range(3)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.score.return_value = make_high_match_score()
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder, scorer=mock_scorer, quick_score_batch_size=1
+        )
+        await pipeline.match("Resume text", jobs=jobs)
+
+        assert mock_scorer.quick_score_batch.call_count == 0
+        assert mock_scorer.quick_score.call_count == 3
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_full_scoring_runs_concurrently(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        """Full scoring should no longer be serialized to one call at a time."""
+        jobs = [_make_job(i) for i in range(6)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+
+        in_flight = peak = 0
+
+        async def _slow_score(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_high_match_score()
+
+        mock_scorer.score.side_effect = _slow_score
+        limiter = AdaptiveLimiter(initial_limit=3, max_limit=3)
+
+        pipeline = MatchingPipeline(embedder=mock_embedder, scorer=mock_scorer, limiter=limiter)
+        results = await pipeline.match("Resume text", jobs=jobs)
+
+        assert len(results) == 6
+        assert peak == 3
+        assert pipeline.limiter is limiter
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_default_limiter_uses_latency_target_setting(
+        self, mock_embedder, mock_scorer, monkeypatch
+    ):
+        monkeypatch.setattr(get_settings(), "scoring_latency_target", 12.5)
+        pipeline = MatchingPipeline(embedder=mock_embedder, scorer=mock_scorer)
+        assert pipeline.limiter.latency_target == 12.5
+
+    def test_legacy_concurrency_kwargs_seed_initial_limit(self, mock_embedder, mock_scorer):
+        with pytest.warns(DeprecationWarning, match="score_concurrency"):
+            pipeline = MatchingPipeline(
+                embedder=mock_embedder,
+                scorer=mock_scorer,
+                score_concurrency=2,
+                quick_score_concurrency=6,
+            )
+        assert pipeline.limiter.limit == 6
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_score_failure_retried_then_dropped(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        jobs = [_make_job(1)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.score.side_effect = RuntimeError("API down")
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder,
+            scorer=mock_scorer,
+            limiter=AdaptiveLimiter(base_backoff=0.0),
+        )
+        results = await pipeline.match("Resume text", jobs=jobs)
+
+        assert results == []
+        assert mock_scorer.score.call_count == 3
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_match_with_report_breaks_down_stages(
+        self, mock_retriever_cls, mock_embedder, mock_scorer, tmp_path
+    ):
+        jobs = [_make_job(1, "Good Job"), _make_job(2, "Bad Job")]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.quick_score.side_effect = [(8, "Great fit"), (2, "Unrelated")]
+        mock_scorer.score.return_value = make_high_match_score()
+        mock_scorer.model_name = "claude-sonnet-4-6"
+        mock_scorer.reset_usage.side_effect = [
+            ScoringUsage(),  # cleared before quick-score
+            ScoringUsage(calls=1, input_tokens=800, output_tokens=40),
+            ScoringUsage(calls=1, input_tokens=3000, output_tokens=600, cache_read_tokens=2500),
+        ]
+        metrics_path = tmp_path / "metrics.jsonl"
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder, scorer=mock_scorer, metrics_path=metrics_path
+        )
+        matches, report = await pipeline.match_with_report("Resume text", jobs=jobs)
+
+        assert len(matches) == 1
+        assert pipeline.last_report is report
+        assert [s.name for s in report.stages] == [
+            "index", "retrieve_rerank", "quick_score", "full_score", "ats",
+        ]
+        quick = report.get("quick_score")
+        assert (quick.items_in, quick.items_out, quick.llm_calls) == (2, 1, 1)
+        full = report.get("full_score")
+        assert full.cache_read_tokens == 2500
+        assert full.cost_usd > 0
+        assert report.llm_calls == 2
+        assert json.loads(metrics_path.read_text())["llm_calls"] == 2
+
+    @patch("app.services.matching.pipeline.get_llm")
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_multi_query_stage_records_token_usage(
+        self, mock_retriever_cls, mock_get_llm, mock_embedder, mock_scorer
+    ):
+        jobs = [_make_job(1)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.score.return_value = make_high_match_score()
+        llm = MagicMock()
+        llm.model = "gemini-2.5-flash"
+        llm.ainvoke = AsyncMock(return_value=MagicMock(
+            content='["alt 1", "alt 2"]',
+            usage_metadata={"input_tokens": 90, "output_tokens": 15},
+        ))
+        mock_get_llm.return_value = llm
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder,
+            scorer=mock_scorer,
+            user_config=UserConfig(enable_multi_query=True),
+        )
+        _, report = await pipeline.match_with_report("Resume text", jobs=jobs)
+
+        stage = report.get("multi_query")
+        assert (stage.llm_calls, stage.input_tokens, stage.output_tokens) == (1, 90, 15)
+        assert stage.cost_usd > 0
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_failed_quick_score_batch_passes_jobs_through(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        jobs = [_make_job(i) for i in range(2)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.quick_score_batch.side_effect = RuntimeError("boom")
+        mock_scorer.score.return_value = make_high_match_score()
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder,
+            scorer=mock_scorer,
+            limiter=AdaptiveLimiter(base_backoff=0.0),
+        )
+        results = await pipeline.match("Resume text", jobs=jobs)
+
+        assert mock_scorer.score.call_count == 2
+        assert len(results) == 2
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_unparsed_batch_jobs_retried_through_limiter(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        jobs = [_make_job(i) for i in range(3)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.quick_score_batch.side_effect = None
+        mock_scorer.quick_score_batch.return_value = [(8, "a"), None, (2, "c")]
+        mock_scorer.score.return_value = make_high_match_score()
+        limiter = AdaptiveLimiter(base_backoff=0.0)
+
+        pipeline = MatchingPipeline(
+            embedder=mock_embedder, scorer=mock_scorer, limiter=limiter, quick_score_batch_size=3
+        )
+        await pipeline.match("Resume text", jobs=jobs)
+
+        assert mock_scorer.quick_score_batch.call_args.kwargs["fallback"] is False
+        assert mock_scorer.quick_score.call_count == 1
+        assert mock_scorer.quick_score.call_args.kwargs["job_title"] == jobs[1].title
+        # One batch call, one per-job retry and two full scores, all via the limiter
+        assert limiter.successes == 4
+
+    @patch("app.services.matching.pipeline.TwoStageRetriever")
+    async def test_quick_score_batch_overload_reaches_limiter(
+        self, mock_retriever_cls, mock_embedder, mock_scorer
+    ):
+        class RateLimitError(Exception):
+            status_code = 429
+
+        jobs = [_make_job(i) for i in range(2)]
+        mock_retriever_instance = MagicMock()
+        mock_retriever_instance.retrieve.return_value = [_make_doc(j) for j in jobs]
+        mock_retriever_cls.return_value = mock_retriever_instance
+        mock_scorer.quick_score_batch.side_effect = RateLimitError("slow down")
+        mock_scorer.score.return_value = make_high_match_score()
+        limiter = AdaptiveLimiter(base_backoff=0.0)
+
+        pipeline = MatchingPipeline(embedder=mock_embedder, scorer=mock_scorer, limiter=limiter)
+        await pipeline.match("Resume text", jobs=jobs)
+
+        assert limiter.overloads == 2
+
 
     @patch("app.services.matching.pipeline.TwoStageRetriever")
     async def test_ats_score_computed(
@@ -375,26 +715,26 @@ class TestComputeIntegratedScore:
     """Tests for the integrated score computation helper."""
 
     def test_all_components(self):
-        score = _compute_integrated_score(
+        score = compute_integrated_score(
             llm_score=8.0, ats_score=80.0, requirements_met_ratio=0.9
         )
         assert 1.0 <= score <= 10.0
 
     def test_no_requirements_ratio(self):
-        score = _compute_integrated_score(
+        score = compute_integrated_score(
             llm_score=8.0, ats_score=80.0, requirements_met_ratio=None
         )
         assert 1.0 <= score <= 10.0
 
     def test_higher_ats_increases_score(self):
-        low_ats = _compute_integrated_score(llm_score=7.0, ats_score=20.0)
-        high_ats = _compute_integrated_score(llm_score=7.0, ats_score=90.0)
+        low_ats = compute_integrated_score(llm_score=7.0, ats_score=20.0)
+        high_ats = compute_integrated_score(llm_score=7.0, ats_score=90.0)
         assert high_ats > low_ats
 
     def test_higher_llm_dominates(self):
         """LLM weight (60%) should dominate."""
-        low_llm = _compute_integrated_score(llm_score=3.0, ats_score=90.0)
-        high_llm = _compute_integrated_score(llm_score=9.0, ats_score=20.0)
+        low_llm = compute_integrated_score(llm_score=3.0, ats_score=90.0)
+        high_llm = compute_integrated_score(llm_score=9.0, ats_score=20.0)
         assert high_llm > low_llm
 
 
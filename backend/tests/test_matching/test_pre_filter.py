@@ -2,7 +2,12 @@
 
 from app.config import UserConfig
 from app.schemas.matching import JobPosting
-from app.services.matching.pre_filter import JobPreFilter, _detect_seniority, _location_matches
+from app.services.matching.pre_filter import (
+    JobColumns,
+    JobPreFilter,
+    _detect_seniority,
+    _location_matches,
+)
 
 
 def _make_job(
@@ -56,6 +61,15 @@ class TestDetectSeniority:
         # "Senior Staff Engineer" has both senior(3) and staff(4)
         assert _detect_seniority("Senior Staff Engineer") == 4
 
+    def test_overlapping_keywords_all_detected(self):
+        # "sr " and " cto" share the space between them
+        assert _detect_seniority("Sr CTO") == 8
+
+    def test_word_boundary_keywords(self):
+        assert _detect_seniority("International Sales Engineer") is None
+        assert _detect_seniority("Research Fellow") == 5
+        assert _detect_seniority("Fellowship Coordinator") is None
+
 
 class TestLocationMatches:
     """Tests for location matching logic."""
@@ -311,3 +325,47 @@ class TestLocationExclusion:
         pf = JobPreFilter(config)
         jobs = [_make_job(location="Bangalore, India - Remote")]
         assert len(pf.filter(jobs)) == 0
+
+
+class TestColumnarEvaluate:
+    """Tests for the JobColumns batch path."""
+
+    def test_mask_and_first_failing_reason(self):
+        config = UserConfig(
+            experience_level="mid",
+            locations=["United States"],
+            employment_types=["FULLTIME"],
+            salary_min=100000,
+            excluded_locations=["Texas"],
+        )
+        jobs = [
+            _make_job("Software Engineer", "New York, United States", "Full-time"),
+            _make_job("VP of Engineering", "Berlin, Germany"),  # seniority counted first
+            _make_job("Software Engineer", "Berlin, Germany"),
+            _make_job("Software Engineer", "Remote", "Contract"),
+            _make_job("Software Engineer", "Remote", salary_min=50000, salary_max=80000),
+            _make_job("Software Engineer", "Austin, Texas, United States"),
+        ]
+        keep, drops = JobPreFilter(config).evaluate(JobColumns.from_jobs(jobs))
+
+        assert keep == [True, False, False, False, False, False]
+        assert drops == {
+            "seniority": 1,
+            "location": 1,
+            "employment type": 1,
+            "salary": 1,
+            "excluded location": 1,
+        }
+
+    def test_filter_matches_evaluate(self):
+        config = UserConfig(experience_level="senior", locations=["Remote"])
+        jobs = [_make_job(t) for t in ("Intern", "Senior Engineer", "Staff Engineer", "Intern")]
+        keep, _ = JobPreFilter(config).evaluate(JobColumns.from_jobs(jobs))
+        kept = JobPreFilter(config).filter(jobs)
+        assert [j.title for j in kept] == [j.title for j, k in zip(jobs, keep) if k]
+        assert [j.title for j in kept] == ["Senior Engineer", "Staff Engineer"]
+
+    def test_empty_batch(self):
+        keep, drops = JobPreFilter(UserConfig()).evaluate(JobColumns.from_jobs([]))
+        assert keep == []
+        assert sum(drops.values()) == 0
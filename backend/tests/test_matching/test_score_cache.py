@@ -0,0 +1,150 @@
+"""Tests for the persistent LLM score cache."""
+
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config import get_settings
+from app.services.cache.scores import (
+    ScoreCache,
+    close_score_cache,
+    get_score_cache,
+    make_score_key,
+)
+from app.services.matching.scorer import JobScorer
+from tests.fixtures.mock_responses import make_high_match_score
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ScoreCache(db_path=tmp_path / "scores.db")
+    yield c
+    c.close()
+
+
+def _make_cached_scorer(cache: ScoreCache) -> JobScorer:
+    llm = MagicMock()
+    llm.model = "claude-test"
+    structured_llm = AsyncMock()
+    structured_llm.ainvoke.return_value = make_high_match_score()
+    llm.with_structured_output.return_value = structured_llm
+    raw_response = MagicMock()
+    raw_response.content = '{"relevance": 8, "reason": "Good match"}'
+    llm.ainvoke = AsyncMock(return_value=raw_response)
+    return JobScorer(llm, cache=cache)
+
+
+class TestScoreCache:
+    """Tests for ScoreCache storage semantics."""
+
+    def test_roundtrip(self, cache):
+        cache.set("score|v1|m|abc", {"overall_score": 8.0})
+        assert cache.get("score|v1|m|abc") == {"overall_score": 8.0}
+        assert cache.stats()["hits"] == 1
+
+    def test_missing_key(self, cache):
+        assert cache.get("nope") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = ScoreCache(db_path=tmp_path / "ttl.db", ttl_seconds=0.01)
+        cache.set("k", {"x": 1})
+        time.sleep(0.05)
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_size_bounded_eviction(self):
+        cache = ScoreCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "persist.db"
+        first = ScoreCache(db_path=path)
+        first.set("k", {"x": 1})
+        first.close()
+        second = ScoreCache(db_path=path)
+        assert second.get("k") == {"x": 1}
+        second.close()
+
+    def test_default_cache_shared_per_process(self, tmp_path, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "score_cache_enabled", True)
+        monkeypatch.setattr(settings, "data_dir", tmp_path)
+        try:
+            shared = get_score_cache()
+            assert get_score_cache() is shared
+        finally:
+            close_score_cache()
+        # Closed on shutdown; the next call opens a fresh connection
+        reopened = get_score_cache()
+        assert reopened is not shared
+        close_score_cache()
+
+    def test_key_depends_on_version_model_and_inputs(self):
+        base = make_score_key("score", "v1", "m", {"resume_text": "r", "skills_weight": 35})
+        assert make_score_key("score", "v2", "m", {"resume_text": "r", "skills_weight": 35}) != base
+        assert make_score_key("score", "v1", "m2", {"resume_text": "r", "skills_weight": 35}) != base
+        assert make_score_key("score", "v1", "m", {"resume_text": "r", "skills_weight": 40}) != base
+        assert make_score_key("score", "v1", "m", {"skills_weight": 35, "resume_text": "r"}) == base
+
+
+class TestCachedScorer:
+    """Tests for JobScorer with a ScoreCache in front of the LLM."""
+
+    async def test_repeated_score_skips_llm(self, cache):
+        scorer = _make_cached_scorer(cache)
+        first = await scorer.score("Resume", "Engineer", "Co", "Build things")
+        second = await scorer.score("Resume", "Engineer", "Co", "Build things")
+        assert first == second
+        assert scorer._structured_llm.ainvoke.call_count == 1
+
+    async def test_different_weights_not_shared(self, cache):
+        scorer = _make_cached_scorer(cache)
+        await scorer.score("Resume", "Engineer", "Co", "Build things")
+        await scorer.score(
+            "Resume", "Engineer", "Co", "Build things",
+            weights={"skills": 50, "experience": 20, "education": 10, "location": 10, "salary": 10},
+        )
+        assert scorer._structured_llm.ainvoke.call_count == 2
+
+    async def test_repeated_quick_score_skips_llm(self, cache):
+        scorer = _make_cached_scorer(cache)
+        assert await scorer.quick_score("py", "Engineer", "Co", "desc") == (8, "Good match")
+        assert await scorer.quick_score("py", "Engineer", "Co", "desc") == (8, "Good match")
+        assert scorer._llm.ainvoke.call_count == 1
+
+    async def test_unparseable_quick_score_not_cached(self, cache):
+        scorer = _make_cached_scorer(cache)
+        scorer._llm.ainvoke.return_value.content = "not json"
+        await scorer.quick_score("py", "Engineer", "Co", "desc")
+        await scorer.quick_score("py", "Engineer", "Co", "desc")
+        assert scorer._llm.ainvoke.call_count == 2
+
+    async def test_cache_io_runs_off_event_loop(self):
+        loop_thread = threading.get_ident()
+        io_threads: list[int] = []
+
+        class _RecordingCache(ScoreCache):
+            def get(self, key):
+                io_threads.append(threading.get_ident())
+                return super().get(key)
+
+            def set(self, key, payload):
+                io_threads.append(threading.get_ident())
+                super().set(key, payload)
+
+        cache = _RecordingCache()
+        scorer = _make_cached_scorer(cache)
+        await scorer.quick_score("py", "Engineer", "Co", "desc")
+        cache.close()
+
+        assert len(io_threads) == 2
+        assert loop_thread not in io_threads
@@ -1,11 +1,14 @@
 """Tests for LLM-as-Judge scoring with Claude."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.messages import AIMessage
 
-from app.schemas.matching import JobMatchScore
-from app.services.matching.scorer import JobScorer
+from app.schemas.matching import JobMatchScore, JobPosting
+from app.services.cache.scores import ScoreCache
+from app.services.matching.scorer import JobScorer, ScoringUsage, _parse_batch_response
 from tests.fixtures.mock_responses import (
     make_high_match_score,
     make_low_match_score,
@@ -247,3 +250,214 @@ class TestRequirementExtraction:
         )
         # Default is None (mock doesn't populate it)
         assert result.requirements_met_ratio is None
+
+
+def _make_jobs(count: int) -> list[JobPosting]:
+    return [
+        JobPosting(
+            external_id=f"job-{i}",
+            source="test",
+            title=f"Engineer {i}",
+            company="Co",
+            description=f"Build things {i}",
+        )
+        for i in range(count)
+    ]
+
+
+def _make_batch_scorer(*responses: str, cache: ScoreCache | None = None) -> JobScorer:
+    """JobScorer whose raw LLM returns the given responses in order."""
+    llm = MagicMock()
+    llm.model = "claude-test"
+    llm.with_structured_output.return_value = AsyncMock()
+    replies = []
+    for text in responses:
+        reply = MagicMock()
+        reply.content = text
+        replies.append(reply)
+    llm.ainvoke = AsyncMock(side_effect=replies)
+    return JobScorer(llm, cache=cache)
+
+
+class TestParseBatchResponse:
+    """Tests for batched quick-score response parsing."""
+
+    def test_parses_array_by_index(self):
+        text = '[{"index": 2, "relevance": 3, "reason": "b"}, {"index": 1, "relevance": 8, "reason": "a"}]'
+        assert _parse_batch_response(text, 2) == {0: (8, "a"), 1: (3, "b")}
+
+    def test_strips_code_fence(self):
+        text = '```json\n[{"index": 1, "relevance": 6, "reason": "ok"}]\n```'
+        assert _parse_batch_response(text, 1) == {0: (6, "ok")}
+
+    def test_recovers_objects_from_truncated_array(self):
+        text = '[{"index": 1, "relevance": 7, "reason": "a"}, {"index": 2, "relevance": 4, "re'
+        assert _parse_batch_response(text, 2) == {0: (7, "a")}
+
+    def test_drops_out_of_range_and_malformed_items(self):
+        text = '[{"index": 9, "relevance": 7}, {"index": 1, "relevance": "high"}, {"index": 2, "relevance": 15}]'
+        assert _parse_batch_response(text, 2) == {1: (10, "")}
+
+    def test_garbage_returns_empty(self):
+        assert _parse_batch_response("no json here", 3) == {}
+
+
+class TestQuickScoreBatch:
+    """Tests for quick_score_batch()."""
+
+    async def test_single_call_for_whole_batch(self):
+        scorer = _make_batch_scorer(
+            '[{"index": 1, "relevance": 8, "reason": "a"},'
+            ' {"index": 2, "relevance": 2, "reason": "b"},'
+            ' {"index": 3, "relevance": 5, "reason": "c"}]'
+        )
+        results = await scorer.quick_score_batch("Python", _make_jobs(3))
+        assert results == [(8, "a"), (2, "b"), (5, "c")]
+        assert scorer._llm.ainvoke.call_count == 1
+
+    async def test_missing_items_fall_back_to_per_job_calls(self):
+        scorer = _make_batch_scorer(
+            '[{"index": 1, "relevance": 8, "reason": "a"}, {"index": 3, "relev',
+            '{"relevance": 6, "reason": "fallback"}',
+            '{"relevance": 4, "reason": "fallback"}',
+        )
+        results = await scorer.quick_score_batch("Python", _make_jobs(3))
+        assert results[0] == (8, "a")
+        assert sorted(results[1:]) == [(4, "fallback"), (6, "fallback")]
+        assert scorer._llm.ainvoke.call_count == 3
+
+    async def test_unparseable_batch_falls_back_for_all_jobs(self):
+        scorer = _make_batch_scorer(
+            "Sorry, I cannot rate these jobs.",
+            '{"relevance": 7, "reason": "single"}',
+            '{"relevance": 7, "reason": "single"}',
+        )
+        results = await scorer.quick_score_batch("Python", _make_jobs(2))
+        assert results == [(7, "single"), (7, "single")]
+
+    async def test_llm_errors_propagate_without_fallback(self):
+        class RateLimitError(Exception):
+            status_code = 429
+
+        scorer = _make_batch_scorer()
+        scorer._llm.ainvoke.side_effect = RateLimitError("slow down")
+        with pytest.raises(RateLimitError):
+            await scorer.quick_score_batch("Python", _make_jobs(3))
+        assert scorer._llm.ainvoke.call_count == 1
+
+    async def test_fallback_calls_are_bounded(self, monkeypatch):
+        monkeypatch.setattr("app.services.matching.scorer.QUICK_SCORE_FALLBACK_CONCURRENCY", 2)
+        scorer = _make_batch_scorer()
+        in_flight = peak = 0
+
+        async def _reply(prompt):
+            nonlocal in_flight, peak
+            if scorer._llm.ainvoke.call_count == 1:
+                return MagicMock(content="not json")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(content='{"relevance": 6, "reason": "single"}')
+
+        scorer._llm.ainvoke.side_effect = _reply
+        results = await scorer.quick_score_batch("Python", _make_jobs(6))
+        assert results == [(6, "single")] * 6
+        assert peak == 2
+
+    async def test_fallback_disabled_returns_none_for_unparsed_jobs(self):
+        scorer = _make_batch_scorer('[{"index": 2, "relevance": 8, "reason": "b"}]')
+        results = await scorer.quick_score_batch("Python", _make_jobs(3), fallback=False)
+        assert results == [None, (8, "b"), None]
+        assert scorer._llm.ainvoke.call_count == 1
+
+    async def test_cached_jobs_are_not_resent(self):
+        cache = ScoreCache()
+        scorer = _make_batch_scorer(
+            '[{"index": 1, "relevance": 8, "reason": "a"}, {"index": 2, "relevance": 3, "reason": "b"}]',
+            '[{"index": 1, "relevance": 6, "reason": "c"}]',
+            cache=cache,
+        )
+        jobs = _make_jobs(3)
+        await scorer.quick_score_batch("Python", jobs[:2])
+        results = await scorer.quick_score_batch("Python", jobs)
+        assert results == [(8, "a"), (3, "b"), (6, "c")]
+        second_prompt = scorer._llm.ainvoke.call_args_list[1].args[0].to_string()
+        assert "Engineer 2" in second_prompt
+        assert "Engineer 0" not in second_prompt
+
+
+def _raw_result(parsed: JobMatchScore, cache_read: int = 0, cache_write: int = 0) -> dict:
+    """Structured-output result as returned with include_raw=True."""
+    raw = AIMessage(
+        content="",
+        usage_metadata={
+            "input_tokens": 1200,
+            "output_tokens": 300,
+            "total_tokens": 1500,
+            "input_token_details": {"cache_read": cache_read, "cache_creation": cache_write},
+        },
+    )
+    return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+
+class TestPromptCaching:
+    """Tests for the cacheable resume prefix and usage accounting."""
+
+    async def test_job_fields_only_in_final_message(self):
+        scorer = _make_mock_scorer(make_high_match_score())
+        await scorer.score(
+            resume_text="RESUME-TEXT",
+            job_title="JOB-TITLE",
+            job_company="JOB-CO",
+            job_description="JOB-DESC",
+        )
+        messages = scorer._structured_llm.ainvoke.call_args.args[0]
+        prefix, job = messages[0].content, messages[-1].content
+        assert "RESUME-TEXT" in prefix
+        assert "JOB-TITLE" not in prefix and "JOB-DESC" not in prefix
+        assert "JOB-TITLE" in job and "RESUME-TEXT" not in job
+
+    async def test_prefix_marked_as_cache_breakpoint_when_supported(self):
+        with patch("app.services.matching.scorer.supports_prompt_caching", return_value=True):
+            scorer = _make_mock_scorer(make_high_match_score())
+        await scorer.score("Resume", "Engineer", "Co", "Build things")
+        messages = scorer._structured_llm.ainvoke.call_args.args[0]
+        assert messages[0].content[-1]["cache_control"] == {"type": "ephemeral"}
+        assert isinstance(messages[-1].content, str)
+
+    async def test_no_breakpoint_without_support(self):
+        scorer = _make_mock_scorer(make_high_match_score())
+        await scorer.score("Resume", "Engineer", "Co", "Build things")
+        messages = scorer._structured_llm.ainvoke.call_args.args[0]
+        assert isinstance(messages[0].content, str)
+
+    async def test_usage_tracks_cache_tokens(self):
+        scorer = _make_mock_scorer(make_high_match_score())
+        scorer._structured_llm.ainvoke.side_effect = [
+            _raw_result(make_high_match_score(), cache_write=1000),
+            _raw_result(make_high_match_score(), cache_read=1000),
+        ]
+        first = await scorer.score("Resume", "Engineer", "Co", "Build things")
+        await scorer.score("Resume", "Engineer 2", "Co", "Build other things")
+
+        assert isinstance(first, JobMatchScore)
+        usage = scorer.reset_usage()
+        assert usage == ScoringUsage(
+            calls=2,
+            input_tokens=2400,
+            output_tokens=600,
+            cache_read_tokens=1000,
+            cache_write_tokens=1000,
+        )
+        assert scorer.usage.calls == 0
+
+    async def test_parsing_error_is_raised(self):
+        scorer = _make_mock_scorer(make_high_match_score())
+        scorer._structured_llm.ainvoke.return_value = {
+            "raw": AIMessage(content="oops"),
+            "parsed": None,
+            "parsing_error": ValueError("bad output"),
+        }
+        with pytest.raises(ValueError, match="bad output"):
+            await scorer.score("Resume", "Engineer", "Co", "Build things")
@@ -66,3 +66,14 @@ def remoteok_response() -> list:
 def weworkremotely_feed() -> str:
     """Load WeWorkRemotely RSS feed fixture."""
     return (SCRAPING_FIXTURES / "weworkremotely_feed.xml").read_text()
+
+
+@pytest.fixture(autouse=True)
+async def _reset_shared_http_client():
+    """Drop the process-wide scraper client after each test (pools are loop-bound)."""
+    from app.services.cache.http import parsed_responses
+    from app.services.scraping.http_client import close_http_client
+
+    yield
+    await close_http_client()
+    parsed_responses.clear()
@@ -0,0 +1,161 @@
+"""Tests for shared BaseScraper helpers."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from app.schemas.matching import JobPosting
+from app.services.scraping.api.adzuna import AdzunaScraper
+from app.services.scraping.api.jsearch import JSearchScraper
+from app.services.scraping.base import BaseScraper, ScrapingResult
+
+
+class PagedScraper(BaseScraper):
+    """Minimal scraper exposing _stream_pages over a fake page source."""
+
+    SOURCE = "paged"
+
+    def __init__(self, sizes: dict[int, int], delays: dict[int, float] | None = None) -> None:
+        super().__init__()
+        self.sizes = sizes
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def fetch_page(self, page: int) -> ScrapingResult:
+        self.started.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(page, 0.001))
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        finally:
+            self.in_flight -= 1
+        size = self.sizes.get(page, 0)
+        if size < 0:
+            return ScrapingResult(source=self.SOURCE, errors=[f"HTTP 500 on page {page}"])
+        return ScrapingResult(source=self.SOURCE, total_found=size)
+
+    async def pages(self, num_pages: int, concurrency: int) -> list[int]:
+        found = []
+        async for chunk in self._stream_pages(self.fetch_page, num_pages, 10, concurrency):
+            found.append(chunk.total_found)
+        return found
+
+    async def scrape(self, query: str, **kwargs) -> ScrapingResult:
+        return ScrapingResult(source=self.SOURCE)
+
+    def normalize(self, raw_data: dict) -> JobPosting | None:
+        return None
+
+
+class TestStreamPages:
+    """Concurrent pagination in page order with early stop."""
+
+    async def test_yields_in_page_order_despite_completion_order(self):
+        # Earlier pages finish last
+        scraper = PagedScraper(
+            sizes={1: 10, 2: 10, 3: 9}, delays={1: 0.03, 2: 0.02, 3: 0.01}
+        )
+        assert await scraper.pages(num_pages=3, concurrency=3) == [10, 10, 9]
+        assert scraper.max_in_flight == 3
+
+    async def test_concurrency_bounded(self):
+        scraper = PagedScraper(sizes=dict.fromkeys(range(1, 9), 10))
+        assert len(await scraper.pages(num_pages=8, concurrency=3)) == 8
+        assert scraper.max_in_flight == 3
+
+    async def test_stops_on_short_page_and_cancels_rest(self):
+        scraper = PagedScraper(
+            sizes={1: 10, 2: 4, 3: 10, 4: 10}, delays={3: 1.0, 4: 1.0}
+        )
+        assert await scraper.pages(num_pages=4, concurrency=4) == [10, 4]
+        assert sorted(scraper.cancelled) == [3, 4]
+
+    async def test_stops_on_empty_page(self):
+        scraper = PagedScraper(sizes={1: 10, 2: 0, 3: 10})
+        assert await scraper.pages(num_pages=3, concurrency=1) == [10, 0]
+        assert scraper.started == [1, 2]
+
+    async def test_stops_on_error(self):
+        scraper = PagedScraper(sizes={1: -1, 2: 10}, delays={2: 1.0})
+        errors = []
+        async for chunk in scraper._stream_pages(scraper.fetch_page, 2, 10, 2):
+            errors.extend(chunk.errors)
+        assert errors == ["HTTP 500 on page 1"]
+        assert scraper.cancelled == [2]
+
+    async def test_consumer_exit_cancels_in_flight(self):
+        scraper = PagedScraper(sizes=dict.fromkeys(range(1, 5), 10), delays={2: 1.0, 3: 1.0})
+        stream = scraper._stream_pages(scraper.fetch_page, 4, 10, 3)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        assert sorted(scraper.cancelled) == [2, 3]
+
+
+def _jsearch_page(page: int, size: int) -> dict:
+    return {
+        "data": [
+            {"job_id": f"p{page}-{i}", "job_title": "Engineer", "employer_name": "Acme"}
+            for i in range(size)
+        ]
+    }
+
+
+class TestPaginatedScrapers:
+    """JSearch and Adzuna fetch pages concurrently."""
+
+    async def test_jsearch_pages_concurrent_and_ordered(self, httpx_mock: HTTPXMock):
+        in_flight = 0
+        peak = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            page = int(request.url.params["page"])
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (4 - page))  # later pages answer first
+            in_flight -= 1
+            return httpx.Response(200, json=_jsearch_page(page, 10 if page < 3 else 2))
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        scraper = JSearchScraper(api_key="k", page_concurrency=3)
+        result = await scraper.scrape("Engineer", num_pages=3)
+
+        assert [j.external_id.split("-")[0] for j in result.jobs] == ["p1"] * 10 + ["p2"] * 10 + [
+            "p3"
+        ] * 2
+        assert peak == 3
+
+    async def test_jsearch_short_first_page_skips_rest(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=_jsearch_page(1, 3))
+        scraper = JSearchScraper(api_key="k", page_concurrency=1)
+        result = await scraper.scrape("Engineer", num_pages=5)
+        assert len(result.jobs) == 3
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    async def test_adzuna_stops_after_error(
+        self, httpx_mock: HTTPXMock, adzuna_response, concurrency
+    ):
+        full_page = {"results": adzuna_response["results"] * 7}  # 21 >= page size
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.path.rsplit("/", 1)[-1])
+            if page == 2:
+                return httpx.Response(429)
+            return httpx.Response(200, json=full_page)
+
+        httpx_mock.add_callback(respond, is_reusable=True, is_optional=True)
+        scraper = AdzunaScraper(app_id="id", app_key="key", page_concurrency=concurrency)
+        result = await scraper.scrape("Engineer", num_pages=4)
+
+        assert result.errors == ["HTTP 429 on page 2"]
+        assert result.total_found == 21
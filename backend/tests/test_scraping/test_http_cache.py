@@ -0,0 +1,197 @@
+"""Tests for the conditional-request scraper HTTP cache."""
+
+import gzip
+
+import httpx
+import pytest
+
+from app.services.cache.http import (
+    CACHE_STATUS_EXTENSION,
+    CACHE_VERSION_EXTENSION,
+    CachingTransport,
+    HttpCache,
+)
+from app.services.scraping.api.weworkremotely import WeWorkRemotelyScraper
+from app.services.scraping.http_client import HttpClientMetrics, build_http_client
+
+FEED_URL = "https://example.com/feed.json"
+
+
+class FeedServer:
+    """Mock origin honouring If-None-Match / If-Modified-Since."""
+
+    def __init__(self, body: bytes = b'{"jobs": [1, 2]}', etag: str | None = '"v1"') -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified: str | None = None
+        self.extra_headers: dict[str, str] = {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        if self.last_modified and request.headers.get("if-modified-since") == self.last_modified:
+            return httpx.Response(304)
+        headers = dict(self.extra_headers)
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        return httpx.Response(200, content=self.body, headers=headers)
+
+
+def _client(server: FeedServer, cache: HttpCache, replay_ttl: float = 0.0) -> httpx.AsyncClient:
+    transport = CachingTransport(httpx.MockTransport(server), cache, replay_ttl=replay_ttl)
+    return httpx.AsyncClient(transport=transport)
+
+
+@pytest.fixture
+def cache():
+    cache = HttpCache()
+    yield cache
+    cache.close()
+
+
+class TestCachingTransport:
+    """Revalidation, replay and storage rules."""
+
+    async def test_revalidates_with_etag(self, cache: HttpCache):
+        server = FeedServer()
+        async with _client(server, cache) as client:
+            first = await client.get(FEED_URL)
+            second = await client.get(FEED_URL)
+
+        assert server.requests[1].headers["if-none-match"] == '"v1"'
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"jobs": [1, 2]}
+        assert first.extensions[CACHE_STATUS_EXTENSION] == "stored"
+        assert second.extensions[CACHE_STATUS_EXTENSION] == "revalidated"
+        assert second.extensions[CACHE_VERSION_EXTENSION] == first.extensions[CACHE_VERSION_EXTENSION]
+
+    async def test_revalidates_with_last_modified(self, cache: HttpCache):
+        server = FeedServer(etag=None)
+        server.last_modified = "Wed, 14 Oct 2026 10:00:00 GMT"
+        async with _client(server, cache) as client:
+            await client.get(FEED_URL)
+            second = await client.get(FEED_URL)
+
+        assert server.requests[1].headers["if-modified-since"] == server.last_modified
+        assert second.extensions[CACHE_STATUS_EXTENSION] == "revalidated"
+        assert cache.stats()["revalidated"] == 1
+
+    async def test_changed_body_replaces_entry(self, cache: HttpCache):
+        server = FeedServer()
+        async with _client(server, cache) as client:
+            first = await client.get(FEED_URL)
+            server.body, server.etag = b'{"jobs": [3]}', '"v2"'
+            second = await client.get(FEED_URL)
+            third = await client.get(FEED_URL)
+
+        assert second.json() == third.json() == {"jobs": [3]}
+        assert second.extensions[CACHE_VERSION_EXTENSION] != first.extensions[CACHE_VERSION_EXTENSION]
+        assert third.extensions[CACHE_STATUS_EXTENSION] == "revalidated"
+        assert len(cache) == 1
+
+    async def test_responses_without_validators_not_stored(self, cache: HttpCache):
+        server = FeedServer(etag=None)
+        async with _client(server, cache) as client:
+            await client.get(FEED_URL)
+            second = await client.get(FEED_URL)
+
+        assert "if-none-match" not in server.requests[1].headers
+        assert CACHE_STATUS_EXTENSION not in second.extensions
+        assert len(cache) == 0
+
+    async def test_no_store_respected(self, cache: HttpCache):
+        server = FeedServer()
+        server.extra_headers["Cache-Control"] = "no-store"
+        async with _client(server, cache) as client:
+            await client.get(FEED_URL)
+        assert len(cache) == 0
+
+    async def test_non_get_passes_through(self, cache: HttpCache):
+        server = FeedServer()
+        async with _client(server, cache) as client:
+            await client.post(FEED_URL)
+            await client.post(FEED_URL)
+        assert len(cache) == 0
+        assert "if-none-match" not in server.requests[1].headers
+
+    async def test_replay_serves_without_network(self, cache: HttpCache):
+        server = FeedServer(etag=None)
+        async with _client(server, cache, replay_ttl=3600) as client:
+            await client.get(FEED_URL)
+            replayed = await client.get(FEED_URL)
+
+        assert len(server.requests) == 1
+        assert replayed.json() == {"jobs": [1, 2]}
+        assert replayed.extensions[CACHE_STATUS_EXTENSION] == "replayed"
+
+    async def test_compressed_body_stored_raw_and_decoded(self, cache: HttpCache):
+        server = FeedServer(body=gzip.compress(b'{"jobs": [9]}'))
+        server.extra_headers["Content-Encoding"] = "gzip"
+        async with _client(server, cache) as client:
+            await client.get(FEED_URL)
+            second = await client.get(FEED_URL)
+        assert second.json() == {"jobs": [9]}
+
+    async def test_persists_across_instances(self, tmp_path):
+        server = FeedServer()
+        db_path = tmp_path / "http_cache.db"
+        for _ in range(2):
+            cache = HttpCache(db_path)
+            async with _client(server, cache) as client:
+                response = await client.get(FEED_URL)
+            cache.close()
+        assert response.extensions[CACHE_STATUS_EXTENSION] == "revalidated"
+
+
+class TestHttpCache:
+    """SQLite store behaviour."""
+
+    async def test_lru_eviction(self):
+        cache = HttpCache(max_entries=2)
+        server = FeedServer()
+        async with _client(server, cache) as client:
+            for name in ("a", "b", "a", "c"):
+                await client.get(f"https://example.com/{name}")
+        assert len(cache) == 2
+
+    async def test_urls_are_hashed(self, cache: HttpCache):
+        server = FeedServer()
+        async with _client(server, cache) as client:
+            await client.get(f"{FEED_URL}?app_key=secret")
+        keys = cache._store.keys()
+        assert keys and all("secret" not in k for k in keys)
+
+
+class TestParsedResponseReuse:
+    """Unchanged feeds skip parsing."""
+
+    async def test_unchanged_feed_not_reparsed(self, monkeypatch, weworkremotely_feed):
+        server = FeedServer(body=weworkremotely_feed.encode())
+        parses = 0
+        original = WeWorkRemotelyScraper._parse_rss
+
+        def counting_parse(self, xml_text):
+            nonlocal parses
+            parses += 1
+            return original(self, xml_text)
+
+        monkeypatch.setattr(WeWorkRemotelyScraper, "_parse_rss", counting_parse)
+        client = build_http_client(
+            HttpClientMetrics(),
+            transport_factory=lambda: httpx.MockTransport(server),
+            cache=HttpCache(),
+        )
+        async with client:
+            scraper = WeWorkRemotelyScraper(client=client, categories=["programming"])
+            first = await scraper.scrape("engineer")
+            second = await scraper.scrape("engineer")
+            server.body, server.etag = weworkremotely_feed.replace("Engineer", "Dev").encode(), '"v2"'
+            await scraper.scrape("engineer")
+
+        assert len(server.requests) == 3
+        assert [j.external_id for j in first.jobs] == [j.external_id for j in second.jobs]
+        assert parses == 2
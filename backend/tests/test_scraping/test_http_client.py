@@ -0,0 +1,189 @@
+"""Tests for the shared scraper HTTP client."""
+
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from app.config import get_settings
+from app.services.scraping import http_client
+from app.services.scraping.api.remoteok import RemoteOKScraper
+from app.services.scraping.http_client import (
+    HostPoolTransport,
+    HttpClientMetrics,
+    build_http_client,
+    close_http_client,
+    get_http_client,
+    http_client_stats,
+)
+from app.services.scraping.rate_limit import RateLimiter
+
+
+class FakePool(httpx.AsyncBaseTransport):
+    """Transport that reports opening a connection on its first request only."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.requests == 1:
+            trace = request.extensions["trace"]
+            await trace("connection.connect_tcp.started", {})
+            await trace("connection.connect_tcp.complete", {"return_value": None})
+        return httpx.Response(200, json={"ok": True}, extensions={"http_version": b"HTTP/1.1"})
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _fake_client(metrics: HttpClientMetrics, pools: list[FakePool]) -> httpx.AsyncClient:
+    def factory() -> FakePool:
+        pools.append(FakePool())
+        return pools[-1]
+
+    return build_http_client(metrics, transport_factory=factory)
+
+
+class TestHostPoolTransport:
+    """Per-origin routing and connection-reuse metrics."""
+
+    async def test_one_pool_per_origin(self):
+        pools: list[FakePool] = []
+        async with _fake_client(HttpClientMetrics(), pools) as client:
+            await client.get("https://boards-api.greenhouse.io/v1/boards/a/jobs")
+            await client.get("https://boards-api.greenhouse.io/v1/boards/b/jobs")
+            await client.get("https://api.lever.co/v0/postings/c")
+        assert [p.requests for p in pools] == [2, 1]
+
+    async def test_counts_opened_and_reused_connections(self):
+        metrics = HttpClientMetrics()
+        async with _fake_client(metrics, []) as client:
+            for _ in range(4):
+                await client.get("https://remoteok.com/api")
+            await client.get("https://weworkremotely.com/feed.rss")
+
+        assert metrics.requests == 5
+        assert metrics.connections_opened == 2
+        assert metrics.connections_reused == 3
+        assert metrics.reuse_ratio == pytest.approx(0.6)
+        assert metrics.requests_per_host == {"remoteok.com": 4, "weworkremotely.com": 1}
+
+    async def test_chains_caller_trace(self):
+        events: list[str] = []
+
+        async def trace(event: str, info: dict) -> None:
+            events.append(event)
+
+        async with _fake_client(HttpClientMetrics(), []) as client:
+            await client.get("https://remoteok.com/api", extensions={"trace": trace})
+        assert "connection.connect_tcp.complete" in events
+
+    async def test_failures_counted_and_reraised(self):
+        class FailingPool(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                raise httpx.ConnectError("refused", request=request)
+
+        metrics = HttpClientMetrics()
+        transport = HostPoolTransport(metrics, FailingPool)
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://remoteok.com/api")
+        assert metrics.failures == 1
+        assert metrics.connections_opened == metrics.connections_reused == 0
+
+    async def test_aclose_closes_every_pool(self):
+        pools: list[FakePool] = []
+        client = _fake_client(HttpClientMetrics(), pools)
+        await client.get("https://a.example.com/")
+        await client.get("https://b.example.com/")
+        await client.aclose()
+        assert all(p.closed for p in pools)
+
+
+class TestBuildHttpClient:
+    """Client configuration from settings."""
+
+    def test_timeouts_from_settings(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "scraper_http_timeout", 12.0)
+        monkeypatch.setattr(settings, "scraper_http_connect_timeout", 3.0)
+        client = build_http_client()
+        assert client.timeout.read == 12.0
+        assert client.timeout.connect == 3.0
+
+    def test_http2_falls_back_without_h2(self, monkeypatch, caplog):
+        monkeypatch.setattr(get_settings(), "scraper_http2", True)
+        monkeypatch.setattr(http_client, "_http2_available", lambda: False)
+        with caplog.at_level(logging.WARNING):
+            build_http_client()
+        assert "h2 package is missing" in caplog.text
+
+
+class TestSharedClient:
+    """Process-wide client lifecycle."""
+
+    async def test_shared_within_event_loop(self):
+        assert get_http_client() is get_http_client()
+
+    async def test_close_then_recreate(self):
+        first = get_http_client()
+        await close_http_client()
+        assert first.is_closed
+        assert get_http_client() is not first
+
+    async def test_client_from_other_loop_detaches_its_limiter(self, monkeypatch):
+        redis = MagicMock()
+        stale = RateLimiter({"example.com": 1.0}, redis=redis)
+        other_loop = asyncio.new_event_loop()
+        other_loop.close()
+        monkeypatch.setattr(http_client, "_client", httpx.AsyncClient())
+        monkeypatch.setattr(http_client, "_client_loop", other_loop)
+        monkeypatch.setattr(http_client, "_limiter", stale)
+
+        client = get_http_client()
+
+        redis.connection_pool.reset.assert_called_once_with()
+        redis.aclose.assert_not_called()
+        assert http_client._limiter is not stale
+        assert http_client._client_loop is asyncio.get_running_loop()
+        assert client is get_http_client()
+
+    async def test_scrapers_share_client_and_do_not_close_it(
+        self, httpx_mock: HTTPXMock, remoteok_response
+    ):
+        httpx_mock.add_response(json=remoteok_response)
+        httpx_mock.add_response(json=remoteok_response)
+        first, second = RemoteOKScraper(), RemoteOKScraper()
+
+        await first.scrape("python")
+        await first.close()
+        await second.scrape("python")
+
+        assert await first._get_client() is await second._get_client()
+        assert not get_http_client().is_closed
+
+    async def test_injected_client_is_used(self):
+        async with httpx.AsyncClient() as own:
+            scraper = RemoteOKScraper(client=own)
+            assert await scraper._get_client() is own
+            await scraper.close()
+            assert not own.is_closed
+
+    async def test_stats_count_scraper_requests(self, httpx_mock: HTTPXMock, remoteok_response):
+        httpx_mock.add_response(json=remoteok_response)
+        before = http_client_stats()["requests_per_host"].get("remoteok.com", 0)
+        await RemoteOKScraper().scrape("python")
+        assert http_client_stats()["requests_per_host"]["remoteok.com"] == before + 1
+
+    async def test_cache_enabled_from_settings(self, monkeypatch, tmp_path):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "scraper_http_cache_enabled", True)
+        monkeypatch.setattr(settings, "data_dir", tmp_path)
+        get_http_client()
+        assert (tmp_path / ".http_cache.db").exists()
+        assert http_client_stats()["cache"]["stored"] == 0
@@ -1,9 +1,11 @@
 """Tests for the scraping orchestrator."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 from app.schemas.matching import JobPosting
-from app.services.scraping.base import ScrapingResult
+from app.services.scraping.base import BaseScraper, ScrapingResult
 from app.services.scraping.orchestrator import ScrapingOrchestrator
 
 
@@ -122,3 +124,217 @@ class TestScrapingOrchestrator:
         await orchestrator.run("query")
 
         scraper.close.assert_called_once()
+
+
+def _make_slow_scraper(source: str, jobs: list[JobPosting], delay: float) -> MagicMock:
+    async def _scrape(query, **kwargs):
+        await asyncio.sleep(delay)
+        return ScrapingResult(source=source, jobs=jobs, total_found=len(jobs))
+
+    scraper = MagicMock()
+    scraper.SOURCE = source
+    scraper.scrape = AsyncMock(side_effect=_scrape)
+    scraper.close = AsyncMock()
+    return scraper
+
+
+class TestConcurrentOrchestration:
+    """Tests for concurrent scraper fan-out."""
+
+    async def test_scrapers_run_concurrently(self):
+        scrapers = [
+            _make_slow_scraper(f"s{i}", [_make_job(f"E{i}", f"C{i}", f"s{i}", f"j{i}")], 0.2)
+            for i in range(4)
+        ]
+
+        orchestrator = ScrapingOrchestrator(scrapers=scrapers)
+        start = time.perf_counter()
+        result = await orchestrator.run("query")
+        elapsed = time.perf_counter() - start
+
+        assert result.total == 4
+        assert elapsed < 0.6  # ~slowest source, not the sum (0.8s)
+
+    async def test_concurrency_cap_respected(self):
+        scrapers = [
+            _make_slow_scraper(f"s{i}", [], 0.1) for i in range(4)
+        ]
+
+        orchestrator = ScrapingOrchestrator(scrapers=scrapers, max_concurrency=1)
+        start = time.perf_counter()
+        await orchestrator.run("query")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.4
+
+    async def test_source_timeout_isolated(self):
+        fast = _make_slow_scraper("fast", [_make_job("E1", "C1", "fast", "j1")], 0.0)
+        slow = _make_slow_scraper("slow", [_make_job("E2", "C2", "slow", "j2")], 1.0)
+
+        orchestrator = ScrapingOrchestrator(scrapers=[fast, slow], source_timeout=0.1)
+        result = await orchestrator.run("query")
+
+        assert result.per_source == {"fast": 1, "slow": 0}
+        assert len(result.errors) == 1
+        assert "slow timed out" in result.errors[0]
+        slow.close.assert_called_once()
+
+    async def test_merge_order_matches_scraper_order(self):
+        """First-seen dedup must follow scraper order, not completion order."""
+        job_a = _make_job("Engineer", "Google", "first", "j1")
+        job_b = _make_job("Engineer", "Google", "second", "j2")
+        first = _make_slow_scraper("first", [job_a], 0.2)
+        second = _make_slow_scraper("second", [job_b], 0.0)
+
+        orchestrator = ScrapingOrchestrator(scrapers=[first, second])
+        result = await orchestrator.run("query")
+
+        assert result.new == 1
+        assert result.jobs[0].source == "first"
+        assert list(result.per_source) == ["first", "second"]
+
+    async def test_sequential_mode(self):
+        scrapers = [_make_slow_scraper(f"s{i}", [], 0.05) for i in range(3)]
+
+        orchestrator = ScrapingOrchestrator(scrapers=scrapers, concurrent=False)
+        result = await orchestrator.run("query")
+
+        assert result.per_source == {"s0": 0, "s1": 0, "s2": 0}
+
+
+class _ChunkedScraper(BaseScraper):
+    """Scraper that streams pre-built chunks with an optional delay between them."""
+
+    def __init__(self, source: str, chunks: list[list[JobPosting]], delay: float = 0.0) -> None:
+        super().__init__()
+        self.SOURCE = source
+        self._chunks = chunks
+        self._delay = delay
+        self.closed = False
+
+    async def scrape(self, query: str, **kwargs) -> ScrapingResult:
+        return await self._collect(self.stream(query, **kwargs))
+
+    async def stream(self, query: str, **kwargs):
+        for chunk in self._chunks:
+            await asyncio.sleep(self._delay)
+            yield ScrapingResult(source=self.SOURCE, jobs=chunk, total_found=len(chunk))
+
+    def normalize(self, raw_data: dict) -> JobPosting | None:
+        return None
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestStreamingOrchestration:
+    """Tests for the streaming scrape → dedup → index path."""
+
+    async def test_stream_yields_bounded_batches(self):
+        chunks = [
+            [_make_job(f"E{p}{i}", f"C{p}{i}", "s", f"j{p}{i}") for i in range(3)]
+            for p in range(3)
+        ]
+        scraper = _ChunkedScraper("s", chunks)
+        mock_embedder = MagicMock()
+        mock_embedder.index_jobs.side_effect = lambda batch: len(batch)
+
+        orchestrator = ScrapingOrchestrator(
+            scrapers=[scraper], embedder=mock_embedder, stream_batch_size=4
+        )
+        batches = [b async for b in orchestrator.stream("query")]
+
+        assert [len(b) for b in batches] == [4, 4, 1]
+        assert mock_embedder.index_jobs.call_count == 3
+        assert scraper.closed
+
+    async def test_first_batch_available_before_scrape_finishes(self):
+        chunks = [[_make_job(f"E{p}", f"C{p}", "s", f"j{p}")] for p in range(5)]
+        scraper = _ChunkedScraper("s", chunks, delay=0.1)
+
+        orchestrator = ScrapingOrchestrator(scrapers=[scraper], stream_batch_size=1)
+        start = time.perf_counter()
+        async for _batch in orchestrator.stream("query"):
+            first_at = time.perf_counter() - start
+            break
+
+        assert first_at < 0.3
+
+    async def test_run_streaming_dedups_incrementally(self):
+        dup_a = _make_job("Engineer", "Google", "a", "j1")
+        dup_b = _make_job("Engineer", "Google", "b", "j2")
+        other = _make_job("Designer", "Figma", "b", "j3")
+
+        orchestrator = ScrapingOrchestrator(
+            scrapers=[_ChunkedScraper("a", [[dup_a]]), _ChunkedScraper("b", [[dup_b], [other]])],
+        )
+        result = await orchestrator.run_streaming("query", keep_jobs=True)
+
+        assert result.total == 3
+        assert result.new == 2
+        assert result.duplicates == 1
+        assert result.per_source == {"a": 1, "b": 2}
+        assert len(result.jobs) == 2
+
+    async def test_run_streaming_isolates_failures(self):
+        class _Broken(_ChunkedScraper):
+            async def stream(self, query: str, **kwargs):
+                yield ScrapingResult(source=self.SOURCE, jobs=[_make_job("E1", "C1", "bad", "j1")])
+                raise RuntimeError("boom")
+
+        good = _ChunkedScraper("good", [[_make_job("E2", "C2", "good", "j2")]])
+        orchestrator = ScrapingOrchestrator(scrapers=[_Broken("bad", []), good])
+        result = await orchestrator.run_streaming("query")
+
+        assert result.new == 2
+        assert result.jobs == []
+        assert any("bad failed: boom" in e for e in result.errors)
+
+    async def test_backpressure_does_not_count_against_source_timeout(self):
+        chunks = [[_make_job(f"E{p}", f"C{p}", "s", f"j{p}")] for p in range(8)]
+        scraper = _ChunkedScraper("s", chunks)
+        mock_embedder = MagicMock()
+        mock_embedder.index_jobs.side_effect = lambda batch: time.sleep(0.1) or len(batch)
+
+        orchestrator = ScrapingOrchestrator(
+            scrapers=[scraper],
+            embedder=mock_embedder,
+            max_concurrency=1,
+            source_timeout=0.15,
+            stream_batch_size=1,
+        )
+        result = await orchestrator.run_streaming("query")
+
+        assert result.errors == []
+        assert result.new == 8
+
+    async def test_stream_source_timeout_still_applies_to_fetching(self):
+        slow = _ChunkedScraper("slow", [[_make_job("E1", "C1", "slow", "j1")]], delay=1.0)
+        orchestrator = ScrapingOrchestrator(scrapers=[slow], source_timeout=0.1)
+
+        result = await orchestrator.run_streaming("query")
+
+        assert result.new == 0
+        assert any("slow timed out" in e for e in result.errors)
+
+    async def test_stream_sequential_mode_runs_scrapers_in_order(self):
+        started: list[str] = []
+
+        class _Tracked(_ChunkedScraper):
+            async def stream(self, query: str, **kwargs):
+                started.append(self.SOURCE)
+                async for chunk in super().stream(query, **kwargs):
+                    yield chunk
+
+        scrapers = [
+            _Tracked(f"s{i}", [[_make_job(f"E{i}", f"C{i}", f"s{i}", f"j{i}")]], delay=0.05)
+            for i in range(3)
+        ]
+        orchestrator = ScrapingOrchestrator(scrapers=scrapers, concurrent=False)
+        start = time.perf_counter()
+        result = await orchestrator.run_streaming("query", keep_jobs=True)
+        elapsed = time.perf_counter() - start
+
+        assert started == ["s0", "s1", "s2"]
+        assert [j.source for j in result.jobs] == ["s0", "s1", "s2"]
+        assert elapsed >= 0.15
@@ -0,0 +1,324 @@
+"""Tests for scraper rate limiting and retries."""
+
+import asyncio
+import email.utils
+import time
+
+import httpx
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.config import get_settings
+from app.services.scraping import rate_limit
+from app.services.scraping.http_client import (
+    HttpClientMetrics,
+    build_http_client,
+    get_http_client,
+    http_client_stats,
+)
+from app.services.scraping.rate_limit import (
+    RateLimitedTransport,
+    RateLimiter,
+    RedisTokenBucket,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+URL = "https://api.adzuna.com/v1/api/jobs/gb/search/1?app_key=secret"
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record transport retry sleeps instead of waiting."""
+    recorded: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+class Origin:
+    """Mock origin answering with a scripted sequence of responses or errors."""
+
+    def __init__(self, *script: int | tuple[int, dict] | type[Exception]) -> None:
+        self.script = list(script)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        step = self.script.pop(0) if len(self.script) > 1 else self.script[0]
+        if isinstance(step, type):
+            raise step("boom", request=request)
+        status, headers = step if isinstance(step, tuple) else (step, {})
+        return httpx.Response(status, headers=headers, json={"status": status})
+
+
+def _client(
+    origin: Origin,
+    limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+) -> httpx.AsyncClient:
+    transport = RateLimitedTransport(
+        httpx.MockTransport(origin), limiter or RateLimiter({}), retry or RetryPolicy()
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+class TestTokenBucket:
+    """Local bucket refill and pause."""
+
+    async def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=50, burst=2)
+        start = time.monotonic()
+        waits = [await bucket.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - start
+
+        assert waits[:2] == [0.0, 0.0]
+        assert all(w > 0 for w in waits[2:])
+        assert elapsed >= 0.035  # two tokens at 50/s
+
+    async def test_pause_blocks_tokens(self):
+        bucket = TokenBucket(rate=1000, burst=5)
+        await bucket.pause(0.03)
+        assert await bucket.acquire() >= 0.025
+
+    def test_reserve_reports_wait(self):
+        bucket = TokenBucket(rate=2, burst=1)
+        now = time.monotonic()
+        assert bucket._reserve(now) == 0.0
+        assert bucket._reserve(now) == pytest.approx(0.5)
+
+
+class TestRateLimiter:
+    """Per-host bucket registry."""
+
+    async def test_unlisted_hosts_unlimited(self):
+        limiter = RateLimiter({"api.adzuna.com": 1.0})
+        assert limiter.bucket("remoteok.com") is None
+        for _ in range(20):
+            await limiter.acquire("remoteok.com")
+        assert limiter.metrics.throttled == 0
+
+    def test_zero_rate_means_unlimited(self):
+        assert RateLimiter({"api.adzuna.com": 0}).bucket("api.adzuna.com") is None
+
+    def test_bucket_reused_per_host(self):
+        limiter = RateLimiter({"a.example.com": 5.0, "b.example.com": 5.0})
+        assert limiter.bucket("a.example.com") is limiter.bucket("a.example.com")
+        assert limiter.bucket("a.example.com") is not limiter.bucket("b.example.com")
+
+    async def test_throttling_counted(self):
+        limiter = RateLimiter({"api.adzuna.com": 100.0})
+        for _ in range(101):  # burst of 100, then one wait
+            await limiter.acquire("api.adzuna.com")
+        assert limiter.metrics.throttled == 1
+        assert limiter.metrics.throttled_seconds > 0
+
+
+class TestParseRetryAfter:
+    """Retry-After header formats."""
+
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 60, usegmt=True)
+        assert parse_retry_after(value) == pytest.approx(60, abs=2)
+
+    def test_past_date_is_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-3"])
+    def test_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRateLimitedTransport:
+    """Retries, backoff and Retry-After handling."""
+
+    async def test_retries_until_success(self, sleeps):
+        origin = Origin(503, 502, 200)
+        limiter = RateLimiter({})
+        async with _client(origin, limiter, RetryPolicy(base_delay=1.0)) as client:
+            response = await client.get(URL)
+
+        assert response.status_code == 200
+        assert len(origin.requests) == 3
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+        assert limiter.metrics.retries == 2
+        assert limiter.metrics.retries_per_host == {"api.adzuna.com": 2}
+
+    async def test_retry_after_honoured_and_pauses_host(self, sleeps):
+        paused: list[tuple[str, float]] = []
+
+        class RecordingLimiter(RateLimiter):
+            async def pause(self, host: str, seconds: float) -> None:
+                paused.append((host, seconds))
+
+        origin = Origin((429, {"Retry-After": "4"}), 200)
+        async with _client(origin, RecordingLimiter({})) as client:
+            assert (await client.get(URL)).status_code == 200
+
+        assert sleeps == [4.0]
+        assert paused == [("api.adzuna.com", 4.0)]
+
+    async def test_gives_up_with_last_response(self, sleeps):
+        origin = Origin(503)
+        limiter = RateLimiter({})
+        async with _client(origin, limiter, RetryPolicy(max_retries=2)) as client:
+            response = await client.get(URL)
+
+        assert response.status_code == 503
+        assert response.json() == {"status": 503}
+        assert len(origin.requests) == 3
+        assert limiter.metrics.retries_exhausted == 1
+
+    async def test_long_retry_after_not_waited(self, sleeps):
+        origin = Origin((429, {"Retry-After": "3600"}), 200)
+        async with _client(origin, retry=RetryPolicy(max_delay=30)) as client:
+            response = await client.get(URL)
+
+        assert response.status_code == 429
+        assert len(origin.requests) == 1
+        assert sleeps == []
+
+    async def test_post_not_retried(self, sleeps):
+        origin = Origin(503, 200)
+        async with _client(origin) as client:
+            assert (await client.post(URL)).status_code == 503
+        assert len(origin.requests) == 1
+
+    async def test_network_errors_retried_then_raised(self, sleeps):
+        origin = Origin(httpx.ConnectError)
+        limiter = RateLimiter({})
+        async with _client(origin, limiter, RetryPolicy(max_retries=2)) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get(URL)
+
+        assert len(origin.requests) == 3
+        assert limiter.metrics.retries == 2
+        assert limiter.metrics.retries_exhausted == 1
+
+    async def test_network_error_then_success(self, sleeps):
+        origin = Origin(httpx.ReadTimeout, 200)
+        async with _client(origin) as client:
+            assert (await client.get(URL)).status_code == 200
+
+    async def test_client_errors_not_retried(self, sleeps):
+        origin = Origin(404, 200)
+        async with _client(origin) as client:
+            assert (await client.get(URL)).status_code == 404
+        assert sleeps == []
+
+    async def test_quota_applies_to_each_attempt(self):
+        origin = Origin(200)
+        limiter = RateLimiter({"api.adzuna.com": 20.0})
+        async with _client(origin, limiter) as client:
+            await asyncio.gather(*(client.get(URL) for _ in range(22)))
+
+        assert len(origin.requests) == 22
+        assert limiter.metrics.throttled >= 1
+
+    async def test_retry_log_omits_query_string(self, sleeps, caplog):
+        origin = Origin(503, 200)
+        with caplog.at_level("INFO", logger=rate_limit.__name__):
+            async with _client(origin) as client:
+                await client.get(URL)
+        assert "api.adzuna.com/v1/api/jobs/gb/search/1" in caplog.text
+        assert "secret" not in caplog.text
+
+
+class FakeRedis:
+    """Stand-in for redis.asyncio.Redis returning scripted token-bucket waits (ms)."""
+
+    def __init__(self, *waits: int | Exception) -> None:
+        self.waits = list(waits)
+        self.evals: list[tuple] = []
+        self.sets: list[tuple] = []
+        self.closed = False
+
+    async def eval(self, script, numkeys, *args):
+        self.evals.append(args)
+        wait = self.waits.pop(0)
+        if isinstance(wait, Exception):
+            raise wait
+        return wait
+
+    async def set(self, key, value, px=None):
+        self.sets.append((key, px))
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestRedisTokenBucket:
+    """Shared buckets through Redis."""
+
+    async def test_waits_until_redis_grants_token(self):
+        redis = FakeRedis(5, 0)
+        bucket = RedisTokenBucket(redis, "api.adzuna.com", rate=2.0, burst=2)
+        assert await bucket.acquire() == pytest.approx(0.005)
+        assert redis.evals[0] == (
+            "scraper:ratelimit:api.adzuna.com",
+            "scraper:ratelimit:api.adzuna.com:pause",
+            2.0,
+            2,
+        )
+
+    async def test_pause_shared_through_redis(self):
+        redis = FakeRedis()
+        bucket = RedisTokenBucket(redis, "api.adzuna.com", rate=1.0)
+        await bucket.pause(2.5)
+        assert redis.sets == [("scraper:ratelimit:api.adzuna.com:pause", 2500)]
+
+    async def test_falls_back_to_local_bucket(self):
+        limiter = RateLimiter({"api.adzuna.com": 1.0}, redis=FakeRedis(RedisConnectionError()))
+        bucket = limiter.bucket("api.adzuna.com")
+        assert isinstance(bucket, RedisTokenBucket)
+
+        await limiter.acquire("api.adzuna.com")
+        assert limiter.metrics.backend_errors == 1
+        assert bucket._fallback._tokens == 0  # the local token was spent
+
+    async def test_limiter_closes_redis(self):
+        redis = FakeRedis()
+        await RateLimiter({}, redis=redis).aclose()
+        assert redis.closed
+
+
+class TestClientWiring:
+    """Rate limiting in the shared scraper client."""
+
+    async def test_build_http_client_retries(self, sleeps):
+        origin = Origin(503, 200)
+        client = build_http_client(
+            HttpClientMetrics(),
+            transport_factory=lambda: httpx.MockTransport(origin),
+            retry=RetryPolicy(),
+        )
+        async with client:
+            assert (await client.get(URL)).status_code == 200
+        assert len(origin.requests) == 2
+
+    async def test_quotas_from_settings(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "scraper_rate_limits", {"api.adzuna.com": 0.5})
+        monkeypatch.setattr(settings, "scraper_retry_attempts", 5)
+        assert rate_limit.get_rate_limiter().bucket("api.adzuna.com") is not None
+        assert rate_limit.get_retry_policy().max_retries == 5
+
+    async def test_redis_backend_from_settings(self, monkeypatch):
+        settings = get_settings()
+        monkeypatch.setattr(settings, "scraper_rate_limit_backend", "redis")
+        monkeypatch.setattr(settings, "scraper_rate_limits", {"api.adzuna.com": 0.5})
+        limiter = rate_limit.get_rate_limiter()
+        assert isinstance(limiter.bucket("api.adzuna.com"), RedisTokenBucket)
+        await limiter.aclose()
+
+    async def test_stats_include_rate_limit(self):
+        get_http_client()
+        assert "retries" in http_client_stats()["rate_limit"]
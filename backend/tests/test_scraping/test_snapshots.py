@@ -0,0 +1,143 @@
+"""Tests for per-run feed snapshots."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from app.services.scraping.api.greenhouse import GreenhouseScraper
+from app.services.scraping.api.remoteok import RemoteOKScraper
+from app.services.scraping.api.weworkremotely import WeWorkRemotelyScraper
+from app.services.scraping.snapshots import FeedSnapshots
+
+
+class TestFeedSnapshots:
+    """Fetch-once semantics of FeedSnapshots."""
+
+    async def test_fetches_once_per_key(self):
+        snapshots = FeedSnapshots()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return [calls]
+
+        assert await snapshots.get("a", fetch) == [1]
+        assert await snapshots.get("a", fetch) == [1]
+        assert await snapshots.get("b", fetch) == [2]
+        assert snapshots.stats() == {"feeds": 2, "hits": 1, "misses": 2}
+
+    async def test_concurrent_callers_share_download(self):
+        snapshots = FeedSnapshots()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "feed"
+
+        results = await asyncio.gather(*[snapshots.get("a", fetch) for _ in range(5)])
+        assert results == ["feed"] * 5
+        assert calls == 1
+
+    async def test_failures_are_not_cached(self):
+        snapshots = FeedSnapshots()
+        attempts = 0
+
+        async def fetch():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                msg = "boom"
+                raise RuntimeError(msg)
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await snapshots.get("a", fetch)
+        assert await snapshots.get("a", fetch) == "ok"
+        assert attempts == 2
+
+    async def test_caller_timeout_does_not_cancel_shared_fetch(self):
+        snapshots = FeedSnapshots()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "feed"
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await snapshots.get("a", fetch)
+        assert await snapshots.get("a", fetch) == "feed"
+
+    async def test_clear_drops_entries(self):
+        snapshots = FeedSnapshots()
+
+        async def fetch():
+            return 1
+
+        await snapshots.get("a", fetch)
+        snapshots.clear()
+        assert len(snapshots) == 0
+
+
+class TestScrapersWithSnapshots:
+    """Board/feed scrapers download each feed once across queries."""
+
+    async def test_greenhouse_board_fetched_once(
+        self, httpx_mock: HTTPXMock, greenhouse_response
+    ):
+        httpx_mock.add_response(json=greenhouse_response)
+        scraper = GreenhouseScraper(board_tokens=["testcompany"], snapshots=FeedSnapshots())
+
+        first = await scraper.scrape("python")
+        second = await scraper.scrape("golang")
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert [j.external_id for j in first.jobs] == [j.external_id for j in second.jobs]
+        assert second.total_found == 2
+
+    async def test_remoteok_filters_each_query_against_snapshot(
+        self, httpx_mock: HTTPXMock, remoteok_response
+    ):
+        httpx_mock.add_response(json=remoteok_response)
+        scraper = RemoteOKScraper(snapshots=FeedSnapshots())
+
+        python_jobs = await scraper.scrape("python")
+        data_jobs = await scraper.scrape("data engineer")
+        unmatched = await scraper.scrape("kubernetes")
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert python_jobs.jobs
+        assert any("Data Engineer" in j.title for j in data_jobs.jobs)
+        assert unmatched.jobs == []
+        assert unmatched.total_found == python_jobs.total_found
+
+    async def test_snapshots_shared_between_scrapers(
+        self, httpx_mock: HTTPXMock, weworkremotely_feed
+    ):
+        httpx_mock.add_response(text=weworkremotely_feed)
+        snapshots = FeedSnapshots()
+        first = WeWorkRemotelyScraper(categories=["programming"], snapshots=snapshots)
+        second = WeWorkRemotelyScraper(categories=["programming"], snapshots=snapshots)
+
+        await first.scrape("software engineer")
+        result = await second.scrape("data engineer")
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert any("Data Engineer" in j.title for j in result.jobs)
+
+    async def test_failed_board_retried_on_next_query(
+        self, httpx_mock: HTTPXMock, greenhouse_response
+    ):
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        httpx_mock.add_response(json=greenhouse_response)
+        scraper = GreenhouseScraper(board_tokens=["testcompany"], snapshots=FeedSnapshots())
+
+        failed = await scraper.scrape("python")
+        retried = await scraper.scrape("python")
+
+        assert failed.errors == ["Request failed: testcompany"]
+        assert len(retried.jobs) == 2
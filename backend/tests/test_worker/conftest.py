@@ -0,0 +1,27 @@
+"""Shared fixtures for worker task tests."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """On-disk SQLite session factory that backs the tasks' get_db_session_ctx."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'worker.db'}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _wal(dbapi_conn, record):
+        # Let streaming readers and chunk writers use separate connections
+        dbapi_conn.execute("PRAGMA journal_mode=WAL")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    with patch("app.worker.tasks.get_db_session_ctx", side_effect=lambda: factory.begin()):
+        yield factory
+    await engine.dispose()
@@ -2,34 +2,55 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.worker.tasks import run_agent, run_matching, run_scraping
+import pytest
+from sqlalchemy import inspect, select
+
+from app.config import get_settings
+from app.models.job import Job
+from app.models.match import MatchResult
+from app.models.user import User
+from app.services.matching.ats_scorer import compute_ats_score
+from app.services.matching.pipeline import MatchingPipeline
+from app.worker import tasks
+from app.worker.tasks import rescore_ats, run_agent, run_matching, run_scraping
 
 
 class TestTaskDefinitions:
     """Tests for ARQ task function signatures and basic behavior."""
 
     async def test_run_scraping_returns_results(self):
-        """run_scraping with mocked scrapers should return stats."""
+        """run_scraping upserts each streamed batch as it arrives and returns stats."""
+        from app.db.bulk import UpsertResult
         from app.services.scraping.orchestrator import OrchestrationResult
 
-        mock_orch_instance = MagicMock()
-        mock_orch_instance.run = AsyncMock(
-            return_value=OrchestrationResult(total=3, new=3, duplicates=0)
-        )
+        batches = [[MagicMock(), MagicMock()], [MagicMock()]]
+        upserted: list[int] = []
+
+        async def _stream(query, stats: OrchestrationResult, **kwargs):
+            for batch in batches:
+                stats.total += len(batch)
+                stats.new += len(batch)
+                yield batch
+                # The previous batch is persisted before the next one is pulled
+                assert upserted[-1] == len(batch)
 
+        async def _upsert(db, batch, update_existing=False):
+            upserted.append(len(batch))
+            return UpsertResult(inserted=len(batch))
+
+        mock_orch_instance = MagicMock()
+        mock_orch_instance.stream = _stream
         mock_orch_cls = MagicMock(return_value=mock_orch_instance)
 
         with (
-            patch("app.worker.tasks.JSearchScraper", MagicMock()),
             patch("app.worker.tasks.ScrapingOrchestrator", mock_orch_cls),
-            patch("app.worker.tasks.JobDeduplicator", MagicMock()),
+            patch("app.worker.tasks.JobEmbedder") as mock_embedder_cls,
+            patch("app.worker.tasks.get_embeddings"),
             patch("app.worker.tasks._build_scrapers", return_value=[MagicMock()]),
+            patch("app.worker.tasks.upsert_jobs", side_effect=_upsert),
             patch("app.worker.tasks.get_db_session_ctx") as mock_db_ctx,
         ):
-            # Mock DB context manager
-            mock_session = AsyncMock()
-            mock_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None)))
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
             mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=False)
 
             result = await run_scraping(
@@ -38,8 +59,12 @@ class TestTaskDefinitions:
                 location="Remote",
             )
 
-        assert isinstance(result, dict)
-        assert "Software Engineer" in result
+        assert upserted == [2, 1]
+        assert mock_orch_cls.call_args.kwargs["embedder"] is mock_embedder_cls.return_value
+        assert result["Software Engineer"]["total"] == 3
+        assert result["persisted"] == {"inserted": 3, "updated": 0, "skipped": 0}
+        assert "connections_reused" in result["http"]
+        assert result["feeds"] == {"feeds": 0, "hits": 0, "misses": 0}
 
     async def test_run_matching_returns_status(self):
         """run_matching should return status after matching."""
@@ -62,6 +87,112 @@ class TestTaskDefinitions:
         assert result["status"] == "complete"
         assert result["matches"] == 0
 
+    async def test_stream_unscored_jobs_skips_scored(self, session_factory):
+        """Unscored jobs stream in chunks via the anti-join, without raw_data."""
+        async with session_factory() as session:
+            user = User(email="s@example.com", full_name="S")
+            jobs = [
+                Job(external_id=f"j{i}", source="t", title=f"Job {i}", company="C",
+                    description="d", raw_data={"big": "x" * 100})
+                for i in range(5)
+            ]
+            session.add_all([user, *jobs])
+            await session.flush()
+            session.add(MatchResult(
+                user_id=user.id, job_id=jobs[1].id, overall_score=5.0, score_breakdown={},
+                reasoning="r", strengths=[], missing_skills=[],
+            ))
+            await session.commit()
+
+        loaded: list[Job] = []
+        real_to_posting = tasks._job_model_to_posting
+
+        def _spy(job):
+            loaded.append(job)
+            return real_to_posting(job)
+
+        with patch("app.worker.tasks._job_model_to_posting", side_effect=_spy):
+            chunks = [c async for c in tasks._stream_unscored_jobs(user.id, chunk_size=2)]
+
+        assert [[p.external_id for p in c] for c in chunks] == [["j0", "j2"], ["j3", "j4"]]
+        assert all(p.db_id is not None for c in chunks for p in c)
+        assert all("raw_data" in inspect(j).unloaded for j in loaded)
+
+    async def test_stream_unscored_jobs_closed_when_indexing_fails(self, session_factory):
+        """A failing index step closes the stream, returning its pooled connection."""
+        async with session_factory() as session:
+            user = User(email="s@example.com", full_name="S", resume_text="r")
+            session.add_all([
+                user,
+                *[Job(external_id=f"j{i}", source="t", title=f"Job {i}", company="C",
+                      description="d") for i in range(4)],
+            ])
+            await session.commit()
+
+        embedder = MagicMock()
+        embedder.index_jobs.side_effect = RuntimeError("embedding failed")
+        pipeline = MatchingPipeline(embedder=embedder, scorer=MagicMock(model_name="test"))
+        stream = tasks._stream_unscored_jobs(user.id, chunk_size=2)
+
+        with pytest.raises(RuntimeError, match="embedding failed"):
+            await pipeline.match("Resume", jobs=stream)
+
+        assert stream.ag_frame is None  # generator finished, session context exited
+        assert session_factory.kw["bind"].pool.checkedout() == 0
+
+    async def test_load_postings_by_key(self, session_factory):
+        """Retrieved survivors are loaded back as full postings with their jobs.id."""
+        async with session_factory() as session:
+            session.add_all([
+                Job(external_id=f"j{i}", source="t", title=f"Job {i}", company="C",
+                    description=f"desc {i}")
+                for i in range(3)
+            ])
+            await session.commit()
+
+        postings = await tasks._load_postings([("j2", "t"), ("j0", "t"), ("j0", "other")])
+
+        assert sorted(p.external_id for p in postings) == ["j0", "j2"]
+        assert all(p.db_id is not None and p.description for p in postings)
+
+    async def test_rescore_ats_updates_matches(self, session_factory, monkeypatch):
+        """rescore_ats writes ATS and integrated scores for every match of the user."""
+        resume = "Python, Docker and leadership"
+        async with session_factory() as session:
+            user = User(email="a@example.com", full_name="A", resume_text=resume)
+            jobs = [
+                Job(external_id=f"j{i}", source="t", title="T", company="C",
+                    description=desc)
+                for i, desc in enumerate(["Python and Docker", "React", "Leadership and Go"])
+            ]
+            session.add_all([user, *jobs])
+            await session.flush()
+            session.add_all([
+                MatchResult(user_id=user.id, job_id=j.id, overall_score=7.0, score_breakdown={},
+                            reasoning="r", strengths=[], missing_skills=[])
+                for j in jobs
+            ])
+            await session.commit()
+
+        settings = get_settings()
+        monkeypatch.setattr(settings, "ats_backfill_workers", 2)
+        monkeypatch.setattr(settings, "ats_backfill_chunk_size", 2)
+        result = await rescore_ats(ctx={}, user_id=user.id)
+
+        assert result == {"status": "complete", "rescored": 3}
+        async with session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(MatchResult, Job.description).join(Job).order_by(MatchResult.id)
+                )
+            ).all()
+
+        for match, description in rows:
+            expected = compute_ats_score(resume, description)
+            assert match.ats_score == expected.score
+            assert match.ats_details == expected.model_dump()
+            assert match.integrated_score is not None
+
     async def test_run_agent_returns_status(self):
         """run_agent should return status after agent run."""
         mock_job = MagicMock()
@@ -109,29 +240,38 @@ class TestTaskDefinitions:
         assert result["status"] == "submitted"
         assert result["job_id"] == 42
 
+    async def test_shutdown_closes_shared_caches(self):
+        """The worker shutdown hook closes the process-wide score and vector caches."""
+        with (
+            patch("app.worker.tasks.close_http_client", AsyncMock()),
+            patch("app.worker.tasks.dispose_engine", AsyncMock()) as dispose,
+            patch("app.worker.tasks.close_score_cache") as close_scores,
+            patch("app.worker.tasks.close_embedding_caches") as close_embeddings,
+        ):
+            await tasks.shutdown({})
+
+        close_scores.assert_called_once_with()
+        close_embeddings.assert_called_once_with()
+        dispose.assert_awaited_once()
+
     async def test_run_scraping_multiple_queries(self):
         """Multiple queries should each produce a result entry."""
-        from app.services.scraping.orchestrator import OrchestrationResult
 
-        mock_orch_instance = MagicMock()
-        mock_orch_instance.run = AsyncMock(
-            return_value=OrchestrationResult(total=2, new=2, duplicates=0)
-        )
+        async def _stream(query, stats, **kwargs):
+            stats.total = stats.new = 2
+            return
+            yield
 
+        mock_orch_instance = MagicMock()
+        mock_orch_instance.stream = _stream
         mock_orch_cls = MagicMock(return_value=mock_orch_instance)
 
         with (
-            patch("app.worker.tasks.JSearchScraper", MagicMock()),
             patch("app.worker.tasks.ScrapingOrchestrator", mock_orch_cls),
-            patch("app.worker.tasks.JobDeduplicator", MagicMock()),
+            patch("app.worker.tasks.JobEmbedder"),
+            patch("app.worker.tasks.get_embeddings"),
             patch("app.worker.tasks._build_scrapers", return_value=[MagicMock()]),
-            patch("app.worker.tasks.get_db_session_ctx") as mock_db_ctx,
         ):
-            mock_session = AsyncMock()
-            mock_session.execute = AsyncMock(return_value=MagicMock(scalar_one_or_none=MagicMock(return_value=None)))
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=False)
-
             result = await run_scraping(
                 ctx={},
                 queries=["Python Dev", "ML Engineer"],
@@ -5,6 +5,8 @@ export interface PaginatedResponse<T> {
   total: number;
   limit: number;
   offset: number;
+  next_cursor?: string | null;
+  total_estimated?: boolean;
 }
 
 export interface JobResponse {